@@ -0,0 +1,188 @@
+"""In-process GitHub REST API stand-in for benchmarks.
+
+``FakeGitHub`` is an httpx transport, so it plugs straight into
+``GitHubClient(transport=...)`` without sockets. It serves deterministic
+users, repositories and releases with configurable latency, pagination,
+ETags and rate-limit headers.
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+
+class FakeGitHub(httpx.BaseTransport):
+    """Fake GitHub API serving generated owners and repositories."""
+
+    def __init__(
+        self,
+        owners: int = 10,
+        repos_per_owner: int = 100,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: int = 5000,
+        seed: int = 0,
+    ):
+        """Initialize fake API.
+
+        Args:
+            owners: Number of generated owners
+            repos_per_owner: Repositories per owner
+            latency: Base response latency in seconds
+            jitter: Extra random latency in seconds (uniform 0..jitter)
+            rate_limit: Requests allowed before 403 responses
+            seed: Random seed for generated data and jitter
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.remaining = rate_limit
+        self.requests = 0
+        self.not_modified = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self.users: dict[str, dict] = {}
+        self.repos: dict[str, dict] = {}
+        for o in range(owners):
+            login = f"owner{o}"
+            self.users[login] = self._make_user(login, repos_per_owner)
+            for r in range(repos_per_owner):
+                repo = self._make_repo(login, f"repo{r}", r)
+                self.repos[repo["full_name"]] = repo
+
+    @staticmethod
+    def _make_user(login: str, public_repos: int) -> dict:
+        return {
+            "login": login,
+            "name": login.title(),
+            "public_repos": public_repos,
+            "public_gists": 0,
+            "followers": 10,
+            "following": 1,
+            "created_at": "2020-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "avatar_url": f"https://avatars.example/{login}",
+            "html_url": f"https://github.com/{login}",
+        }
+
+    def _make_repo(self, owner: str, name: str, index: int) -> dict:
+        day = 28 - index % 28
+        return {
+            "name": name,
+            "full_name": f"{owner}/{name}",
+            "description": f"Generated repository {name}",
+            "stargazers_count": self._random.randint(0, 5000),
+            "forks_count": self._random.randint(0, 500),
+            "watchers_count": self._random.randint(0, 100),
+            "open_issues_count": self._random.randint(0, 50),
+            "language": self._random.choice(["Python", "Go", "Rust", None]),
+            "created_at": "2020-01-01T00:00:00Z",
+            "updated_at": f"2024-02-{day:02d}T00:00:00Z",
+            "pushed_at": f"2024-02-{day:02d}T00:00:00Z",
+            "size": self._random.randint(10, 100_000),
+            "default_branch": "main",
+            "topics": ["benchmark"],
+            "html_url": f"https://github.com/{owner}/{name}",
+        }
+
+    def _route(self, request: httpx.Request) -> tuple[int, object, dict]:
+        """Resolve request to (status, body, extra headers)."""
+        parts = request.url.path.strip("/").split("/")
+
+        if parts[0] == "repos" and len(parts) >= 3:
+            full_name = f"{parts[1]}/{parts[2]}"
+            repo = self.repos.get(full_name)
+            if repo is None:
+                return 404, {"message": "Not Found"}, {}
+            if len(parts) == 3:
+                return 200, repo, {}
+            if parts[3:] == ["releases", "latest"]:
+                return 200, self._release(full_name), {}
+            if parts[3:] == ["releases"]:
+                return 200, [self._release(full_name)], {}
+
+        if parts[0] == "users" and len(parts) >= 2 and parts[1] in self.users:
+            if len(parts) == 2:
+                return 200, self.users[parts[1]], {}
+            if parts[2:] == ["repos"]:
+                return self._repos_page(request, parts[1])
+
+        return 404, {"message": "Not Found"}, {}
+
+    @staticmethod
+    def _release(full_name: str) -> dict:
+        return {
+            "tag_name": "v1.0.0",
+            "name": "v1.0.0",
+            "published_at": "2024-01-01T00:00:00Z",
+            "html_url": f"https://github.com/{full_name}/releases/tag/v1.0.0",
+        }
+
+    def _repos_page(self, request: httpx.Request, owner: str) -> tuple[int, object, dict]:
+        """Serve one page of an owner's repos, newest first, with Link headers."""
+        per_page = min(int(request.url.params.get("per_page", 30)), 100)
+        page = int(request.url.params.get("page", 1))
+        prefix = f"{owner}/"
+        repos = sorted(
+            (r for name, r in self.repos.items() if name.startswith(prefix)),
+            key=lambda r: r["updated_at"],
+            reverse=True,
+        )
+        last = max(1, -(-len(repos) // per_page))
+        items = repos[(page - 1) * per_page : page * per_page]
+
+        links = []
+        base = f"https://api.github.com/users/{owner}/repos?per_page={per_page}"
+        if page < last:
+            links.append(f'<{base}&page={page + 1}>; rel="next"')
+            links.append(f'<{base}&page={last}>; rel="last"')
+        headers = {"Link": ", ".join(links)} if links else {}
+        return 200, items, headers
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        status, body, headers = self._route(request)
+        content = json.dumps(body).encode()
+        etag = '"' + hashlib.sha1(content).hexdigest() + '"'
+
+        with self._lock:
+            self.requests += 1
+            not_modified = status == 200 and request.headers.get("If-None-Match") == etag
+            if not_modified:
+                self.not_modified += 1
+            elif self.remaining <= 0:
+                status, content = 403, b'{"message": "API rate limit exceeded"}'
+            else:
+                self.remaining -= 1
+            remaining = self.remaining
+
+        headers.update(
+            {
+                "Content-Type": "application/json",
+                "ETag": etag,
+                "X-RateLimit-Limit": str(self.rate_limit),
+                "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            }
+        )
+        if not_modified:
+            return httpx.Response(304, headers=headers, request=request)
+        return httpx.Response(status, headers=headers, content=content, request=request)
+
+    def reset_counters(self, rate_limit: Optional[int] = None) -> None:
+        """Reset request counters and rate limit budget."""
+        with self._lock:
+            if rate_limit is not None:
+                self.rate_limit = rate_limit
+            self.remaining = self.rate_limit
+            self.requests = 0
+            self.not_modified = 0
@@ -0,0 +1,252 @@
+"""Benchmark suite for gitpulse.
+
+Runs against the in-process ``FakeGitHub`` API, stores results under
+``benchmarks/results/<version>.json`` (``<version>-quick.json`` for
+``--quick``) and compares them with the previous
+stored run so regressions show up across versions.
+
+Usage:
+    python benchmarks/run.py
+    python benchmarks/run.py --quick --latency 0.01
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT.parent / "src"))
+sys.path.insert(0, str(ROOT))
+
+from fake_github import FakeGitHub  # noqa: E402
+
+from gitpulse import __version__  # noqa: E402
+from gitpulse.cache import CacheManager  # noqa: E402
+from gitpulse.cache_sqlite import SQLiteCacheBackend  # noqa: E402
+from gitpulse.cassette import CassetteReader, CassetteWriter  # noqa: E402
+from gitpulse.github_api import GitHubClient  # noqa: E402
+from gitpulse.models import WarmManifest  # noqa: E402
+from gitpulse.warm import warm_cache  # noqa: E402
+
+RESULTS_DIR = ROOT / "results"
+
+# Relative change that counts as a regression
+REGRESSION_THRESHOLD = 0.10
+
+
+def _client(fake: FakeGitHub, cache_dir: Path) -> GitHubClient:
+    return GitHubClient(token="bench", cache=CacheManager(cache_dir), transport=fake)
+
+
+def _time_per_op(fn: Callable[[], None], ops: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) / ops * 1000
+
+
+def bench_repo_stats(fake: FakeGitHub, repos: list[str]) -> dict:
+    """Cold, warm and revalidated ``get_repo_stats`` latency."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp, _client(fake, Path(tmp)) as client:
+
+        def fetch_all():
+            for repo in repos:
+                client.get_repo_stats(repo)
+
+        results["repo_stats_cold_ms"] = _time_per_op(fetch_all, len(repos))
+        results["repo_stats_warm_ms"] = _time_per_op(fetch_all, len(repos))
+
+        # Expire entries so every lookup revalidates with a 304
+        for repo in repos:
+            entry = client.cache.get_entry(f"repo:{repo}")
+            client.cache.set(f"repo:{repo}", entry.data, ttl_seconds=-1, etag=entry.etag)
+        results["repo_stats_revalidate_ms"] = _time_per_op(fetch_all, len(repos))
+
+    return results
+
+
+def bench_cache_throughput(entries: int) -> dict:
+    """Cache backend set/get throughput."""
+    payload = {"stargazers_count": 1, "description": "x" * 500, "topics": ["a", "b"]}
+    keys = [f"repo:owner/repo{i}" for i in range(entries)]
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        backends = {
+            "cache": CacheManager(Path(tmp) / "files"),
+            "cache_sqlite": SQLiteCacheBackend(Path(tmp) / "cache.sqlite3"),
+        }
+        for name, cache in backends.items():
+            start = time.perf_counter()
+            for key in keys:
+                cache.set(key, payload)
+            results[f"{name}_set_ops"] = entries / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for key in keys:
+                cache.get(key)
+            results[f"{name}_get_ops"] = entries / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            cache.get_many(keys)
+            results[f"{name}_get_many_ops"] = entries / (time.perf_counter() - start)
+
+    return results
+
+
+def bench_concurrency(fake: FakeGitHub, repos: list[str], levels: list[int]) -> dict:
+    """Wall time of a batch warm-up at increasing concurrency."""
+    results = {}
+    manifest = WarmManifest(repos=repos, releases=False)
+    for level in levels:
+        with tempfile.TemporaryDirectory() as tmp, _client(fake, Path(tmp)) as client:
+            start = time.perf_counter()
+            warm_cache(client, manifest, concurrency=level)
+            results[f"batch_c{level}_s"] = time.perf_counter() - start
+    return results
+
+
+def bench_cassette_replay(calls: int) -> dict:
+    """Cassette index load time and per-request replay lookup cost."""
+    requests = [
+        httpx.Request("GET", f"https://api.github.com/repos/owner/repo{i}") for i in range(calls)
+    ]
+    response = httpx.Response(200, json={"stargazers_count": 1, "description": "x" * 500})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.cassette"
+        writer = CassetteWriter(path)
+        for request in requests:
+            writer.add(request, response, 0.01)
+        writer.close()
+
+        start = time.perf_counter()
+        reader = CassetteReader(path)
+        load_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for request in requests:
+            reader.lookup(request)
+        lookup_elapsed = time.perf_counter() - start
+        reader.close()
+
+    return {
+        "cassette_load_s": load_elapsed,
+        "cassette_lookup_us": lookup_elapsed / calls * 1_000_000,
+    }
+
+
+def bench_cli_startup(runs: int) -> dict:
+    """Median wall time of ``gitpulse --help`` in a fresh interpreter."""
+    env_path = str(ROOT.parent / "src")
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "gitpulse.cli", "--help"],
+            check=True,
+            capture_output=True,
+            env={"PYTHONPATH": env_path, "PATH": ""},
+        )
+        samples.append(time.perf_counter() - start)
+    return {"cli_startup_s": statistics.median(samples)}
+
+
+def lower_is_better(metric: str) -> bool:
+    """Throughput metrics end in '_ops'; everything else is a duration."""
+    return not metric.endswith("_ops")
+
+
+def compare(current: dict, previous: dict) -> list[str]:
+    """Describe metrics that regressed against a previous run."""
+    regressions = []
+    for metric, value in current["results"].items():
+        old = previous["results"].get(metric)
+        if not old:
+            continue
+        change = (value - old) / old
+        if not lower_is_better(metric):
+            change = -change
+        if change > REGRESSION_THRESHOLD:
+            regressions.append(f"{metric}: {old:.4g} -> {value:.4g} ({change:+.0%} worse)")
+    return regressions
+
+
+def _previous_result(current: dict, current_path: Path) -> dict | None:
+    """Most recent stored result of another version with the same workload."""
+    candidates = sorted(
+        (p for p in RESULTS_DIR.glob("*.json") if p != current_path),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    for path in candidates:
+        stored = json.loads(path.read_text(encoding="utf-8"))
+        if stored["quick"] == current["quick"] and stored["latency"] == current["latency"]:
+            return stored
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Smaller workloads")
+    parser.add_argument("--latency", type=float, default=0.005, help="Fake API latency (s)")
+    parser.add_argument("--no-save", action="store_true", help="Don't store results")
+    args = parser.parse_args()
+
+    repo_count = 50 if args.quick else 200
+    cache_entries = 500 if args.quick else 5000
+    startup_runs = 3 if args.quick else 10
+    cassette_calls = 20_000 if args.quick else 200_000
+
+    fake = FakeGitHub(owners=4, repos_per_owner=repo_count // 4, latency=args.latency)
+    repos = list(fake.repos)
+
+    results = {}
+    results.update(bench_repo_stats(fake, repos))
+    results.update(bench_cache_throughput(cache_entries))
+    results.update(bench_concurrency(fake, repos, [1, 4, 16]))
+    results.update(bench_cassette_replay(cassette_calls))
+    results.update(bench_cli_startup(startup_runs))
+
+    current = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "latency": args.latency,
+        "quick": args.quick,
+        "results": results,
+    }
+
+    width = max(len(name) for name in results)
+    for name, value in results.items():
+        print(f"{name:<{width}}  {value:12.4f}")
+
+    suffix = "-quick" if args.quick else ""
+    current_path = RESULTS_DIR / f"{__version__}{suffix}.json"
+    previous = _previous_result(current, current_path)
+    if previous:
+        regressions = compare(current, previous)
+        print(f"\nCompared with {previous['version']} ({previous['timestamp']}):")
+        for line in regressions or ["no regressions"]:
+            print(f"  {line}")
+
+    if not args.no_save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        current_path.write_text(json.dumps(current, indent=2), encoding="utf-8")
+        print(f"\nResults written to {current_path.relative_to(ROOT.parent)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
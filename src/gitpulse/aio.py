@@ -0,0 +1,313 @@
+"""Async GitHub API client for embedding gh-pulse in asyncio services.
+
+``AsyncGitHubClient`` returns the same models as :class:`GitHubClient`
+and shares its cache keys, but never prints anything. One client holds a
+single ``httpx.AsyncClient``, so its connection pool can be kept open for
+the lifetime of a service::
+
+    async with AsyncGitHubClient(token=token) as client:
+        repos = await client.fetch_repos(["owner/a", "owner/b"])
+        async for repo in client.iter_org_repos("my-org"):
+            ...
+
+Cache backends are synchronous, so cache reads and writes run in worker
+threads to keep the event loop responsive.
+"""
+
+import asyncio
+from typing import AsyncIterator, Optional, TypeVar, Union
+
+import httpx
+from pydantic import BaseModel, ValidationError
+
+from .cache import CacheBackend, get_cache, listing_entry
+from .github_api import GitHubAPIError, check_response, load_token
+from .models import CacheEntry, RepoStats, UserStats
+from .resilience import CircuitBreaker, CircuitOpenError, RequestAttempts, RetryPolicy
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class AsyncGitHubClient:
+    """Async GitHub REST API client."""
+
+    BASE_URL = "https://api.github.com"
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        use_cache: bool = True,
+        cache: Optional[CacheBackend] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        concurrency: int = 10,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        timeout: float = 30.0,
+    ):
+        """Initialize async GitHub client.
+
+        Args:
+            token: GitHub personal access token (default: GITHUB_TOKEN or
+                the token saved by 'gitpulse auth')
+            use_cache: Whether to use cache (default: True)
+            cache: Cache to use instead of the global one
+            transport: Custom httpx transport (e.g. for tests)
+            concurrency: Maximum requests in flight, which also sizes the
+                connection pool
+            retry: Retry policy for idempotent requests (default: 3 attempts)
+            circuit_breaker: Circuit breaker shared by all requests
+                (default: open after 5 consecutive failures for 30s)
+            timeout: Request timeout in seconds
+        """
+        self.token = token or load_token()
+        self.use_cache = use_cache
+        if cache is None and use_cache:
+            cache = get_cache()  # Only created when used, as it makes a directory
+        self.cache = cache
+        self.retry = retry or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+        headers = {
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "gitpulse-cli",
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        self.client = httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            transport=transport,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        )
+
+    async def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send request with retries and translate HTTP failures into GitHubAPIError.
+
+        Idempotent requests are retried like :class:`GitHubClient` does. Only
+        the requests themselves hold a concurrency slot, not the backoff.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (without base URL)
+            **kwargs: Additional arguments for httpx
+
+        Returns:
+            HTTP response (``304 Not Modified`` is returned as-is)
+
+        Raises:
+            GitHubAPIError: If request fails
+        """
+        url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+        attempts = RequestAttempts(method, self.retry, self.circuit_breaker)
+
+        for attempt in attempts:
+            try:
+                with attempts.guard():
+                    async with self._semaphore:
+                        response = await self.client.request(method, url, **kwargs)
+                    attempts.record(response)
+            except CircuitOpenError as e:
+                raise GitHubAPIError(str(e)) from e
+            except httpx.RequestError as e:
+                delay = attempts.backoff(attempt)
+                if delay is None:
+                    raise GitHubAPIError(f"Request failed: {str(e)}") from e
+                await asyncio.sleep(delay)
+                continue
+
+            delay = attempts.retry_delay(attempt, response)
+            if delay is not None:
+                await response.aclose()
+                await asyncio.sleep(delay)
+                continue
+
+            return check_response(response)
+
+    async def _resolve(
+        self, cache_key: str, endpoint: str, entry: Optional[CacheEntry]
+    ) -> Union[dict, list]:
+        """Serve a fresh entry, or fetch the endpoint and cache the result.
+
+        An expired entry with an ETag is revalidated with a conditional
+        request instead of being refetched.
+        """
+        if not self.use_cache:
+            return (await self._send("GET", endpoint)).json()
+
+        if entry and not entry.is_expired():
+            return entry.data
+
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else {}
+        response = await self._send("GET", endpoint, headers=headers)
+        if response.status_code == 304 and not headers:
+            # Not modified, but nothing to reuse: fetch again
+            response = await self._send("GET", endpoint)
+            if response.status_code == 304:
+                raise GitHubAPIError(f"Unexpected 304 Not Modified for {endpoint}")
+        data = entry.data if response.status_code == 304 else response.json()
+        await asyncio.to_thread(self.cache.set, cache_key, data, etag=response.headers.get("ETag"))
+        return data
+
+    async def _cached_get(
+        self, cache_key: str, endpoint: str, no_cache: bool = False
+    ) -> Union[dict, list]:
+        """GET an endpoint through the cache."""
+        entry = None
+        if self.use_cache and not no_cache:
+            entry = await asyncio.to_thread(self.cache.get_entry, cache_key)
+        return await self._resolve(cache_key, endpoint, entry)
+
+    async def _fetch_many(
+        self, model: type[ModelT], keys: dict[str, tuple[str, str]], no_cache: bool
+    ) -> dict[str, Union[ModelT, GitHubAPIError]]:
+        """Fetch several endpoints concurrently with a single cache lookup.
+
+        Args:
+            model: Model to parse responses into
+            keys: (cache key, endpoint) by name
+            no_cache: Force refresh from API
+
+        Returns:
+            Model or error by name
+        """
+        entries: dict[str, CacheEntry] = {}
+        if self.use_cache and not no_cache:
+            entries = await asyncio.to_thread(
+                self.cache.get_many, [cache_key for cache_key, _ in keys.values()]
+            )
+
+        async def fetch(cache_key: str, endpoint: str) -> Union[ModelT, GitHubAPIError]:
+            try:
+                data = await self._resolve(cache_key, endpoint, entries.get(cache_key))
+                return model(**data)
+            except GitHubAPIError as e:
+                return e
+            except ValidationError as e:
+                error = GitHubAPIError(f"Unexpected response from {endpoint}: {e}")
+                error.__cause__ = e
+                return error
+
+        results = await asyncio.gather(*(fetch(*key) for key in keys.values()))
+        return dict(zip(keys, results))
+
+    async def get_repo(self, repo: str, no_cache: bool = False) -> RepoStats:
+        """Get repository statistics.
+
+        Args:
+            repo: Repository in format 'owner/name'
+            no_cache: Force refresh from API
+
+        Returns:
+            Repository statistics
+
+        Raises:
+            GitHubAPIError: If request fails
+        """
+        data = await self._cached_get(f"repo:{repo}", f"/repos/{repo}", no_cache=no_cache)
+        return RepoStats(**data)
+
+    async def get_user(self, username: str, no_cache: bool = False) -> UserStats:
+        """Get user statistics.
+
+        Args:
+            username: GitHub username
+            no_cache: Force refresh from API
+
+        Returns:
+            User statistics
+
+        Raises:
+            GitHubAPIError: If request fails
+        """
+        data = await self._cached_get(f"user:{username}", f"/users/{username}", no_cache=no_cache)
+        return UserStats(**data)
+
+    async def fetch_repos(
+        self, repos: list[str], no_cache: bool = False
+    ) -> dict[str, Union[RepoStats, GitHubAPIError]]:
+        """Fetch many repositories concurrently.
+
+        A failing repository does not fail the batch: its error (also for an
+        unexpected response) is returned in place of its statistics.
+
+        Args:
+            repos: Repositories in format 'owner/name'
+            no_cache: Force refresh from API
+
+        Returns:
+            Statistics or error by repository, in input order (duplicates removed)
+        """
+        keys = {repo: (f"repo:{repo}", f"/repos/{repo}") for repo in repos}
+        return await self._fetch_many(RepoStats, keys, no_cache)
+
+    async def fetch_users(
+        self, usernames: list[str], no_cache: bool = False
+    ) -> dict[str, Union[UserStats, GitHubAPIError]]:
+        """Fetch many user profiles concurrently.
+
+        Args:
+            usernames: GitHub usernames
+            no_cache: Force refresh from API
+
+        Returns:
+            Statistics or error by username, in input order (duplicates removed)
+        """
+        keys = {name: (f"user:{name}", f"/users/{name}") for name in usernames}
+        return await self._fetch_many(UserStats, keys, no_cache)
+
+    def _cache_listing(self, page: list[dict]) -> None:
+        """Cache a listing page, keeping ETags of unchanged repositories."""
+        keys = {f"repo:{data['full_name']}": data for data in page}
+        existing = self.cache.get_many(keys)
+        self.cache.set_many(
+            {key: listing_entry(existing.get(key), data) for key, data in keys.items()}
+        )
+
+    async def iter_org_repos(
+        self, owner: str, sort: str = "full_name", per_page: int = 100
+    ) -> AsyncIterator[RepoStats]:
+        """Iterate over all public repositories of an organization or user.
+
+        Pages are fetched lazily by following the ``rel="next"`` link, so
+        breaking out of the loop skips the remaining pages. Every listed
+        repository is cached, so later :meth:`get_repo` calls are free.
+
+        Args:
+            owner: GitHub organization or username
+            sort: Sort field (updated, pushed, created, full_name)
+            per_page: Repositories per page (max 100)
+
+        Yields:
+            Repository statistics
+
+        Raises:
+            GitHubAPIError: If request fails
+        """
+        endpoint: Optional[str] = f"/users/{owner}/repos"
+        params: Optional[dict] = {"per_page": per_page, "sort": sort}
+
+        while endpoint:
+            response = await self._send("GET", endpoint, params=params)
+            page = response.json()
+            if self.use_cache and page:
+                await asyncio.to_thread(self._cache_listing, page)
+            for data in page:
+                yield RepoStats(**data)
+
+            next_link = response.links.get("next")
+            endpoint = next_link["url"].removeprefix(self.BASE_URL) if next_link else None
+            params = None  # Already encoded in the next link
+
+    async def aclose(self) -> None:
+        """Close HTTP client and its connection pool."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Async context manager exit."""
+        await self.aclose()
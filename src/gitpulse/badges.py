@@ -1,8 +1,9 @@
 """Badge generation for GitHub repositories."""
 
+from datetime import datetime
 from typing import Optional
 
-from .models import RepoStats, Release
+from .models import RepoActivity, RepoStats, Release
 
 
 class BadgeGenerator:
@@ -78,17 +79,34 @@ class BadgeGenerator:
         return f"![Downloads]({url})"
 
     @staticmethod
-    def last_commit(repo: str) -> str:
+    def last_commit(repo: str, committed_at: Optional[datetime] = None) -> str:
         """Generate last commit badge."""
-        url = f"{BadgeGenerator.SHIELDS_IO}/github/last-commit/{repo}?style=flat-square"
+        if committed_at:
+            day = committed_at.strftime("%Y--%m--%d")  # Shields escapes dashes by doubling
+            url = f"{BadgeGenerator.SHIELDS_IO}/badge/last_commit-{day}-blue?style=flat-square"
+        else:
+            url = f"{BadgeGenerator.SHIELDS_IO}/github/last-commit/{repo}?style=flat-square"
         return f"![Last Commit]({url})"
 
+    @staticmethod
+    def commit_activity(repo: str, per_month: Optional[int] = None) -> str:
+        """Generate commit activity badge (commits in the last 4 weeks)."""
+        if per_month is not None:
+            url = (
+                f"{BadgeGenerator.SHIELDS_IO}/badge/commit_activity-{per_month}%2Fmonth-blue"
+                "?style=flat-square"
+            )
+        else:
+            url = f"{BadgeGenerator.SHIELDS_IO}/github/commit-activity/m/{repo}?style=flat-square"
+        return f"![Commit Activity]({url})"
+
     @classmethod
     def generate_full_set(
         cls,
         repo: str,
         stats: Optional[RepoStats] = None,
         latest_release: Optional[Release] = None,
+        activity: Optional[RepoActivity] = None,
     ) -> str:
         """Generate full badge set for repository.
 
@@ -96,6 +114,7 @@ class BadgeGenerator:
             repo: Repository in format 'owner/name'
             stats: Repository statistics (optional, for static badges)
             latest_release: Latest release info (optional)
+            activity: Commit activity (optional, from the API or a local clone)
 
         Returns:
             Markdown block with all badges
@@ -123,7 +142,11 @@ class BadgeGenerator:
 
         # Additional badges
         badges.append(cls.downloads(repo))
-        badges.append(cls.last_commit(repo))
+        if activity:
+            badges.append(cls.commit_activity(repo, sum(activity.weekly_commits[-4:])))
+            badges.append(cls.last_commit(repo, activity.last_commit_at))
+        else:
+            badges.append(cls.last_commit(repo))
         badges.append(cls.license(repo))
 
         # Format as markdown
@@ -149,6 +172,7 @@ class BadgeGenerator:
             "language": cls.language,
             "downloads": cls.downloads,
             "commit": cls.last_commit,
+            "activity": cls.commit_activity,
         }
 
         badges = []
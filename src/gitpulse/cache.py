@@ -1,19 +1,286 @@
-"""Simple file-based caching system for GitHub API responses."""
+"""Caching system for GitHub API responses.
 
+``CacheBackend`` defines the interface every cache implements. The default
+``CacheManager`` backend is file based: entries live at
+``<cache_dir>/<hh>/<sha256(key)>.json``, where ``hh`` is the first byte of
+the hash in hex. Hashing keeps distinct keys from colliding
+and the 256 shard directories keep each directory small. Writes go to a
+temporary file that is renamed into place, so readers never see a partial
+entry.
+
+Processes sharing a cache directory coordinate fetches through lease files
+next to the entries (``<sha256(key)>.lock``): one process fetches a key
+while the others wait for its result.
+"""
+
+import hashlib
 import json
+import os
+import secrets
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Iterable, Iterator, Optional, Union
 
 from .models import CacheEntry
 
 
-class CacheManager:
+def entry_to_dict(key: str, entry: CacheEntry) -> dict:
+    """Serialize cache entry to a JSON-compatible dict."""
+    cache_data = {
+        "key": key,
+        "data": entry.data,
+        "cached_at": entry.cached_at.isoformat(),
+        "ttl_seconds": entry.ttl_seconds,
+    }
+    if entry.etag:
+        cache_data["etag"] = entry.etag
+    return cache_data
+
+
+def entry_from_dict(cache_data: dict) -> CacheEntry:
+    """Deserialize cache entry.
+
+    Raises:
+        KeyError, ValueError: If the data is not a valid entry
+    """
+    return CacheEntry(
+        data=cache_data["data"],
+        cached_at=datetime.fromisoformat(cache_data["cached_at"]),
+        ttl_seconds=cache_data.get("ttl_seconds", 3600),
+        etag=cache_data.get("etag"),
+    )
+
+
+def listing_entry(
+    existing: Optional[CacheEntry], data: dict, ttl_seconds: Optional[int] = 3600
+) -> CacheEntry:
+    """Build the cache entry for a repository seen in a listing.
+
+    Listings have no per-repository ETag. When the cached data agrees with
+    every listed field the repository is unchanged, so the cached data and
+    its ETag are kept and only their lifetime is renewed. Otherwise the
+    listed data replaces the entry without an ETag.
+
+    Args:
+        existing: Current cache entry, if any
+        data: Repository as listed
+        ttl_seconds: Time-to-live of the new entry
+
+    Returns:
+        Cache entry to store
+    """
+    if (
+        existing is not None
+        and isinstance(existing.data, dict)
+        and all(existing.data.get(field) == value for field, value in data.items())
+    ):
+        return CacheEntry(
+            data=existing.data,
+            cached_at=datetime.now(),
+            ttl_seconds=ttl_seconds,
+            etag=existing.etag,
+        )
+    return CacheEntry(data=data, cached_at=datetime.now(), ttl_seconds=ttl_seconds)
+
+
+class CacheBackend(ABC):
+    """Interface for cache storage backends.
+
+    Backends store ``CacheEntry`` objects by key and may return expired
+    entries from ``get_entry``; freshness is decided by callers. Batch
+    operations and leases have simple defaults that backends can override.
+    """
+
+    @abstractmethod
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get cached entry, including expired ones."""
+
+    @abstractmethod
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """Store cache entry."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove entry if present."""
+
+    @abstractmethod
+    def scan(self, prefix: str = "") -> Iterator[str]:
+        """Iterate over stored keys starting with prefix."""
+
+    def get(self, key: str) -> Optional[Union[dict, list]]:
+        """Get cached data if exists and not expired.
+
+        Expired entries stay stored for revalidation and offline use.
+
+        Args:
+            key: Cache key (e.g., 'repo:owner/name' or 'user:username')
+
+        Returns:
+            Cached data or None if not found/expired
+        """
+        entry = self.get_entry(key)
+
+        if entry is None or entry.is_expired():
+            return None
+
+        return entry.data
+
+    def set(
+        self,
+        key: str,
+        data: Union[dict, list],
+        ttl_seconds: Optional[int] = 3600,
+        etag: Optional[str] = None,
+    ) -> None:
+        """Store data in cache.
+
+        Args:
+            key: Cache key
+            data: Data to cache
+            ttl_seconds: Time-to-live in seconds (default: 1 hour, None = forever)
+            etag: ETag of the response, used for revalidation
+        """
+        self.set_entry(
+            key,
+            CacheEntry(data=data, cached_at=datetime.now(), ttl_seconds=ttl_seconds, etag=etag),
+        )
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Get several entries at once.
+
+        Returns:
+            Found entries by key (missing keys are omitted)
+        """
+        entries = {}
+        for key in keys:
+            entry = self.get_entry(key)
+            if entry is not None:
+                entries[key] = entry
+        return entries
+
+    def set_many(self, entries: dict[str, CacheEntry]) -> None:
+        """Store several entries at once."""
+        for key, entry in entries.items():
+            self.set_entry(key, entry)
+
+    def clear(self, key: Optional[str] = None) -> None:
+        """Clear cache.
+
+        Args:
+            key: Specific key to clear. If None, clears all cache.
+        """
+        if key is not None:
+            self.delete(key)
+            return
+        for stored_key in list(self.scan()):
+            self.delete(stored_key)
+
+    def _acquire_lease(self, key: str, lease_seconds: float) -> Optional[str]:
+        """Try to take the fetch lease for key.
+
+        The default grants every request, i.e. no coordination.
+
+        Returns:
+            Lease token if acquired, None if another holder has it
+        """
+        return "unshared"
+
+    def _release_lease(self, key: str, token: str) -> None:
+        """Give up a lease taken with ``_acquire_lease``."""
+
+    @contextmanager
+    def lease(
+        self,
+        key: str,
+        wait: float = 10.0,
+        lease_seconds: float = 60.0,
+        poll_interval: float = 0.05,
+    ) -> Iterator[bool]:
+        """Hold the fetch lease for a key.
+
+        Only one process (or thread) holds a key's lease at a time. Callers
+        should re-read the cache after acquiring it, since the previous
+        holder has usually just stored the entry.
+
+        Args:
+            key: Cache key
+            wait: Seconds to wait for another holder before giving up
+            lease_seconds: Seconds after which the lease counts as abandoned
+            poll_interval: Seconds between acquisition attempts
+
+        Yields:
+            True if the lease is held, False if waiting timed out
+        """
+        deadline = time.monotonic() + wait
+        token = self._acquire_lease(key, lease_seconds)
+        while token is None and time.monotonic() < deadline:
+            time.sleep(poll_interval)
+            token = self._acquire_lease(key, lease_seconds)
+
+        try:
+            yield token is not None
+        finally:
+            if token is not None:
+                self._release_lease(key, token)
+
+
+def _legacy_key(stem: str, data: Union[dict, list]) -> Optional[str]:
+    """Recover the cache key of an entry written by the old flat layout.
+
+    The flat layout replaced ``/`` and ``:`` with ``_``. Repos and users are
+    identified from their data; other keys are parsed from the file name,
+    which is unambiguous because GitHub logins cannot contain ``_``.
+    """
+    kind, _, rest = stem.partition("_")
+
+    if kind in ("repo", "user"):
+        field = "full_name" if kind == "repo" else "login"
+        if isinstance(data, dict) and field in data:
+            return f"{kind}:{data[field]}"
+        return None
+
+    owner, _, rest = rest.partition("_")
+    if not owner or not rest:
+        return None
+    if kind == "watermark":
+        return f"watermark:{owner}:{rest}"
+    if kind == "repos":
+        sort, _, limit = rest.rpartition("_")
+        return f"repos:{owner}:{sort}:{limit}"
+    if kind == "release" and rest.endswith("_latest"):
+        return f"release:{owner}/{rest.removesuffix('_latest')}:latest"
+    if kind == "releases":
+        name, _, limit = rest.rpartition("_")
+        return f"releases:{owner}/{name}:{limit}"
+    return None
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a local process exists (POSIX only, assumes alive elsewhere)."""
+    if os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class CacheManager(CacheBackend):
     """Manages file-based cache for GitHub API data."""
 
     def __init__(self, cache_dir: Optional[Path] = None):
         """Initialize cache manager.
 
+        Entries from the old flat layout are migrated on first use.
+
         Args:
             cache_dir: Directory for cache files. Defaults to ~/.gitpulse/cache
         """
@@ -22,74 +289,165 @@ class CacheManager:
 
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.migrate_legacy_layout()
 
     def _get_cache_path(self, key: str) -> Path:
         """Get cache file path for a given key."""
-        # Sanitize key for filesystem
-        safe_key = key.replace("/", "_").replace(":", "_")
-        return self.cache_dir / f"{safe_key}.json"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json"
 
-    def get(self, key: str) -> Optional[dict]:
-        """Get cached data if exists and not expired.
+    def _write(self, path: Path, cache_data: dict) -> None:
+        """Atomically write cache file via temp file and rename."""
+        payload = json.dumps(cache_data, separators=(",", ":")).encode("utf-8")
+        # Unique per writer thread, so concurrent writers never share a temp file
+        tmp_path = path.parent / f".tmp-{os.getpid()}-{threading.get_ident()}.json"
+        try:
+            try:
+                tmp_path.write_bytes(payload)
+            except FileNotFoundError:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get cached entry, including expired ones.
+
+        Expired entries are kept so they can be revalidated with their ETag.
 
         Args:
-            key: Cache key (e.g., 'repo:owner/name' or 'user:username')
+            key: Cache key
 
         Returns:
-            Cached data or None if not found/expired
+            Cache entry or None if not found
         """
         cache_path = self._get_cache_path(key)
 
-        if not cache_path.exists():
-            return None
-
         try:
             with open(cache_path, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
-
-            # Parse as CacheEntry
-            entry = CacheEntry(
-                data=cache_data["data"],
-                cached_at=datetime.fromisoformat(cache_data["cached_at"]),
-                ttl_seconds=cache_data.get("ttl_seconds", 3600),
-            )
-
-            # Check if expired
-            if entry.is_expired():
-                cache_path.unlink()  # Remove expired cache
-                return None
-
-            return entry.data
+                return entry_from_dict(json.load(f))
 
+        except FileNotFoundError:
+            return None
         except (json.JSONDecodeError, KeyError, ValueError):
             # Invalid cache file, remove it
             cache_path.unlink(missing_ok=True)
             return None
 
-    def set(self, key: str, data: dict, ttl_seconds: int = 3600) -> None:
-        """Store data in cache.
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """Store cache entry atomically."""
+        self._write(self._get_cache_path(key), entry_to_dict(key, entry))
 
-        Args:
-            key: Cache key
-            data: Data to cache
-            ttl_seconds: Time-to-live in seconds (default: 1 hour)
+    def delete(self, key: str) -> None:
+        """Remove entry if present."""
+        self._get_cache_path(key).unlink(missing_ok=True)
+
+    def scan(self, prefix: str = "") -> Iterator[str]:
+        """Iterate over stored keys starting with prefix.
+
+        Keys are hashed on disk, so this reads every entry.
         """
-        cache_path = self._get_cache_path(key)
+        for cache_file in self.cache_dir.glob("*/[!.]*.json"):
+            try:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    key = json.load(f).get("key")
+            except (FileNotFoundError, json.JSONDecodeError, ValueError):
+                continue
+            if key and key.startswith(prefix):
+                yield key
 
-        entry = CacheEntry(
-            data=data,
-            cached_at=datetime.now(),
-            ttl_seconds=ttl_seconds,
-        )
+    def _acquire_lease(self, key: str, lease_seconds: float) -> Optional[str]:
+        """Try to create the lease file for key, breaking stale leases.
 
-        cache_data = {
-            "data": entry.data,
-            "cached_at": entry.cached_at.isoformat(),
-            "ttl_seconds": entry.ttl_seconds,
+        Returns:
+            Lease token if acquired, None if another holder has it
+        """
+        lock_path = self._get_cache_path(key).with_suffix(".lock")
+        token = secrets.token_hex(8)
+        lease = {
+            "token": token,
+            "pid": os.getpid(),
+            "host": socket.gethostname(),
+            "expires": time.time() + lease_seconds,
         }
 
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, indent=2)
+        for _ in range(2):
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileNotFoundError:
+                lock_path.parent.mkdir(parents=True, exist_ok=True)
+                continue
+            except FileExistsError:
+                if not self._lease_is_stale(lock_path) or not self._break_lease(lock_path):
+                    return None
+                continue
+
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(lease, f)
+            return token
+
+        return None
+
+    def _break_lease(self, lock_path: Path) -> bool:
+        """Remove a lease judged stale, unless another waiter already replaced it.
+
+        The lease is first renamed to a unique tombstone, so only one waiter
+        takes any given lease file. If the file taken turns out to be a fresh
+        lease (another waiter broke the stale one and acquired it in the
+        meantime), it is put back.
+
+        Returns:
+            True if the lease was broken, False if it is held after all
+        """
+        tombstone = lock_path.with_name(f"{lock_path.name}.{secrets.token_hex(8)}")
+        try:
+            os.rename(lock_path, tombstone)
+        except FileNotFoundError:
+            return True  # Another waiter broke it first; retry creating
+
+        if self._lease_is_stale(tombstone):
+            tombstone.unlink(missing_ok=True)
+            return True
+
+        try:
+            os.link(tombstone, lock_path)
+        except FileExistsError:
+            pass
+        tombstone.unlink(missing_ok=True)
+        return False
+
+    def _lease_is_stale(self, lock_path: Path) -> bool:
+        """Check whether a lease expired or its holder process is gone."""
+        try:
+            with open(lock_path, "r", encoding="utf-8") as f:
+                lease = json.load(f)
+        except FileNotFoundError:
+            return True
+        except (json.JSONDecodeError, ValueError):
+            # Holder is still writing the lease, or it is corrupt; judge by age
+            try:
+                return time.time() - lock_path.stat().st_mtime > 5
+            except FileNotFoundError:
+                return True
+
+        if lease.get("expires", 0) < time.time():
+            return True
+        if lease.get("host") == socket.gethostname():
+            return not _pid_alive(lease.get("pid", 0))
+        return False
+
+    def _release_lease(self, key: str, token: str) -> None:
+        """Remove the lease file if this holder still owns it."""
+        lock_path = self._get_cache_path(key).with_suffix(".lock")
+        try:
+            with open(lock_path, "r", encoding="utf-8") as f:
+                lease = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, ValueError):
+            return
+        if lease.get("token") == token:
+            lock_path.unlink(missing_ok=True)
 
     def clear(self, key: Optional[str] = None) -> None:
         """Clear cache.
@@ -98,19 +456,91 @@ class CacheManager:
             key: Specific key to clear. If None, clears all cache.
         """
         if key is None:
-            # Clear all cache
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+            # Clear all cache, including leftovers of interrupted writes
+            for cache_file in self.cache_dir.glob("*/*.json"):
+                cache_file.unlink(missing_ok=True)
         else:
             # Clear specific key
             cache_path = self._get_cache_path(key)
             cache_path.unlink(missing_ok=True)
 
+    def migrate_legacy_layout(self) -> int:
+        """Move entries from the old flat layout into hashed shards.
+
+        Entries whose key cannot be recovered are dropped.
+
+        Returns:
+            Number of migrated entries
+        """
+        migrated = 0
+        for legacy_path in self.cache_dir.glob("*.json"):
+            try:
+                with open(legacy_path, "r", encoding="utf-8") as f:
+                    cache_data = json.load(f)
+                key = _legacy_key(legacy_path.stem, cache_data["data"])
+            except FileNotFoundError:
+                continue  # Migrated by another process
+            except (json.JSONDecodeError, KeyError, ValueError):
+                key = None
+
+            if key is not None:
+                cache_data["key"] = key
+                self._write(self._get_cache_path(key), cache_data)
+                migrated += 1
+            legacy_path.unlink(missing_ok=True)
+
+        return migrated
+
+
+def open_cache(url: Optional[str] = None) -> CacheBackend:
+    """Open a cache backend from a URL.
+
+    Supported URLs:
+        ``file:///path`` or a plain path - file cache (``CacheManager``)
+        ``sqlite:///path`` - SQLite database (``sqlite:///~/path`` is
+        relative to the home directory)
+        ``http://host:port`` / ``https://...`` - shared remote cache with a
+        local file cache as read-through tier
+
+    Args:
+        url: Backend URL. Defaults to the file cache in ~/.gitpulse/cache
+
+    Returns:
+        Cache backend
+    """
+    if not url:
+        return CacheManager()
+
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return CacheManager(Path(url).expanduser())
+    # Allow home-relative paths such as sqlite:///~/cache.sqlite3
+    path = Path(rest[1:] if rest.startswith("/~") else rest).expanduser()
+    if scheme == "file":
+        return CacheManager(path)
+    if scheme == "sqlite":
+        from .cache_sqlite import SQLiteCacheBackend
+
+        return SQLiteCacheBackend(path)
+    if scheme in ("http", "https"):
+        from .cache_remote import RemoteCacheBackend, TieredCache
+
+        return TieredCache(CacheManager(), RemoteCacheBackend(url))
+
+    raise ValueError(f"Unsupported cache URL: {url}")
+
+
+# Global cache instance, created on first use
+_cache: Optional[CacheBackend] = None
 
-# Global cache instance
-_cache = CacheManager()
 
+def get_cache() -> CacheBackend:
+    """Get global cache instance.
 
-def get_cache() -> CacheManager:
-    """Get global cache instance."""
+    The backend is chosen by the ``GITPULSE_CACHE_URL`` environment variable
+    (see ``open_cache``), defaulting to the local file cache.
+    """
+    global _cache
+    if _cache is None:
+        _cache = open_cache(os.environ.get("GITPULSE_CACHE_URL"))
     return _cache
@@ -0,0 +1,202 @@
+"""Remote cache backend shared over HTTP, and a read-through local tier.
+
+The protocol is served by ``gitpulse.cache_server``::
+
+    GET    /entries/{key}        -> 200 entry | 404
+    PUT    /entries/{key}        <- entry     -> 204
+    DELETE /entries/{key}                     -> 204
+    POST   /batch/get            <- {"keys": [...]}          -> {"entries": {key: entry}}
+    POST   /batch/set            <- {"entries": {key: entry}} -> 204
+    GET    /keys?prefix=...                   -> {"keys": [...]}
+
+Keys are percent-encoded in paths and entries use ``entry_to_dict``. An
+optional bearer token authenticates clients.
+"""
+
+import os
+from typing import Iterable, Iterator, Optional
+from urllib.parse import quote
+
+import httpx
+
+from .cache import CacheBackend, entry_from_dict, entry_to_dict
+from .models import CacheEntry
+
+
+class RemoteCacheBackend(CacheBackend):
+    """Cache backend talking to a shared cache server.
+
+    A cache must never break a command, so network and server errors are
+    treated as misses on read and ignored on write.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        token: Optional[str] = None,
+        timeout: float = 5.0,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        """Initialize remote backend.
+
+        Args:
+            url: Cache server base URL
+            token: Bearer token (defaults to GITPULSE_CACHE_TOKEN)
+            timeout: Request timeout in seconds
+            transport: Custom httpx transport (e.g. for tests)
+        """
+        token = token or os.environ.get("GITPULSE_CACHE_TOKEN")
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self.client = httpx.Client(
+            base_url=url.rstrip("/"), headers=headers, timeout=timeout, transport=transport
+        )
+
+    @staticmethod
+    def _path(key: str) -> str:
+        return f"/entries/{quote(key, safe='')}"
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Fetch entry from the server."""
+        try:
+            response = self.client.get(self._path(key))
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return entry_from_dict(response.json())
+        except (httpx.HTTPError, KeyError, ValueError):
+            return None
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """Store entry on the server."""
+        try:
+            self.client.put(self._path(key), json=entry_to_dict(key, entry)).raise_for_status()
+        except httpx.HTTPError:
+            pass
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Fetch several entries in one request."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        try:
+            response = self.client.post("/batch/get", json={"keys": keys})
+            response.raise_for_status()
+            return {
+                key: entry_from_dict(data) for key, data in response.json()["entries"].items()
+            }
+        except (httpx.HTTPError, KeyError, ValueError):
+            return {}
+
+    def set_many(self, entries: dict[str, CacheEntry]) -> None:
+        """Store several entries in one request."""
+        payload = {key: entry_to_dict(key, entry) for key, entry in entries.items()}
+        try:
+            self.client.post("/batch/set", json={"entries": payload}).raise_for_status()
+        except httpx.HTTPError:
+            pass
+
+    def delete(self, key: str) -> None:
+        """Remove entry on the server."""
+        try:
+            self.client.delete(self._path(key)).raise_for_status()
+        except httpx.HTTPError:
+            pass
+
+    def scan(self, prefix: str = "") -> Iterator[str]:
+        """Iterate over keys stored on the server."""
+        try:
+            response = self.client.get("/keys", params={"prefix": prefix})
+            response.raise_for_status()
+            keys = response.json()["keys"]
+        except (httpx.HTTPError, KeyError, ValueError):
+            return
+        yield from keys
+
+    def close(self) -> None:
+        """Close HTTP client."""
+        self.client.close()
+
+
+class TieredCache(CacheBackend):
+    """Local cache in front of a shared one.
+
+    Reads try the local tier first and fall back to the shared tier, copying
+    what they find locally. Writes go to both tiers, clearing only touches
+    the local one. Leases use the local tier, which coordinates processes on
+    the same host.
+    """
+
+    def __init__(self, local: CacheBackend, shared: CacheBackend):
+        """Initialize tiered cache.
+
+        Args:
+            local: Fast per-machine cache
+            shared: Cache shared by every machine
+        """
+        self.local = local
+        self.shared = shared
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get the freshest entry from either tier."""
+        entry = self.local.get_entry(key)
+        if entry is not None and not entry.is_expired():
+            return entry
+
+        shared = self.shared.get_entry(key)
+        if shared is not None and (entry is None or shared.cached_at > entry.cached_at):
+            self.local.set_entry(key, shared)
+            return shared
+        return entry
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Get entries locally, fetching the rest from the shared tier in one batch."""
+        keys = list(keys)
+        entries = self.local.get_many(keys)
+        missing = [k for k in keys if k not in entries or entries[k].is_expired()]
+
+        fetched = {
+            key: entry
+            for key, entry in self.shared.get_many(missing).items()
+            if key not in entries or entry.cached_at > entries[key].cached_at
+        }
+        if fetched:
+            self.local.set_many(fetched)
+            entries.update(fetched)
+        return entries
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """Write entry through to both tiers."""
+        self.local.set_entry(key, entry)
+        self.shared.set_entry(key, entry)
+
+    def set_many(self, entries: dict[str, CacheEntry]) -> None:
+        """Write entries through to both tiers."""
+        self.local.set_many(entries)
+        self.shared.set_many(entries)
+
+    def delete(self, key: str) -> None:
+        """Remove entry from both tiers."""
+        self.local.delete(key)
+        self.shared.delete(key)
+
+    def scan(self, prefix: str = "") -> Iterator[str]:
+        """Iterate over keys of the shared tier."""
+        return self.shared.scan(prefix)
+
+    def clear(self, key: Optional[str] = None) -> None:
+        """Clear the local tier.
+
+        The shared tier serves every machine, so it is left alone; use
+        :meth:`clear_shared` to purge it.
+        """
+        self.local.clear(key)
+
+    def clear_shared(self, key: Optional[str] = None) -> None:
+        """Clear the shared tier for every machine using it."""
+        self.shared.clear(key)
+
+    def _acquire_lease(self, key: str, lease_seconds: float) -> Optional[str]:
+        return self.local._acquire_lease(key, lease_seconds)
+
+    def _release_lease(self, key: str, token: str) -> None:
+        self.local._release_lease(key, token)
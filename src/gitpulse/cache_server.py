@@ -0,0 +1,181 @@
+"""Minimal HTTP server sharing a cache backend (see ``cache_remote``)."""
+
+import hmac
+import ipaddress
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .cache import CacheBackend, entry_from_dict, entry_to_dict
+
+
+def _make_handler(backend: CacheBackend, token: Optional[str]) -> type:
+    """Build request handler class bound to a backend."""
+
+    class CacheRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Send headers and body in one segment, flushed after each request
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass  # Keep test and CLI output clean
+
+        def _send(self, status: int, body: Optional[dict] = None) -> None:
+            content = json.dumps(body).encode() if body is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def _read_json(self) -> dict:
+            length = int(self.headers.get("Content-Length", 0))
+            return json.loads(self.rfile.read(length)) if length else {}
+
+        def _authorized(self) -> bool:
+            if token is None:
+                return True
+            supplied = self.headers.get("Authorization", "")
+            if hmac.compare_digest(supplied, f"Bearer {token}"):
+                return True
+            self._send(401, {"message": "Unauthorized"})
+            return False
+
+        def _key(self) -> Optional[str]:
+            path = urlsplit(self.path).path
+            if not path.startswith("/entries/"):
+                return None
+            return unquote(path.removeprefix("/entries/"))
+
+        def do_GET(self):
+            if not self._authorized():
+                return
+            url = urlsplit(self.path)
+            if url.path == "/keys":
+                prefix = parse_qs(url.query).get("prefix", [""])[0]
+                self._send(200, {"keys": list(backend.scan(prefix))})
+                return
+
+            key = self._key()
+            entry = backend.get_entry(key) if key else None
+            if entry is None:
+                self._send(404, {"message": "Not Found"})
+            else:
+                self._send(200, entry_to_dict(key, entry))
+
+        def do_PUT(self):
+            if not self._authorized():
+                return
+            key = self._key()
+            try:
+                entry = entry_from_dict(self._read_json())
+            except (KeyError, ValueError):
+                self._send(400, {"message": "Invalid entry"})
+                return
+            if key is None:
+                self._send(404, {"message": "Not Found"})
+                return
+            backend.set_entry(key, entry)
+            self._send(204)
+
+        def do_DELETE(self):
+            if not self._authorized():
+                return
+            key = self._key()
+            if key is not None:
+                backend.delete(key)
+            self._send(204)
+
+        def do_POST(self):
+            if not self._authorized():
+                return
+            path = urlsplit(self.path).path
+            try:
+                body = self._read_json()
+                if path == "/batch/get":
+                    entries = backend.get_many(body["keys"])
+                    payload = {key: entry_to_dict(key, e) for key, e in entries.items()}
+                    self._send(200, {"entries": payload})
+                elif path == "/batch/set":
+                    entries = {k: entry_from_dict(v) for k, v in body["entries"].items()}
+                    backend.set_many(entries)
+                    self._send(204)
+                else:
+                    self._send(404, {"message": "Not Found"})
+            except (KeyError, ValueError):
+                self._send(400, {"message": "Invalid request"})
+
+    return CacheRequestHandler
+
+
+def _is_loopback(host: str) -> bool:
+    """Whether a bind address only accepts connections from this machine."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False  # Host names may resolve to any interface
+
+
+class CacheServer:
+    """HTTP server exposing a cache backend to remote clients."""
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        token: Optional[str] = None,
+        insecure: bool = False,
+    ):
+        """Initialize server.
+
+        Args:
+            backend: Backend storing the shared entries
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            token: Bearer token required from clients (None = no auth)
+            insecure: Allow serving other machines without a token
+
+        Raises:
+            ValueError: If a non-loopback host is bound without token
+            OSError: If the address can't be bound
+        """
+        if not token and not insecure and not _is_loopback(host):
+            raise ValueError(
+                f"Refusing to serve {host} without a token: anyone reaching it could read "
+                "and overwrite the cache (use --token, or --insecure on a trusted network)"
+            )
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(backend, token))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self, poll_interval: float = 0.1) -> None:
+        """Serve requests until shut down."""
+        self.httpd.serve_forever(poll_interval)
+
+    def start(self) -> str:
+        """Serve requests on a background thread.
+
+        Returns:
+            Base URL of the server
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def shutdown(self) -> None:
+        """Stop serving and release the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,163 @@
+"""SQLite cache backend."""
+
+import json
+import secrets
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .cache import CacheBackend
+from .models import CacheEntry
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    cached_at TEXT NOT NULL,
+    ttl_seconds INTEGER,
+    etag TEXT
+);
+CREATE TABLE IF NOT EXISTS leases (
+    key TEXT PRIMARY KEY,
+    token TEXT NOT NULL,
+    expires REAL NOT NULL
+);
+"""
+
+# SQLite limits the number of bound parameters per statement
+_BATCH_SIZE = 500
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache backend storing entries in a single SQLite database.
+
+    The database runs in WAL mode, so several processes can share it.
+    Each thread gets its own connection.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize SQLite backend.
+
+        Args:
+            path: Database file (created if missing)
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row_to_entry(row: tuple) -> CacheEntry:
+        data, cached_at, ttl_seconds, etag = row
+        return CacheEntry(
+            data=json.loads(data),
+            cached_at=datetime.fromisoformat(cached_at),
+            ttl_seconds=ttl_seconds,
+            etag=etag,
+        )
+
+    @staticmethod
+    def _entry_to_row(key: str, entry: CacheEntry) -> tuple:
+        return (
+            key,
+            json.dumps(entry.data, separators=(",", ":")),
+            entry.cached_at.isoformat(),
+            entry.ttl_seconds,
+            entry.etag,
+        )
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Get cached entry, including expired ones."""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT data, cached_at, ttl_seconds, etag FROM entries WHERE key = ?", (key,)
+            )
+            .fetchone()
+        )
+        return self._row_to_entry(row) if row else None
+
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
+        """Store cache entry."""
+        self.set_many({key: entry})
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Get several entries with one query per batch."""
+        keys = list(keys)
+        conn = self._connection()
+        entries = {}
+        for i in range(0, len(keys), _BATCH_SIZE):
+            batch = keys[i : i + _BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                "SELECT key, data, cached_at, ttl_seconds, etag FROM entries "
+                f"WHERE key IN ({placeholders})",
+                batch,
+            )
+            for key, *row in rows:
+                entries[key] = self._row_to_entry(tuple(row))
+        return entries
+
+    def set_many(self, entries: dict[str, CacheEntry]) -> None:
+        """Store several entries in one transaction."""
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO entries (key, data, cached_at, ttl_seconds, etag) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [self._entry_to_row(key, entry) for key, entry in entries.items()],
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove entry if present."""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def scan(self, prefix: str = "") -> Iterator[str]:
+        """Iterate over stored keys starting with prefix, in key order."""
+        # Range scan on the primary key instead of LIKE, which can't use the index
+        rows = self._connection().execute(
+            "SELECT key FROM entries WHERE key >= ? AND key < ? ORDER BY key",
+            (prefix, prefix + "\U0010ffff"),
+        )
+        for (key,) in rows:
+            yield key
+
+    def clear(self, key: Optional[str] = None) -> None:
+        """Clear one key or the whole cache."""
+        if key is not None:
+            self.delete(key)
+            return
+        with self._connection() as conn:
+            conn.execute("DELETE FROM entries")
+
+    def _acquire_lease(self, key: str, lease_seconds: float) -> Optional[str]:
+        """Take the lease row for key unless a live lease exists."""
+        token = secrets.token_hex(8)
+        now = time.time()
+        with self._connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO leases (key, token, expires) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET token = excluded.token, "
+                "expires = excluded.expires WHERE leases.expires < ?",
+                (key, token, now + lease_seconds, now),
+            )
+        return token if cursor.rowcount == 1 else None
+
+    def _release_lease(self, key: str, token: str) -> None:
+        """Drop the lease row if this holder still owns it."""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM leases WHERE key = ? AND token = ?", (key, token))
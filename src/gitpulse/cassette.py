@@ -0,0 +1,248 @@
+"""HTTP record/replay cassettes for deterministic offline runs.
+
+A cassette is a single binary file::
+
+    MAGIC | record... | index | footer
+
+Each record is a fixed header (request key, status, elapsed time, header and
+body lengths) followed by the response headers as JSON and the raw body.
+The index lists ``(key, offset)`` pairs in recording order and the footer
+points at it. Replay memory-maps the file and loads only the index, so
+lookups are O(1) and bodies are read straight from the mapping.
+
+Request headers are never stored, so tokens don't leak into cassettes.
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+# Bumped whenever records or request keys change, as old cassettes would miss
+MAGIC = b"GPCASS02"
+_MAGIC_PREFIX = MAGIC[:6]
+_RECORD = struct.Struct("<16sHdII")  # key, status, elapsed, headers_len, body_len
+_INDEX = struct.Struct("<16sQ")  # key, record offset
+_FOOTER = struct.Struct("<QQ8s")  # index offset, record count, magic
+
+# Headers describing the wire encoding, which no longer applies to stored bodies
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class CassetteError(Exception):
+    """Invalid or unreadable cassette file."""
+
+    pass
+
+
+class CassetteMissError(httpx.TransportError):
+    """Request not found in the cassette."""
+
+    pass
+
+
+def request_key(request: httpx.Request) -> bytes:
+    """Compute cassette key from method, URL (sorted query), Accept and body.
+
+    Whether the request is conditional (``If-None-Match``) is part of the
+    key too, so a recorded ``304`` is only replayed to a client that has an
+    entry to revalidate.
+    """
+    params = sorted(request.url.params.multi_items())
+    url = request.url.copy_with(query=None)
+    accept = request.headers.get("Accept", "*/*")  # httpx default
+    conditional = "If-None-Match" in request.headers
+    digest = hashlib.sha256()
+    digest.update(f"{request.method} {url} {params} {accept} {conditional}".encode())
+    digest.update(request.content)
+    return digest.digest()[:16]
+
+
+class CassetteWriter:
+    """Append responses to a cassette file."""
+
+    def __init__(self, path: Path):
+        """Create (or overwrite) cassette at path."""
+        self.path = path
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._index: list[tuple[bytes, int]] = []
+        self._lock = threading.Lock()
+
+    def add(self, request: httpx.Request, response: httpx.Response, elapsed: float) -> None:
+        """Append a response recorded for request."""
+        headers = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in _DROPPED_HEADERS
+        ]
+        headers_bytes = json.dumps(headers, separators=(",", ":")).encode()
+        body = response.content
+        key = request_key(request)
+
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(
+                _RECORD.pack(key, response.status_code, elapsed, len(headers_bytes), len(body))
+            )
+            self._file.write(headers_bytes)
+            self._file.write(body)
+            self._index.append((key, offset))
+
+    def close(self) -> None:
+        """Write index and footer."""
+        with self._lock:
+            if self._file.closed:
+                return
+            index_offset = self._file.tell()
+            for key, offset in self._index:
+                self._file.write(_INDEX.pack(key, offset))
+            self._file.write(_FOOTER.pack(index_offset, len(self._index), MAGIC))
+            self._file.close()
+
+
+class CassetteReader:
+    """Memory-mapped, indexed view of a cassette file."""
+
+    def __init__(self, path: Path):
+        """Open cassette and load its index.
+
+        Raises:
+            CassetteError: If the file is not a cassette of this version
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise CassetteError(f"Empty cassette: {path}") from e
+
+        magic = self._mmap[: len(MAGIC)]
+        if magic != MAGIC:
+            self._mmap.close()
+            if magic.startswith(_MAGIC_PREFIX):
+                version = magic[len(_MAGIC_PREFIX) :].decode(errors="replace")
+                raise CassetteError(
+                    f"Unsupported cassette version {version} (expected "
+                    f"{MAGIC[len(_MAGIC_PREFIX) :].decode()}), record it again: {path}"
+                )
+            raise CassetteError(f"Not a cassette file: {path}")
+
+        self.index: dict[bytes, list[int]] = {}
+        self._cursor: dict[bytes, int] = {}
+        self._lock = threading.Lock()
+        for key, offset in self._read_index():
+            self.index.setdefault(key, []).append(offset)
+
+    def _read_index(self):
+        """Yield (key, offset) pairs from the index, or by scanning records.
+
+        Cassettes from interrupted recordings have no footer; their records
+        are still usable and are found by walking the file.
+        """
+        size = len(self._mmap)
+        if size >= len(MAGIC) + _FOOTER.size:
+            index_offset, count, magic = _FOOTER.unpack_from(self._mmap, size - _FOOTER.size)
+            if magic == MAGIC and index_offset + count * _INDEX.size == size - _FOOTER.size:
+                yield from _INDEX.iter_unpack(self._mmap[index_offset : size - _FOOTER.size])
+                return
+
+        offset = len(MAGIC)
+        while offset + _RECORD.size <= size:
+            key, _, _, headers_len, body_len = _RECORD.unpack_from(self._mmap, offset)
+            end = offset + _RECORD.size + headers_len + body_len
+            if end > size:
+                break  # Truncated final record
+            yield key, offset
+            offset = end
+
+    def __len__(self) -> int:
+        return sum(len(offsets) for offsets in self.index.values())
+
+    def lookup(self, request: httpx.Request) -> Optional[tuple[int, list, bytes, float]]:
+        """Find the next recorded response for request.
+
+        Repeated requests replay their recordings in order; the last one
+        is served again once they run out.
+
+        Returns:
+            Tuple of (status, headers, body, elapsed) or None if not recorded
+        """
+        key = request_key(request)
+        offsets = self.index.get(key)
+        if not offsets:
+            return None
+
+        with self._lock:
+            position = self._cursor.get(key, 0)
+            self._cursor[key] = min(position + 1, len(offsets) - 1)
+        offset = offsets[position]
+
+        _, status, elapsed, headers_len, body_len = _RECORD.unpack_from(self._mmap, offset)
+        start = offset + _RECORD.size
+        headers = json.loads(self._mmap[start : start + headers_len])
+        body = self._mmap[start + headers_len : start + headers_len + body_len]
+        return status, headers, body, elapsed
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Transport that records every response into a cassette."""
+
+    def __init__(self, path: Path, transport: Optional[httpx.BaseTransport] = None):
+        """Initialize recording transport.
+
+        Args:
+            path: Cassette file to write
+            transport: Transport that performs the real requests
+        """
+        self.transport = transport or httpx.HTTPTransport()
+        self.writer = CassetteWriter(path)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        response = self.transport.handle_request(request)
+        response.read()
+        self.writer.add(request, response, time.perf_counter() - started)
+        return response
+
+    def close(self) -> None:
+        self.writer.close()
+        self.transport.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """Transport that serves responses from a cassette."""
+
+    def __init__(self, path: Path, latency: bool = False):
+        """Initialize replay transport.
+
+        Args:
+            path: Cassette file to read
+            latency: Sleep for each response's recorded latency
+        """
+        self.reader = CassetteReader(path)
+        self.latency = latency
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        recorded = self.reader.lookup(request)
+        if recorded is None:
+            raise CassetteMissError(
+                f"Not in cassette: {request.method} {request.url}", request=request
+            )
+
+        status, headers, body, elapsed = recorded
+        if self.latency:
+            time.sleep(elapsed)
+        return httpx.Response(status, headers=headers, content=body, request=request)
+
+    def close(self) -> None:
+        self.reader.close()
@@ -11,15 +11,65 @@ from rich.panel import Panel
 from rich import box
 
 from . import __version__
+from .cache import get_cache, open_cache
+from .cache_remote import TieredCache
+from .cache_server import CacheServer
 from .github_api import GitHubClient, GitHubAPIError
+from .issues import collect_issue_metrics
+from .local import GitError, analyze_local_repo, analyze_local_repos
+from .output import open_writer, resolve_format
+from .planner import execute_plan, plan_requests
+from .resilience import RetryPolicy
+from .stars import INTERVALS, MAX_PAGES, PER_PAGE, fetch_star_history, star_timeline
+from .stats import fetch_activity
 from .badges import BadgeGenerator
+from .sync import sync_owner_repos
+from .tracing import Tracer
+from .warm import load_manifest, warm_cache
+from .watch import RepoWatcher
 
 app = typer.Typer(
     name="gitpulse",
     help="GitHub productivity CLI for analytics, badges, and automation",
     add_completion=False,
 )
+cache_app = typer.Typer(help="Manage the local cache")
+app.add_typer(cache_app, name="cache")
 console = Console()
+err_console = Console(stderr=True)
+
+# Client options set by global flags
+_client_options: dict = {}
+
+# Output format of the running command, for reports printed on exit
+_report_options: dict = {"format": "rich"}
+
+FORMAT_OPTION = typer.Option(
+    None,
+    "--format",
+    "-f",
+    help="Output format: rich, plain or tsv (default: rich on a terminal, plain otherwise)",
+)
+
+
+def _client() -> GitHubClient:
+    """Create GitHub client configured by global flags."""
+    return GitHubClient(**_client_options)
+
+
+def _output_format(fmt: Optional[str]) -> str:
+    """Resolve --format option, exiting on unknown formats."""
+    try:
+        _report_options["format"] = resolve_format(fmt)
+        return _report_options["format"]
+    except ValueError as e:
+        err_console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+def _status(fmt: str) -> Console:
+    """Console for progress messages, kept off stdout unless rendering rich output."""
+    return console if fmt == "rich" else err_console
 
 
 def version_callback(value: bool):
@@ -29,8 +79,51 @@ def version_callback(value: bool):
         raise typer.Exit()
 
 
+def _print_profile(tracer: Tracer, out: Console):
+    """Print request profile summary."""
+    table = Table(
+        title="⏱️ Request Profile",
+        box=box.ROUNDED,
+        show_header=True,
+        header_style="bold cyan",
+    )
+    table.add_column("Endpoint", style="bold")
+    table.add_column("Requests", justify="right")
+    table.add_column("304", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("Total ms", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("Bytes", justify="right")
+
+    for row in tracer.summary():
+        table.add_row(
+            row["endpoint"],
+            str(row["requests"]),
+            str(row["not_modified"]),
+            str(row["errors"]),
+            f"{row['total_ms']:.1f}",
+            f"{row['p50_ms']:.1f}",
+            f"{row['p95_ms']:.1f}",
+            str(row["bytes"]),
+        )
+
+    out.print(table)
+
+    cache = tracer.cache_summary()
+    if cache:
+        out.print(
+            "[bold]Cache:[/bold] "
+            + ", ".join(f"{outcome} {count}" for outcome, count in sorted(cache.items()))
+        )
+    remaining = tracer.rate_remaining()
+    if remaining is not None:
+        out.print(f"[bold]Rate limit remaining:[/bold] {remaining}")
+
+
 @app.callback()
 def main(
+    ctx: typer.Context,
     version: Optional[bool] = typer.Option(
         None,
         "--version",
@@ -39,9 +132,82 @@ def main(
         is_eager=True,
         help="Show version and exit",
     ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        envvar="GITPULSE_OFFLINE",
+        help="Serve only from cache (even expired entries), never touch the network",
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Print request timing summary on exit"
+    ),
+    trace: Optional[Path] = typer.Option(
+        None, "--trace", help="Write Chrome trace JSON of all requests to FILE"
+    ),
+    record: Optional[Path] = typer.Option(
+        None, "--record", help="Record all HTTP responses into cassette FILE"
+    ),
+    replay: Optional[Path] = typer.Option(
+        None,
+        "--replay",
+        exists=True,
+        dir_okay=False,
+        help="Serve HTTP responses from cassette FILE",
+    ),
+    replay_latency: bool = typer.Option(
+        False, "--replay-latency", help="Replay responses at their recorded latency"
+    ),
+    retries: int = typer.Option(
+        2, "--retries", min=0, help="Retries for failed GET requests (with backoff)"
+    ),
+    hedge: Optional[float] = typer.Option(
+        None,
+        "--hedge",
+        min=50,
+        max=99.9,
+        help="Send a duplicate GET when a request exceeds this latency percentile",
+    ),
+    cache_url: Optional[str] = typer.Option(
+        None,
+        "--cache",
+        envvar="GITPULSE_CACHE_URL",
+        help="Cache backend URL: path, file://, sqlite:// or http(s):// (shared server)",
+    ),
 ):
     """gitpulse - GitHub productivity CLI."""
-    pass
+    if record and replay:
+        console.print("[red]Error:[/red] --record and --replay are mutually exclusive")
+        raise typer.Exit(1)
+
+    _report_options["format"] = "rich"
+    _client_options["offline"] = offline
+    _client_options["record"] = record
+    _client_options["replay"] = replay
+    _client_options["replay_latency"] = replay_latency
+    _client_options["retry"] = RetryPolicy(max_attempts=retries + 1)
+    _client_options["hedge_percentile"] = hedge
+
+    if cache_url:
+        try:
+            _client_options["cache"] = open_cache(cache_url)
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+
+    if profile or trace:
+        tracer = Tracer()
+        _client_options["tracer"] = tracer
+
+        def report():
+            # Keep plain and tsv output on stdout parseable
+            out = _status(_report_options["format"])
+            if profile:
+                _print_profile(tracer, out)
+            if trace:
+                tracer.write_chrome_trace(trace)
+                out.print(f"[dim]Trace written to: {trace}[/dim]")
+
+        ctx.call_on_close(report)
 
 
 @app.command()
@@ -68,17 +234,42 @@ def auth(
 def repo_stats(
     repo: str = typer.Argument(..., help="Repository in format 'owner/name'"),
     no_cache: bool = typer.Option(False, "--no-cache", help="Force refresh from API"),
+    fmt: Optional[str] = FORMAT_OPTION,
 ):
     """Show repository statistics.
 
     Example:
         gitpulse repo ruslanlap/PowerToysRun-QuickAi
+        gitpulse repo ruslanlap/gitpulse --format tsv
     """
+    fmt = _output_format(fmt)
     try:
-        with GitHubClient() as client:
-            console.print(f"[cyan]Fetching stats for {repo}...[/cyan]")
+        with _client() as client:
+            _status(fmt).print(f"[cyan]Fetching stats for {repo}...[/cyan]")
             stats = client.get_repo_stats(repo, no_cache=no_cache)
 
+            if fmt != "rich":
+                try:
+                    latest = client.get_latest_release(repo)
+                except GitHubAPIError:
+                    latest = None
+                with open_writer(fmt, ["field", "value"], console) as writer:
+                    writer.write_row("full_name", stats.full_name)
+                    writer.write_row("description", stats.description)
+                    writer.write_row("stars", stats.stars)
+                    writer.write_row("forks", stats.forks)
+                    writer.write_row("watchers", stats.watchers)
+                    writer.write_row("open_issues", stats.open_issues)
+                    writer.write_row("language", stats.language)
+                    writer.write_row("size_kb", stats.size)
+                    writer.write_row("default_branch", stats.default_branch)
+                    writer.write_row("created", stats.created_at.isoformat())
+                    writer.write_row("updated", stats.updated_at.isoformat())
+                    writer.write_row("pushed", stats.pushed_at.isoformat())
+                    writer.write_row("topics", ",".join(stats.topics))
+                    writer.write_row("latest_release", latest.tag_name if latest else None)
+                return
+
             # Create table
             table = Table(
                 title=f"📊 Repository: {stats.full_name}",
@@ -126,7 +317,7 @@ def repo_stats(
                 pass
 
     except GitHubAPIError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _status(fmt).print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
 
@@ -135,18 +326,40 @@ def user_stats(
     username: str = typer.Argument(..., help="GitHub username"),
     no_cache: bool = typer.Option(False, "--no-cache", help="Force refresh from API"),
     top: int = typer.Option(3, "--top", "-n", help="Number of top repos to show"),
+    fmt: Optional[str] = FORMAT_OPTION,
 ):
     """Show user profile and statistics.
 
     Example:
         gitpulse user ruslanlap
         gitpulse user ruslanlap --top 5
+        gitpulse user ruslanlap --format plain
     """
+    fmt = _output_format(fmt)
     try:
-        with GitHubClient() as client:
-            console.print(f"[cyan]Fetching stats for @{username}...[/cyan]")
+        with _client() as client:
+            _status(fmt).print(f"[cyan]Fetching stats for @{username}...[/cyan]")
             stats = client.get_user_stats(username, no_cache=no_cache)
 
+            if fmt != "rich":
+                with open_writer(fmt, ["field", "value"], console) as writer:
+                    writer.write_row("login", stats.login)
+                    writer.write_row("name", stats.name)
+                    writer.write_row("bio", stats.bio)
+                    writer.write_row("public_repos", stats.public_repos)
+                    writer.write_row("public_gists", stats.public_gists)
+                    writer.write_row("followers", stats.followers)
+                    writer.write_row("following", stats.following)
+                    writer.write_row("location", stats.location)
+                    writer.write_row("company", stats.company)
+                    writer.write_row("blog", stats.blog)
+                    writer.write_row("joined", stats.created_at.isoformat())
+                    writer.flush()
+                    for i, repo in enumerate(client.get_top_repos(username, limit=top), 1):
+                        writer.write_row(f"top_repo_{i}", repo.full_name)
+                        writer.write_row(f"top_repo_{i}_stars", repo.stars)
+                return
+
             # User info
             table = Table(
                 title=f"👤 User: @{stats.login}",
@@ -211,10 +424,331 @@ def user_stats(
                 )
 
     except GitHubAPIError as e:
-        console.print(f"[red]Error:[/red] {e}")
+        _status(fmt).print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def repos(
+    owner: str = typer.Argument(..., help="GitHub user or organization"),
+    sort: str = typer.Option(
+        "updated", "--sort", help="Sort field (updated, pushed, created, full_name)"
+    ),
+    limit: Optional[int] = typer.Option(None, "--limit", "-n", help="Stop after N repos"),
+    fmt: Optional[str] = FORMAT_OPTION,
+):
+    """List all repositories of a user or organization.
+
+    Plain and TSV output is written page by page as results arrive.
+
+    Example:
+        gitpulse repos ruslanlap
+        gitpulse repos my-org --format tsv > repos.tsv
+    """
+    fmt = _output_format(fmt)
+    columns = ["repo", "stars", "forks", "open_issues", "language", "pushed", "description"]
+    count = 0
+    try:
+        with _client() as client, open_writer(
+            fmt, columns, console, title=f"📚 Repositories of {owner}"
+        ) as writer:
+            for page in client.iter_user_repo_pages(owner, sort=sort):
+                for r in page[: None if limit is None else limit - count]:
+                    writer.write_row(
+                        r["full_name"],
+                        r.get("stargazers_count"),
+                        r.get("forks_count"),
+                        r.get("open_issues_count"),
+                        r.get("language"),
+                        r.get("pushed_at"),
+                        r.get("description"),
+                    )
+                    count += 1
+                writer.flush()
+                if limit is not None and count >= limit:
+                    break
+
+    except GitHubAPIError as e:
+        _status(fmt).print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
 
+@app.command()
+def batch(
+    repos: Optional[list[str]] = typer.Argument(
+        None, help="Repositories in format 'owner/name'"
+    ),
+    manifest: Optional[Path] = typer.Option(
+        None,
+        "--manifest",
+        "-m",
+        exists=True,
+        dir_okay=False,
+        help="Read repositories from a manifest file (as for 'cache warm')",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Print the request plan without fetching"
+    ),
+    graphql: Optional[bool] = typer.Option(
+        None, "--graphql/--no-graphql", help="Allow GraphQL batches (default: with a token)"
+    ),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Parallel requests"),
+    fmt: Optional[str] = FORMAT_OPTION,
+):
+    """Fetch statistics of many repositories with as few requests as possible.
+
+    Repositories are grouped by owner and each group is fetched the cheapest
+    way: from the cache, one request per repo, the owner's repository
+    listing, or batched GraphQL queries.
+
+    Example:
+        gitpulse batch owner/a owner/b other/c --dry-run
+        gitpulse batch --manifest repos.txt --format tsv > stats.tsv
+    """
+    fmt = _output_format(fmt)
+    status = _status(fmt)
+
+    names = list(repos or [])
+    if manifest:
+        try:
+            names.extend(load_manifest(manifest).repos)
+        except ValueError as e:
+            status.print(f"[red]Error:[/red] Invalid manifest: {e}")
+            raise typer.Exit(1)
+    if not names:
+        status.print("[red]Error:[/red] Specify repositories or --manifest")
+        raise typer.Exit(1)
+
+    def on_error(repo: str, error: GitHubAPIError):
+        status.print(f"[red]Error:[/red] {repo}: {error}")
+
+    try:
+        with _client() as client:
+            plan = plan_requests(client, names, graphql=graphql)
+            status.print(
+                f"[cyan]Plan: {plan.requests} request(s) for {len(names)} repositories"
+                + (f", {plan.planning_requests} to plan" if plan.planning_requests else "")
+                + "[/cyan]"
+            )
+
+            if dry_run:
+                with open_writer(
+                    fmt, ["route", "owner", "repos", "requests"], console, title="🗺️ Request Plan"
+                ) as writer:
+                    for step in plan.steps:
+                        writer.write_row(step.route, step.owner, len(step.repos), step.requests)
+                return
+
+            results = execute_plan(client, plan, concurrency=concurrency, on_error=on_error)
+
+    except (GitHubAPIError, ValueError) as e:
+        status.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    columns = ["repo", "stars", "forks", "open_issues", "language", "pushed"]
+    with open_writer(fmt, columns, console, title="📦 Repositories") as writer:
+        for repo, stats in results.items():
+            writer.write_row(
+                repo,
+                stats.stars,
+                stats.forks,
+                stats.open_issues,
+                stats.language,
+                stats.pushed_at.date().isoformat(),
+            )
+    if len(results) < len(dict.fromkeys(names)):
+        raise typer.Exit(1)
+
+
+@app.command(name="star-history")
+def star_history(
+    repo: str = typer.Argument(..., help="Repository in format 'owner/name'"),
+    interval: str = typer.Option(
+        "week", "--interval", "-i", help="Timeline bucket: day, week or month"
+    ),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Parallel page requests"),
+    full: bool = typer.Option(False, "--full", help="Ignore cached stargazer pages"),
+    fmt: Optional[str] = FORMAT_OPTION,
+):
+    """Show star growth over time.
+
+    Stargazer pages are fetched in parallel and cached forever, so reruns
+    only fetch the newest stars.
+
+    Example:
+        gitpulse star-history ruslanlap/gitpulse
+        gitpulse star-history owner/repo --interval month --format tsv > stars.tsv
+    """
+    fmt = _output_format(fmt)
+    status = _status(fmt)
+    if interval not in INTERVALS:
+        status.print(f"[red]Error:[/red] Interval must be one of: {', '.join(INTERVALS)}")
+        raise typer.Exit(1)
+
+    try:
+        with _client() as client:
+            status.print(f"[cyan]Fetching stargazers of {repo}...[/cyan]")
+            history = fetch_star_history(client, repo, concurrency=concurrency, full=full)
+        timeline = star_timeline(history.starred_at, interval)
+
+    except GitHubAPIError as e:
+        status.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    status.print(
+        f"[dim]{history.pages} page(s): {history.fetched} fetched, "
+        f"{history.cached} from cache[/dim]"
+    )
+    if history.truncated:
+        status.print(
+            "[yellow]Warning:[/yellow] GitHub only lists the first "
+            f"{MAX_PAGES * PER_PAGE:,} stargazers; later stars are missing"
+        )
+    elif not history.complete:
+        status.print(
+            "[yellow]Warning:[/yellow] history is incomplete "
+            "(rate limit or offline); rerun later to fetch the remaining pages"
+        )
+
+    with open_writer(
+        fmt, [interval, "stars", "total"], console, title=f"⭐ Star History: {repo}"
+    ) as writer:
+        for bucket in timeline:
+            writer.write_row(bucket.period.isoformat(), bucket.stars, bucket.total)
+
+
+@app.command()
+def issues(
+    repo: str = typer.Argument(..., help="Repository in format 'owner/name'"),
+    full: bool = typer.Option(False, "--full", help="Ignore saved metrics and start over"),
+    fmt: Optional[str] = FORMAT_OPTION,
+):
+    """Show issue and pull request metrics.
+
+    Only issues updated since the last run are fetched; time to close,
+    PR merge time and open-issue age are kept as running aggregates.
+
+    Example:
+        gitpulse issues ruslanlap/gitpulse
+        gitpulse issues owner/big-repo --format tsv
+    """
+    fmt = _output_format(fmt)
+    status = _status(fmt)
+    try:
+        with _client() as client:
+            status.print(f"[cyan]Fetching issues of {repo}...[/cyan]")
+            stats = collect_issue_metrics(client, repo, full=full)
+
+    except GitHubAPIError as e:
+        status.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if stats.pages:
+        status.print(f"[dim]{stats.updated} updated issue(s) in {stats.pages} page(s)[/dim]")
+
+    rows = [
+        ("open_issues", stats.open_issues),
+        ("closed_issues", stats.closed_issues),
+        ("open_prs", stats.open_prs),
+        ("merged_prs", stats.merged_prs),
+        ("closed_prs", stats.closed_prs),
+    ]
+    for name, values, unit in (
+        ("time_to_close", stats.time_to_close_hours, "hours"),
+        ("pr_merge", stats.pr_merge_hours, "hours"),
+        ("open_age", stats.open_age_days, "days"),
+    ):
+        rows.extend((f"{name}_{q}_{unit}", value) for q, value in values.items())
+
+    with open_writer(
+        fmt, ["metric", "value"], console, title=f"🐛 Issues: {repo}"
+    ) as writer:
+        for name, value in rows:
+            writer.write_row(name, value)
+
+
+@app.command()
+def activity(
+    repos: list[str] = typer.Argument(
+        ..., help="Repositories in format 'owner/name' (or clone paths with --local)"
+    ),
+    local: bool = typer.Option(
+        False, "--local", help="Analyze local clones with git instead of calling the API"
+    ),
+    churn: bool = typer.Option(
+        False, "--churn", help="With --local, also count added and deleted lines (slower)"
+    ),
+    timeout: float = typer.Option(
+        300.0, "--timeout", help="Give up on statistics GitHub is still computing after N seconds"
+    ),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Parallel requests"),
+    fmt: Optional[str] = FORMAT_OPTION,
+):
+    """Show commit activity from GitHub's repository statistics or local clones.
+
+    GitHub computes statistics on demand; all repositories are requested
+    at once and the ones still being computed are polled in the background.
+    With --local, git history of the given clones is read in parallel.
+
+    Example:
+        gitpulse activity ruslanlap/gitpulse
+        gitpulse activity owner/a owner/b owner/c --format tsv
+        gitpulse activity --local ~/src/*
+    """
+    fmt = _output_format(fmt)
+    status = _status(fmt)
+
+    def on_error(repo: str, error: GitHubAPIError):
+        status.print(f"[red]Error:[/red] {repo}: {error}")
+
+    def local_activity():
+        for _, result in analyze_local_repos(
+            [Path(p) for p in repos], concurrency=concurrency, churn=churn
+        ):
+            if isinstance(result, GitError):
+                status.print(f"[red]Error:[/red] {result}")
+            else:
+                yield result
+
+    columns = [
+        "repo",
+        "commits",
+        "contributors",
+        "commits_4w",
+        "last_commit",
+        "additions",
+        "deletions",
+    ]
+    with _client() as client, open_writer(
+        fmt, columns, console, title="📈 Commit Activity"
+    ) as writer:
+        if local:
+            status.print(f"[cyan]Analyzing {len(repos)} local clones...[/cyan]")
+            summaries = local_activity()
+        else:
+            status.print(f"[cyan]Fetching statistics for {len(repos)} repositories...[/cyan]")
+            summaries = fetch_activity(
+                client, repos, concurrency=concurrency, timeout=timeout, on_error=on_error
+            )
+
+        for summary in summaries:
+            if summary.pending:
+                status.print(
+                    f"[yellow]Warning:[/yellow] {summary.repo}: "
+                    f"{', '.join(summary.pending)} not available"
+                )
+            writer.write_row(
+                summary.repo,
+                summary.total_commits,
+                summary.contributors,
+                sum(summary.weekly_commits[-4:]),
+                summary.last_commit_at.date().isoformat() if summary.last_commit_at else None,
+                summary.additions,
+                summary.deletions,
+            )
+            writer.flush()
+
+
 @app.command()
 def badges(
     repo: str = typer.Argument(..., help="Repository in format 'owner/name'"),
@@ -222,7 +756,16 @@ def badges(
         None,
         "--custom",
         "-c",
-        help="Custom badge types (comma-separated): stars,forks,issues,license,release,language,downloads,commit",
+        help=(
+            "Custom badge types (comma-separated): "
+            "stars,forks,issues,license,release,language,downloads,commit,activity"
+        ),
+    ),
+    local: Optional[Path] = typer.Option(
+        None,
+        "--local",
+        file_okay=False,
+        help="Local clone for commit activity badges (no API calls)",
     ),
 ):
     """Generate Markdown badges for README.
@@ -230,9 +773,11 @@ def badges(
     Example:
         gitpulse badges ruslanlap/gitpulse
         gitpulse badges ruslanlap/gitpulse --custom stars,forks,license
+        gitpulse badges ruslanlap/gitpulse --local ~/src/gitpulse
     """
     try:
         gen = BadgeGenerator()
+        activity = analyze_local_repo(local, repo=repo) if local else None
 
         if custom:
             # Custom badges
@@ -241,13 +786,13 @@ def badges(
         else:
             # Full badge set with stats
             try:
-                with GitHubClient() as client:
+                with _client() as client:
                     stats = client.get_repo_stats(repo)
                     latest_release = client.get_latest_release(repo)
-                    badges_md = gen.generate_full_set(repo, stats, latest_release)
+                    badges_md = gen.generate_full_set(repo, stats, latest_release, activity)
             except GitHubAPIError:
                 # Fallback to dynamic badges
-                badges_md = gen.generate_full_set(repo)
+                badges_md = gen.generate_full_set(repo, activity=activity)
 
         # Display
         console.print("\n[bold green]✓ Badges generated![/bold green]\n")
@@ -267,15 +812,29 @@ def export(
     user: Optional[str] = typer.Option(None, "--user", "-u", help="User to export"),
     format: str = typer.Option("json", "--format", "-f", help="Export format (json)"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file"),
+    activity: bool = typer.Option(
+        False, "--activity", help="Include commit activity from GitHub statistics"
+    ),
+    local: Optional[Path] = typer.Option(
+        None,
+        "--local",
+        file_okay=False,
+        help="Include commit activity computed from a local clone (no API calls)",
+    ),
 ):
     """Export statistics to JSON format.
 
     Example:
         gitpulse export --repo ruslanlap/gitpulse
         gitpulse export --user ruslanlap --output stats.json
+        gitpulse export --repo ruslanlap/gitpulse --local ~/src/gitpulse
     """
-    if not repo and not user:
-        console.print("[red]Error:[/red] Specify either --repo or --user")
+    if not repo and not user and not local:
+        console.print("[red]Error:[/red] Specify --repo, --user or --local")
+        raise typer.Exit(1)
+
+    if activity and not repo:
+        console.print("[red]Error:[/red] --activity needs --repo")
         raise typer.Exit(1)
 
     if format != "json":
@@ -283,7 +842,7 @@ def export(
         raise typer.Exit(1)
 
     try:
-        with GitHubClient() as client:
+        with _client() as client:
             data = {}
 
             if repo:
@@ -352,6 +911,14 @@ def export(
                     ],
                 }
 
+            if local:
+                console.print(f"[cyan]Analyzing local clone {local}...[/cyan]")
+                data["activity"] = analyze_local_repo(local, repo=repo).model_dump(mode="json")
+            elif activity:
+                console.print(f"[cyan]Exporting commit activity for {repo}...[/cyan]")
+                summary = next(fetch_activity(client, [repo]))
+                data["activity"] = summary.model_dump(mode="json")
+
             # Output
             json_str = json.dumps(data, indent=2, ensure_ascii=False)
 
@@ -361,22 +928,233 @@ def export(
             else:
                 console.print(json_str)
 
+    except (GitHubAPIError, GitError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def watch(
+    repos: list[str] = typer.Argument(..., help="Repositories in format 'owner/name'"),
+    min_interval: float = typer.Option(
+        60.0, "--min-interval", help="Shortest polling interval in seconds"
+    ),
+    max_interval: float = typer.Option(
+        3600.0, "--max-interval", help="Longest polling interval in seconds"
+    ),
+    rounds: Optional[int] = typer.Option(
+        None, "--rounds", help="Stop after N polling rounds"
+    ),
+    fmt: Optional[str] = FORMAT_OPTION,
+):
+    """Watch repositories and print changed fields.
+
+    Polls with conditional requests, so unchanged repos cost no rate limit.
+    Active repos are polled more often, quiet ones back off.
+
+    Example:
+        gitpulse watch ruslanlap/gitpulse ruslanlap/PowerToysRun-QuickAi
+        gitpulse watch owner/repo --min-interval 30 --max-interval 1800
+        gitpulse watch owner/repo --format tsv >> changes.tsv
+    """
+    fmt = _output_format(fmt)
+    status = _status(fmt)
+
+    def on_error(repo: str, error: GitHubAPIError):
+        status.print(f"[red]Error:[/red] {repo}: {error}")
+
+    try:
+        with _client() as client:
+            watcher = RepoWatcher(
+                client,
+                repos,
+                min_interval=min_interval,
+                max_interval=max_interval,
+                on_error=on_error,
+            )
+            status.print(f"[cyan]Watching {len(repos)} repositories...[/cyan]")
+
+            if fmt != "rich":
+                # Changes are written as they happen, so flush every row
+                with open_writer(fmt, ["time", "repo", "field", "old", "new"], console) as w:
+                    for change in watcher.run(rounds=rounds):
+                        w.write_row(
+                            change.detected_at.isoformat(),
+                            change.repo,
+                            change.field,
+                            change.old,
+                            change.new,
+                        )
+                        w.flush()
+                return
+
+            for change in watcher.run(rounds=rounds):
+                console.print(
+                    f"[dim]{change.detected_at.strftime('%H:%M:%S')}[/dim] "
+                    f"[bold]{change.repo}[/bold] {change.field}: "
+                    f"{change.old if change.old is not None else '-'} → "
+                    f"[green]{change.new if change.new is not None else '-'}[/green]"
+                )
+
+    except ValueError as e:
+        status.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        status.print("\n[dim]Stopped watching.[/dim]")
+
+
+@app.command()
+def sync(
+    owner: str = typer.Argument(..., help="GitHub user or organization"),
+    pushed: bool = typer.Option(
+        False, "--pushed", help="Use last push time instead of last update as watermark"
+    ),
+    full: bool = typer.Option(False, "--full", help="Ignore stored watermark"),
+    ttl: int = typer.Option(86400, "--ttl", help="Cache TTL for refreshed repos in seconds"),
+    fmt: Optional[str] = FORMAT_OPTION,
+):
+    """Refresh cached repositories that changed since the last sync.
+
+    Example:
+        gitpulse sync ruslanlap
+        gitpulse sync my-org --pushed
+        gitpulse sync my-org --format plain | xargs -n1 gitpulse badges
+    """
+    fmt = _output_format(fmt)
+    status = _status(fmt)
+    try:
+        with _client() as client:
+            status.print(f"[cyan]Syncing repositories of {owner}...[/cyan]")
+            result = sync_owner_repos(
+                client, owner, field="pushed" if pushed else "updated", full=full, ttl_seconds=ttl
+            )
+
+            status.print(
+                f"[green]✓[/green] Refreshed {len(result.refreshed)} repositories "
+                f"in {result.pages} request(s)"
+            )
+            if result.previous_watermark:
+                status.print(
+                    f"[dim]Changes since {result.previous_watermark.isoformat()}[/dim]"
+                )
+            if fmt != "rich":
+                with open_writer(fmt, ["repo"], console) as writer:
+                    for full_name in result.refreshed:
+                        writer.write_row(full_name)
+                return
+            for full_name in result.refreshed:
+                console.print(f"  {full_name}")
+
     except GitHubAPIError as e:
+        _status(fmt).print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+
+@cache_app.command("warm")
+def cache_warm(
+    manifest: Path = typer.Argument(..., exists=True, dir_okay=False, help="Manifest file"),
+    concurrency: int = typer.Option(8, "--concurrency", "-j", help="Parallel requests"),
+):
+    """Prefetch repositories, users and releases into the cache.
+
+    The manifest is JSON ({"repos": [...], "users": [...], "releases": true})
+    or plain text with one 'owner/name' or username per line.
+
+    Example:
+        gitpulse cache warm manifest.txt
+        gitpulse --offline repo ruslanlap/gitpulse
+    """
+    if _client_options.get("offline"):
+        console.print("[red]Error:[/red] Cannot warm the cache in offline mode")
+        raise typer.Exit(1)
+
+    try:
+        data = load_manifest(manifest)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] Invalid manifest: {e}")
+        raise typer.Exit(1)
+
+    with _client() as client:
+        console.print(
+            f"[cyan]Warming cache for {len(data.repos)} repos and {len(data.users)} users...[/cyan]"
+        )
+        result = warm_cache(client, data, concurrency=concurrency)
+
+    console.print(f"[green]✓[/green] Cached {result.fetched} entries")
+    if result.missing:
+        console.print(f"[dim]{len(result.missing)} not found (e.g. repos without releases)[/dim]")
+    for job, error in sorted(result.failed.items()):
+        console.print(f"[red]✗[/red] {job}: {error}")
+    if result.failed:
+        raise typer.Exit(1)
+
+
+@cache_app.command("serve")
+def cache_serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(8787, "--port", "-p", help="Port to listen on"),
+    store: str = typer.Option(
+        "sqlite:///~/.gitpulse/cache-server.sqlite3",
+        "--store",
+        help="Backend URL holding the shared entries",
+    ),
+    token: Optional[str] = typer.Option(
+        None, "--token", envvar="GITPULSE_CACHE_TOKEN", help="Require this bearer token"
+    ),
+    insecure: bool = typer.Option(
+        False, "--insecure", help="Serve a non-loopback host without --token"
+    ),
+):
+    """Serve a shared cache for other machines.
+
+    Clients point at it with --cache http://HOST:PORT (or GITPULSE_CACHE_URL)
+    and keep a local read-through copy. Binding anything but a loopback
+    address requires --token (or --insecure).
+
+    Example:
+        gitpulse cache serve --host 0.0.0.0 --port 8787 --token "$CACHE_TOKEN"
+        gitpulse --cache http://cache-host:8787 repo ruslanlap/gitpulse
+    """
+    try:
+        server = CacheServer(
+            open_cache(store), host=host, port=port, token=token, insecure=insecure
+        )
+    except (OSError, ValueError) as e:
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
 
+    console.print(f"[green]✓[/green] Serving cache at {server.url} [dim]({store})[/dim]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[dim]Stopped serving.[/dim]")
+    finally:
+        server.httpd.server_close()
+
 
 @app.command()
-def clear_cache():
+def clear_cache(
+    shared: bool = typer.Option(
+        False, "--shared", help="Also purge the shared cache server for every machine"
+    ),
+):
     """Clear all cached data.
 
+    With a shared cache only this machine's copy is cleared, unless --shared
+    is given.
+
     Example:
         gitpulse clear-cache
+        gitpulse --cache https://cache.example.com clear-cache --shared
     """
-    from .cache import get_cache
+    cache = _client_options.get("cache") or get_cache()
+    if shared and not isinstance(cache, TieredCache):
+        err_console.print("[red]Error:[/red] --shared needs a shared cache (--cache http(s)://...)")
+        raise typer.Exit(1)
 
-    cache = get_cache()
     cache.clear()
+    if shared:
+        cache.clear_shared()
     console.print("[green]✓[/green] Cache cleared successfully!")
 
 
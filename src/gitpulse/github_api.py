@@ -1,14 +1,27 @@
 """GitHub REST API client with caching support."""
 
 import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Union
 
 import httpx
 from rich.console import Console
 
-from .cache import get_cache
-from .models import Release, RepoStats, TopRepo, UserStats
+from .cache import CacheBackend, get_cache
+from .cassette import CassetteError, CassetteMissError, RecordingTransport, ReplayTransport
+from .models import CacheEntry, Release, RepoStats, TopRepo, UserStats
+from .resilience import (
+    IDEMPOTENT_METHODS,
+    CircuitBreaker,
+    CircuitOpenError,
+    LatencyTracker,
+    RequestAttempts,
+    RetryPolicy,
+)
+from .tracing import Tracer
 
 console = Console()
 
@@ -19,21 +32,111 @@ class GitHubAPIError(Exception):
     pass
 
 
+def load_token() -> Optional[str]:
+    """Load token from environment or config file."""
+    # Try environment variable first
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token
+
+    # Try config file
+    config_path = Path.home() / ".gitpulse" / "config"
+    if config_path.exists():
+        with open(config_path, "r", encoding="utf-8") as f:
+            return f.read().strip()
+
+    return None
+
+
+def check_response(response: httpx.Response) -> httpx.Response:
+    """Translate HTTP error statuses into GitHubAPIError.
+
+    A ``304 Not Modified`` response is returned as-is.
+
+    Raises:
+        GitHubAPIError: If the status is an error
+    """
+    if response.status_code == 304:
+        return response
+
+    try:
+        response.raise_for_status()
+        return response
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            raise GitHubAPIError(
+                "Unauthorized. Please set GitHub token with 'gitpulse auth'"
+            ) from e
+        elif e.response.status_code == 404:
+            raise GitHubAPIError("Resource not found") from e
+        elif e.response.status_code == 403:
+            raise GitHubAPIError(
+                "Rate limit exceeded or access forbidden. Try again later."
+            ) from e
+        else:
+            raise GitHubAPIError(f"API error: {e.response.status_code}") from e
+
+
+def _close_response(future: Future) -> None:
+    """Close the response of a hedged request that lost the race."""
+    if future.exception() is None:
+        future.result().close()
+
+
 class GitHubClient:
     """GitHub REST API client."""
 
     BASE_URL = "https://api.github.com"
-
-    def __init__(self, token: Optional[str] = None, use_cache: bool = True):
+    STAR_MEDIA_TYPE = "application/vnd.github.star+json"
+    STATS_KINDS = ("contributors", "commit_activity", "code_frequency")
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        use_cache: bool = True,
+        cache: Optional[CacheBackend] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        offline: bool = False,
+        tracer: Optional[Tracer] = None,
+        record: Optional[Path] = None,
+        replay: Optional[Path] = None,
+        replay_latency: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_percentile: Optional[float] = None,
+        timeout: float = 30.0,
+    ):
         """Initialize GitHub client.
 
         Args:
             token: GitHub personal access token
             use_cache: Whether to use cache (default: True)
+            cache: Cache to use instead of the global one
+            transport: Custom httpx transport (e.g. for tests)
+            offline: Serve only from cache (including expired entries) and
+                fail fast on a miss instead of touching the network
+            tracer: Tracer recording request timings and cache outcomes
+            record: Cassette file to record every response into
+            replay: Cassette file to serve responses from instead of the network
+            replay_latency: Replay responses at their recorded latency
+            retry: Retry policy for idempotent requests (default: 3 attempts)
+            circuit_breaker: Circuit breaker shared by all requests
+                (default: open after 5 consecutive failures for 30s)
+            hedge_percentile: Send a duplicate GET once a request runs longer
+                than this latency percentile (e.g. 95). Disabled if None.
+            timeout: Request timeout in seconds
         """
         self.token = token or self._load_token()
         self.use_cache = use_cache
-        self.cache = get_cache()
+        self.offline = offline
+        self.tracer = tracer
+        self.retry = retry or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.hedge_percentile = hedge_percentile
+        self.latency = LatencyTracker()
+        self.hedged_requests = 0
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self.cache = cache if cache is not None else get_cache()
 
         # Setup HTTP client
         headers = {
@@ -43,22 +146,167 @@ class GitHubClient:
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
 
-        self.client = httpx.Client(headers=headers, timeout=30.0)
+        if replay is not None:
+            try:
+                transport = ReplayTransport(replay, latency=replay_latency)
+            except CassetteError as e:
+                raise GitHubAPIError(str(e)) from e
+        elif record is not None:
+            transport = RecordingTransport(record, transport)
+
+        self.client = httpx.Client(headers=headers, timeout=timeout, transport=transport)
 
     def _load_token(self) -> Optional[str]:
         """Load token from config file or environment."""
-        # Try environment variable first
-        token = os.environ.get("GITHUB_TOKEN")
-        if token:
-            return token
+        return load_token()
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send HTTP request to GitHub API.
+
+        A ``304 Not Modified`` response is returned as-is so callers making
+        conditional requests can detect it.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (without base URL)
+            **kwargs: Additional arguments for httpx
 
-        # Try config file
-        config_path = Path.home() / ".gitpulse" / "config"
-        if config_path.exists():
-            with open(config_path, "r", encoding="utf-8") as f:
-                return f.read().strip()
+        Returns:
+            HTTP response
 
-        return None
+        Raises:
+            GitHubAPIError: If request fails
+        """
+        if self.offline:
+            raise GitHubAPIError(f"Offline mode: {endpoint} is not cached")
+
+        url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+
+        if self.tracer is None:
+            return self._send_checked(method, url, **kwargs)
+
+        started = self.tracer.clock()
+        recorder = self.tracer.phase_recorder()
+        kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": recorder}
+        try:
+            response = self._send_checked(method, url, **kwargs)
+        except GitHubAPIError as e:
+            cause = e.__cause__
+            response = cause.response if isinstance(cause, httpx.HTTPStatusError) else None
+            self._trace_response(method, endpoint, started, recorder, response, error=str(e))
+            raise
+        self._trace_response(method, endpoint, started, recorder, response)
+        return response
+
+    def _trace_response(
+        self,
+        method: str,
+        endpoint: str,
+        started: float,
+        recorder,
+        response: Optional[httpx.Response],
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a finished request with the tracer."""
+        remaining = response.headers.get("X-RateLimit-Remaining") if response else None
+        self.tracer.record_request(
+            method,
+            endpoint,
+            started,
+            status=response.status_code if response else None,
+            size=len(response.content) if response else 0,
+            phases=recorder.phases,
+            rate_remaining=int(remaining) if remaining and remaining.isdigit() else None,
+            error=error,
+        )
+
+    def _send_checked(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send request with retries and translate HTTP failures into GitHubAPIError.
+
+        Idempotent requests are retried on connection errors, timeouts and
+        retryable statuses with exponential backoff and jitter. Every attempt
+        goes through the circuit breaker.
+        """
+        attempts = RequestAttempts(method, self.retry, self.circuit_breaker)
+
+        for attempt in attempts:
+            try:
+                with attempts.guard():
+                    try:
+                        response = self._dispatch(method, url, **kwargs)
+                    except CassetteMissError as e:
+                        # Not the API's fault, so the breaker ignores it
+                        raise GitHubAPIError(f"Request failed: {str(e)}") from e
+                    attempts.record(response)
+            except CircuitOpenError as e:
+                raise GitHubAPIError(str(e)) from e
+            except httpx.RequestError as e:
+                delay = attempts.backoff(attempt)
+                if delay is None:
+                    raise GitHubAPIError(f"Request failed: {str(e)}") from e
+                time.sleep(delay)
+                continue
+
+            delay = attempts.retry_delay(attempt, response)
+            if delay is not None:
+                response.close()
+                time.sleep(delay)
+                continue
+
+            return self._check_response(response)
+
+    def _check_response(self, response: httpx.Response) -> httpx.Response:
+        """Translate HTTP error statuses into GitHubAPIError."""
+        return check_response(response)
+
+    def _dispatch(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a single attempt, hedged when enabled and latency is known."""
+        threshold = None
+        if self.hedge_percentile is not None and method.upper() in IDEMPOTENT_METHODS:
+            threshold = self.latency.percentile(self.hedge_percentile)
+
+        started = time.perf_counter()
+        if threshold is None:
+            response = self.client.request(method, url, **kwargs)
+        else:
+            response = self._hedged_request(method, url, threshold, **kwargs)
+        self.latency.record(time.perf_counter() - started)
+        return response
+
+    def _hedged_request(
+        self, method: str, url: str, threshold: float, **kwargs
+    ) -> httpx.Response:
+        """Send request, firing a duplicate if it outlives threshold seconds.
+
+        The first successful response wins; the other one is closed when it
+        arrives.
+        """
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=32, thread_name_prefix="gitpulse-hedge"
+            )
+
+        primary = self._hedge_executor.submit(self.client.request, method, url, **kwargs)
+        try:
+            return primary.result(timeout=threshold)
+        except FutureTimeoutError:
+            pass
+
+        self.hedged_requests += 1
+        backup = self._hedge_executor.submit(self.client.request, method, url, **kwargs)
+        pending = {primary, backup}
+        error: Optional[BaseException] = None
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    for loser in pending:
+                        loser.add_done_callback(_close_response)
+                    return future.result()
+
+        raise error
 
     def _request(self, method: str, endpoint: str, **kwargs) -> dict:
         """Make HTTP request to GitHub API.
@@ -74,53 +322,137 @@ class GitHubClient:
         Raises:
             GitHubAPIError: If request fails
         """
-        url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+        return self._send(method, endpoint, **kwargs).json()
 
-        try:
-            response = self.client.request(method, url, **kwargs)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                raise GitHubAPIError(
-                    "Unauthorized. Please set GitHub token with 'gitpulse auth'"
-                ) from e
-            elif e.response.status_code == 404:
-                raise GitHubAPIError("Resource not found") from e
-            elif e.response.status_code == 403:
-                raise GitHubAPIError(
-                    "Rate limit exceeded or access forbidden. Try again later."
-                ) from e
-            else:
-                raise GitHubAPIError(f"API error: {e.response.status_code}") from e
-        except httpx.RequestError as e:
-            raise GitHubAPIError(f"Request failed: {str(e)}") from e
+    def conditional_get(
+        self, endpoint: str, etag: Optional[str] = None, **kwargs
+    ) -> tuple[Optional[dict], Optional[str]]:
+        """Make a conditional GET request using an ETag.
 
-    def get_repo_stats(self, repo: str, no_cache: bool = False) -> RepoStats:
-        """Get repository statistics.
+        GitHub does not count ``304 Not Modified`` responses against the
+        rate limit, so polling with ETags is nearly free for unchanged data.
 
         Args:
-            repo: Repository in format 'owner/name'
+            endpoint: API endpoint (without base URL)
+            etag: ETag from a previous response
+            **kwargs: Additional arguments for httpx
+
+        Returns:
+            Tuple of (response JSON or None if not modified, current ETag)
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self._send("GET", endpoint, headers=headers, **kwargs)
+        if response.status_code == 304:
+            return None, response.headers.get("ETag", etag)
+        return response.json(), response.headers.get("ETag")
+
+    def graphql(self, query: str, variables: Optional[dict] = None) -> dict:
+        """Run a GraphQL query.
+
+        Partial results are returned as-is: fields that failed (e.g. a
+        repository that does not exist) are None in the data.
+
+        Args:
+            query: GraphQL query
+            variables: Query variables
+
+        Returns:
+            Query data
+
+        Raises:
+            GitHubAPIError: If the request fails or the query returned no data
+        """
+        if not self.token:
+            raise GitHubAPIError("GraphQL API requires a token. Use 'gitpulse auth'")
+
+        result = self._request("POST", "/graphql", json={"query": query, "variables": variables})
+        if result.get("data") is None:
+            messages = "; ".join(e.get("message", "") for e in result.get("errors", []))
+            raise GitHubAPIError(f"GraphQL error: {messages or 'no data'}")
+        return result["data"]
+
+    def _cached_get(
+        self, cache_key: str, endpoint: str, no_cache: bool = False, **kwargs
+    ) -> Union[dict, list]:
+        """GET an endpoint through the cache.
+
+        Expired entries that carry an ETag are revalidated with a conditional
+        request instead of being refetched. In offline mode any cached entry
+        is served, however old.
+
+        Args:
+            cache_key: Cache key for the response
+            endpoint: API endpoint (without base URL)
             no_cache: Force refresh from API
+            **kwargs: Additional arguments for httpx
 
         Returns:
-            Repository statistics
+            Response JSON
+
+        Raises:
+            GitHubAPIError: If request fails or, offline, the key is not cached
         """
-        cache_key = f"repo:{repo}"
+        if self.offline:
+            entry = self.cache.get_entry(cache_key)
+            self._trace_cache(cache_key, "offline" if entry else "miss")
+            if entry is None:
+                raise GitHubAPIError(f"Offline mode: '{cache_key}' is not cached")
+            return entry.data
+
+        if not self.use_cache:
+            return self._request("GET", endpoint, **kwargs)
+
+        if no_cache:
+            return self._fetch_into_cache(cache_key, endpoint, None, **kwargs)
+
+        entry = self.cache.get_entry(cache_key)
+        if entry and not entry.is_expired():
+            self._trace_cache(cache_key, "hit")
+            return entry.data
+
+        # Single-flight: one process refreshes the key, others wait and reuse it
+        with self.cache.lease(cache_key):
+            entry = self.cache.get_entry(cache_key)
+            if entry and not entry.is_expired():
+                self._trace_cache(cache_key, "shared")
+                return entry.data
+            return self._fetch_into_cache(cache_key, endpoint, entry, **kwargs)
+
+    def _fetch_into_cache(
+        self, cache_key: str, endpoint: str, entry: Optional[CacheEntry], **kwargs
+    ) -> Union[dict, list]:
+        """Fetch endpoint, revalidating entry if present, and store the result."""
+        data, etag = self.conditional_get(endpoint, entry.etag if entry else None, **kwargs)
+        if data is None and entry is None:
+            # Not modified, but nothing to reuse (e.g. a replayed 304): fetch again
+            data, etag = self.conditional_get(endpoint, None, **kwargs)
+            if data is None:
+                raise GitHubAPIError(f"Unexpected 304 Not Modified for {endpoint}")
+        if data is None:
+            # Not modified: refresh the entry's timestamp
+            self._trace_cache(cache_key, "revalidate")
+            data = entry.data
+        else:
+            self._trace_cache(cache_key, "miss")
+        self.cache.set(cache_key, data, etag=etag)
+        return data
 
-        # Try cache first
-        if self.use_cache and not no_cache:
-            cached = self.cache.get(cache_key)
-            if cached:
-                return RepoStats(**cached)
+    def _trace_cache(self, cache_key: str, outcome: str) -> None:
+        """Record cache lookup outcome if tracing is enabled."""
+        if self.tracer is not None:
+            self.tracer.record_cache(cache_key, outcome)
 
-        # Fetch from API
-        data = self._request("GET", f"/repos/{repo}")
+    def get_repo_stats(self, repo: str, no_cache: bool = False) -> RepoStats:
+        """Get repository statistics.
 
-        # Cache result
-        if self.use_cache:
-            self.cache.set(cache_key, data)
+        Args:
+            repo: Repository in format 'owner/name'
+            no_cache: Force refresh from API
 
+        Returns:
+            Repository statistics
+        """
+        data = self._cached_get(f"repo:{repo}", f"/repos/{repo}", no_cache=no_cache)
         return RepoStats(**data)
 
     def get_repo_releases(self, repo: str, limit: int = 5) -> list[Release]:
@@ -133,22 +465,35 @@ class GitHubClient:
         Returns:
             List of releases
         """
-        data = self._request("GET", f"/repos/{repo}/releases", params={"per_page": limit})
+        data = self._cached_get(
+            f"releases:{repo}:{limit}", f"/repos/{repo}/releases", params={"per_page": limit}
+        )
         return [Release(**item) for item in data]
 
-    def get_latest_release(self, repo: str) -> Optional[Release]:
+    def get_latest_release(self, repo: str, strict: bool = False) -> Optional[Release]:
         """Get latest release for repository.
 
         Args:
             repo: Repository in format 'owner/name'
+            strict: Raise errors other than "no releases" instead of
+                returning None
 
         Returns:
             Latest release or None if no releases
+
+        Raises:
+            GitHubAPIError: If strict and the request fails
         """
         try:
-            data = self._request("GET", f"/repos/{repo}/releases/latest")
+            data = self._cached_get(f"release:{repo}:latest", f"/repos/{repo}/releases/latest")
             return Release(**data)
-        except GitHubAPIError:
+        except GitHubAPIError as e:
+            cause = e.__cause__
+            no_releases = (
+                isinstance(cause, httpx.HTTPStatusError) and cause.response.status_code == 404
+            )
+            if strict and not no_releases:
+                raise
             return None
 
     def get_user_stats(self, username: str, no_cache: bool = False) -> UserStats:
@@ -161,21 +506,7 @@ class GitHubClient:
         Returns:
             User statistics
         """
-        cache_key = f"user:{username}"
-
-        # Try cache first
-        if self.use_cache and not no_cache:
-            cached = self.cache.get(cache_key)
-            if cached:
-                return UserStats(**cached)
-
-        # Fetch from API
-        data = self._request("GET", f"/users/{username}")
-
-        # Cache result
-        if self.use_cache:
-            self.cache.set(cache_key, data)
-
+        data = self._cached_get(f"user:{username}", f"/users/{username}", no_cache=no_cache)
         return UserStats(**data)
 
     def get_user_repos(
@@ -191,13 +522,99 @@ class GitHubClient:
         Returns:
             List of repository data
         """
-        data = self._request(
-            "GET",
+        data = self._cached_get(
+            f"repos:{username}:{sort}:{limit}",
             f"/users/{username}/repos",
             params={"per_page": limit, "sort": sort},
         )
         return data
 
+    def iter_user_repo_pages(
+        self, username: str, sort: str = "updated", per_page: int = 100
+    ) -> Iterator[list[dict]]:
+        """Iterate over all pages of user repositories.
+
+        Pages are fetched lazily by following the ``rel="next"`` link, so
+        callers can stop early without paying for the remaining pages.
+
+        Args:
+            username: GitHub username or organization
+            sort: Sort field (updated, pushed, created, full_name)
+            per_page: Repositories per page (max 100)
+
+        Yields:
+            Lists of repository data, newest first for date sorts
+        """
+        endpoint = f"/users/{username}/repos"
+        params: Optional[dict] = {"per_page": per_page, "sort": sort}
+
+        while endpoint:
+            response = self._send("GET", endpoint, params=params)
+            yield response.json()
+
+            next_link = response.links.get("next")
+            endpoint = next_link["url"].removeprefix(self.BASE_URL) if next_link else None
+            params = None  # Already encoded in the next link
+
+    def iter_issue_pages(
+        self, repo: str, since: Optional[str] = None, per_page: int = 100
+    ) -> Iterator[list[dict]]:
+        """Iterate over pages of issues and pull requests, oldest update first.
+
+        Args:
+            repo: Repository in format 'owner/name'
+            since: Only issues updated at or after this ISO 8601 timestamp
+            per_page: Issues per page (max 100)
+
+        Yields:
+            Lists of issue data; pull requests carry a ``pull_request`` key
+        """
+        endpoint = f"/repos/{repo}/issues"
+        params: Optional[dict] = {
+            "state": "all",
+            "sort": "updated",
+            "direction": "asc",
+            "per_page": per_page,
+        }
+        if since:
+            params["since"] = since
+
+        while endpoint:
+            response = self._send("GET", endpoint, params=params)
+            yield response.json()
+
+            next_link = response.links.get("next")
+            endpoint = next_link["url"].removeprefix(self.BASE_URL) if next_link else None
+            params = None  # Already encoded in the next link
+
+    def get_stargazers_page(
+        self, repo: str, page: int, per_page: int = 100
+    ) -> tuple[list[dict], int, Optional[int]]:
+        """Get one page of stargazers with the time each star was given.
+
+        Stargazers are listed oldest first, so every page except the last is
+        immutable (as long as nobody unstars).
+
+        Args:
+            repo: Repository in format 'owner/name'
+            page: Page number, starting at 1
+            per_page: Stargazers per page (max 100)
+
+        Returns:
+            Tuple of (stargazers, last page number, remaining rate limit)
+        """
+        response = self._send(
+            "GET",
+            f"/repos/{repo}/stargazers",
+            params={"per_page": per_page, "page": page},
+            headers={"Accept": self.STAR_MEDIA_TYPE},
+        )
+        last_link = response.links.get("last")
+        # GitHub omits rel="last" on the last page itself
+        last_page = int(httpx.URL(last_link["url"]).params["page"]) if last_link else page
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        return response.json(), last_page, int(remaining) if remaining is not None else None
+
     def get_top_repos(self, username: str, limit: int = 3) -> list[TopRepo]:
         """Get top repositories by stars.
 
@@ -228,8 +645,67 @@ class GitHubClient:
             for r in top_repos
         ]
 
+    def get_repo_statistic(
+        self, repo: str, kind: str, no_cache: bool = False
+    ) -> Optional[list]:
+        """Get a ``/stats/*`` statistic of a repository without waiting for it.
+
+        GitHub computes statistics in the background and answers ``202
+        Accepted`` until they are ready. Instead of blocking, this returns
+        None so callers can poll many repositories at once (see
+        :class:`gitpulse.stats.StatsScheduler`).
+
+        Args:
+            repo: Repository in format 'owner/name'
+            kind: Statistic ('contributors', 'commit_activity' or 'code_frequency')
+            no_cache: Force refresh from API
+
+        Returns:
+            Statistic data, or None while GitHub is still computing it
+
+        Raises:
+            GitHubAPIError: If request fails or, offline, the statistic is not cached
+        """
+        if kind not in self.STATS_KINDS:
+            raise ValueError(
+                f"Unknown statistic '{kind}'. Use one of: {', '.join(self.STATS_KINDS)}"
+            )
+
+        cache_key = f"stats:{repo}:{kind}"
+        endpoint = f"/repos/{repo}/stats/{kind}"
+        if self.offline:
+            return self._cached_get(cache_key, endpoint)
+
+        entry = self.cache.get_entry(cache_key) if self.use_cache else None
+        if entry and not entry.is_expired() and not no_cache:
+            self._trace_cache(cache_key, "hit")
+            return entry.data
+
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else {}
+        response = self._send("GET", endpoint, headers=headers)
+        if response.status_code == 304 and entry is None:
+            # Not modified, but nothing to reuse (e.g. a replayed 304): fetch again
+            response = self._send("GET", endpoint)
+        if response.status_code == 202:
+            return None
+        if response.status_code == 304:
+            if entry is None:
+                raise GitHubAPIError(f"Unexpected 304 Not Modified for {endpoint}")
+            self._trace_cache(cache_key, "revalidate")
+            data = entry.data
+        else:
+            self._trace_cache(cache_key, "miss")
+            # Empty repositories answer 204 No Content
+            data = response.json() if response.content else []
+
+        if self.use_cache:
+            self.cache.set(cache_key, data, etag=response.headers.get("ETag"))
+        return data
+
     def close(self):
         """Close HTTP client."""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
         self.client.close()
 
     def __enter__(self):
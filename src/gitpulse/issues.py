@@ -0,0 +1,241 @@
+"""Issue and pull request metrics from incrementally streamed issues.
+
+Issues are listed by update time, oldest first, starting at the watermark
+of the previous run (``since=``). Each issue updates running aggregates
+and is then dropped, so memory does not grow with the size of the repo:
+
+- open issues/PRs: number -> created_at, for the open-age distribution
+- closed issues/PRs: bitmaps of numbers (one bit per number), so
+  re-listed issues count only once
+- time to close and PR merge latency: quantile sketches
+
+The aggregates and watermark are cached under ``issues:{repo}`` without
+expiry. An issue that is reopened and closed again adds a second sample
+to the time-to-close sketch. Issues deleted or transferred while open
+never show up in the listing again, so they stay counted as open until a
+``full`` run rebuilds the aggregates.
+"""
+
+import base64
+import zlib
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+from .github_api import GitHubAPIError, GitHubClient
+from .models import IssueStats
+from .sketch import QuantileSketch
+
+QUANTILES = {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse GitHub ISO 8601 timestamp."""
+    return datetime.fromisoformat(value)
+
+
+def _hours(start: str, end: str) -> float:
+    return (_parse_timestamp(end) - _parse_timestamp(start)).total_seconds() / 3600
+
+
+class NumberBitmap:
+    """Set of issue numbers stored as a bitmap, one bit per number."""
+
+    def __init__(self, bits: bytes = b""):
+        """Initialize bitmap.
+
+        Args:
+            bits: Raw bitmap, bit ``n`` set for number ``n``
+        """
+        self.bits = bytearray(bits)
+        self.count = int.from_bytes(self.bits, "little").bit_count()
+
+    @classmethod
+    def from_state(cls, value: Union[str, list[int]]) -> "NumberBitmap":
+        """Load bitmap from :meth:`to_str` output or a list of numbers."""
+        if isinstance(value, str):
+            return cls(zlib.decompress(base64.b64decode(value)))
+        bitmap = cls()
+        for number in value:
+            bitmap.add(number)
+        return bitmap
+
+    def __contains__(self, number: int) -> bool:
+        index = number >> 3
+        return index < len(self.bits) and bool(self.bits[index] >> (number & 7) & 1)
+
+    def add(self, number: int) -> None:
+        """Add number if not present."""
+        if number in self:
+            return
+        index = number >> 3
+        if index >= len(self.bits):
+            self.bits.extend(bytes(index + 1 - len(self.bits)))
+        self.bits[index] |= 1 << (number & 7)
+        self.count += 1
+
+    def discard(self, number: int) -> None:
+        """Remove number if present."""
+        if number in self:
+            self.bits[number >> 3] &= ~(1 << (number & 7))
+            self.count -= 1
+
+    def to_str(self) -> str:
+        """Serialize to a compressed, base64 encoded string."""
+        return base64.b64encode(zlib.compress(bytes(self.bits))).decode("ascii")
+
+
+class IssueAggregator:
+    """Running issue and pull request aggregates."""
+
+    def __init__(self, state: Optional[dict] = None):
+        """Initialize aggregates, optionally from a saved state.
+
+        Args:
+            state: State returned by :meth:`to_state`
+        """
+        state = state or {}
+        issues = state.get("issues", {})
+        pulls = state.get("pulls", {})
+        self.watermark: Optional[str] = state.get("watermark")
+        self.open_issues = {int(n): ts for n, ts in issues.get("open", {}).items()}
+        self.closed_issues = NumberBitmap.from_state(issues.get("closed", []))
+        self.open_prs = {int(n): ts for n, ts in pulls.get("open", {}).items()}
+        self.closed_prs = NumberBitmap.from_state(pulls.get("closed", []))
+        self.merged_prs: int = pulls.get("merged", 0)
+        self.time_to_close = (
+            QuantileSketch.from_dict(state["time_to_close"])
+            if "time_to_close" in state
+            else QuantileSketch()
+        )
+        self.pr_merge = (
+            QuantileSketch.from_dict(state["pr_merge"]) if "pr_merge" in state else QuantileSketch()
+        )
+
+    def update(self, issue: dict) -> None:
+        """Apply an issue or pull request from the listing.
+
+        Updates are idempotent, so issues listed again by a later run
+        (at the watermark) are not counted twice.
+        """
+        number = issue["number"]
+        pull = issue.get("pull_request")
+        open_map, closed = (
+            (self.open_prs, self.closed_prs) if pull else (self.open_issues, self.closed_issues)
+        )
+
+        if issue["state"] == "closed":
+            open_map.pop(number, None)
+            if number not in closed:
+                closed.add(number)
+                if pull is None:
+                    self.time_to_close.add(_hours(issue["created_at"], issue["closed_at"]))
+                elif pull.get("merged_at"):
+                    self.merged_prs += 1
+                    self.pr_merge.add(_hours(issue["created_at"], pull["merged_at"]))
+        else:
+            closed.discard(number)
+            open_map[number] = issue["created_at"]
+
+        if self.watermark is None or issue["updated_at"] > self.watermark:
+            self.watermark = issue["updated_at"]
+
+    def to_state(self) -> dict:
+        """Serialize aggregates to a JSON-compatible dict."""
+        return {
+            "watermark": self.watermark,
+            "issues": {
+                "open": {str(n): ts for n, ts in self.open_issues.items()},
+                "closed": self.closed_issues.to_str(),
+            },
+            "pulls": {
+                "open": {str(n): ts for n, ts in self.open_prs.items()},
+                "closed": self.closed_prs.to_str(),
+                "merged": self.merged_prs,
+            },
+            "time_to_close": self.time_to_close.to_dict(),
+            "pr_merge": self.pr_merge.to_dict(),
+        }
+
+    def stats(self, repo: str, now: Optional[datetime] = None) -> IssueStats:
+        """Summarize aggregates.
+
+        Args:
+            repo: Repository in format 'owner/name'
+            now: Reference time for open-issue age (default: current UTC time)
+
+        Returns:
+            Issue and pull request metrics
+        """
+        now = now or datetime.now(timezone.utc)
+        open_age = QuantileSketch()
+        for created_at in self.open_issues.values():
+            open_age.add((now - _parse_timestamp(created_at)).total_seconds() / 86400)
+
+        return IssueStats(
+            repo=repo,
+            open_issues=len(self.open_issues),
+            closed_issues=self.closed_issues.count,
+            open_prs=len(self.open_prs),
+            merged_prs=self.merged_prs,
+            closed_prs=self.closed_prs.count - self.merged_prs,
+            time_to_close_hours=_quantiles(self.time_to_close),
+            pr_merge_hours=_quantiles(self.pr_merge),
+            open_age_days=_quantiles(open_age),
+            watermark=_parse_timestamp(self.watermark) if self.watermark else None,
+        )
+
+
+def _quantiles(sketch: QuantileSketch) -> dict[str, float]:
+    if sketch.count == 0:
+        return {}
+    return {name: round(sketch.quantile(q), 2) for name, q in QUANTILES.items()}
+
+
+def collect_issue_metrics(
+    client: GitHubClient,
+    repo: str,
+    full: bool = False,
+    now: Optional[datetime] = None,
+) -> IssueStats:
+    """Update issue metrics of a repository with issues changed since the last run.
+
+    Progress is saved even if a request fails midway, so the next run
+    resumes from the last processed page. Offline, the saved metrics are
+    reported as they are.
+
+    Args:
+        client: GitHub API client
+        repo: Repository in format 'owner/name'
+        full: Ignore saved aggregates and process every issue again
+        now: Reference time for open-issue age (default: current UTC time)
+
+    Returns:
+        Issue and pull request metrics
+
+    Raises:
+        GitHubAPIError: If a request fails or, offline, no metrics are saved
+    """
+    state_key = f"issues:{repo}"
+    state = None if full else client.cache.get(state_key)
+
+    if client.offline:
+        if state is None:
+            raise GitHubAPIError(f"Offline mode: issue metrics of '{repo}' are not cached")
+        return IssueAggregator(state).stats(repo, now=now)
+
+    aggregator = IssueAggregator(state)
+    updated = pages = 0
+    try:
+        for page in client.iter_issue_pages(repo, since=aggregator.watermark):
+            pages += 1
+            for issue in page:
+                aggregator.update(issue)
+                updated += 1
+    finally:
+        if pages:
+            client.cache.set(state_key, aggregator.to_state(), ttl_seconds=None)
+
+    stats = aggregator.stats(repo, now=now)
+    stats.updated = updated
+    stats.pages = pages
+    return stats
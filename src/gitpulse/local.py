@@ -0,0 +1,157 @@
+"""Commit activity of local clones, computed from ``git log`` without API calls.
+
+``git log`` output is streamed line by line, so memory stays flat for
+repositories with millions of commits. Results use the same
+:class:`~gitpulse.models.RepoActivity` model as the API statistics, with
+``source="local"``.
+"""
+
+import re
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from .models import RepoActivity
+
+WEEKS = 52
+
+# Commit lines start with a record separator, shortstat lines follow them
+_COMMIT_FORMAT = "--format=%x1e%ct%x09%aE"
+_INSERTIONS = re.compile(r"(\d+) insertions?\(\+\)")
+_DELETIONS = re.compile(r"(\d+) deletions?\(-\)")
+_GITHUB_REMOTE = re.compile(r"github\.com[:/]([^/]+/[^/]+?)(?:\.git)?/?$")
+
+
+class GitError(Exception):
+    """Raised when git fails on a local repository."""
+
+    pass
+
+
+def _git(path: Path, *args: str, stderr=subprocess.PIPE) -> subprocess.Popen:
+    try:
+        return subprocess.Popen(
+            ["git", "-C", str(path), *args],
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+        )
+    except FileNotFoundError as e:
+        raise GitError("git is not installed") from e
+
+
+def repo_name(path: Path) -> str:
+    """Guess 'owner/name' of a clone from its origin remote.
+
+    Falls back to the directory name for clones not hosted on GitHub.
+    """
+    proc = _git(path, "remote", "get-url", "origin")
+    url, _ = proc.communicate()
+    match = _GITHUB_REMOTE.search(url.strip())
+    return match.group(1) if match else path.resolve().name
+
+
+def _week_start(moment: datetime) -> datetime:
+    """Start of the week (Sunday 00:00 UTC), matching GitHub's commit activity."""
+    day = moment.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=(day.weekday() + 1) % 7)
+
+
+def analyze_local_repo(
+    path: Path,
+    repo: Optional[str] = None,
+    churn: bool = False,
+    now: Optional[datetime] = None,
+) -> RepoActivity:
+    """Compute commit activity of a local clone.
+
+    Args:
+        path: Working copy or bare repository
+        repo: Repository name to report (default: from the origin remote)
+        churn: Also count added and deleted lines, which makes git diff
+            every commit and is much slower on large histories
+        now: End of the weekly commit window (default: current time)
+
+    Returns:
+        Activity summary of the checked-out branch
+
+    Raises:
+        GitError: If git fails, e.g. the path is not a repository
+    """
+    path = Path(path).expanduser()
+    if not path.is_dir():
+        raise GitError(f"{path} is not a directory")
+
+    first_week = _week_start(now or datetime.now(timezone.utc)) - timedelta(weeks=WEEKS - 1)
+    window_start = first_week.timestamp()
+
+    activity = RepoActivity(
+        repo=repo or repo_name(path), weekly_commits=[0] * WEEKS, source="local"
+    )
+    authors: set[str] = set()
+    last_commit = None
+
+    args = ["log", _COMMIT_FORMAT]
+    if churn:
+        args.append("--shortstat")
+    # stderr goes to a file: a second pipe could fill up and block git while
+    # stdout is being drained
+    with (
+        tempfile.TemporaryFile("w+", encoding="utf-8", errors="replace") as errors,
+        _git(path, *args, stderr=errors) as proc,
+    ):
+        for line in proc.stdout:
+            if line.startswith("\x1e"):
+                timestamp, _, email = line[1:].rstrip("\n").partition("\t")
+                committed = int(timestamp)
+                activity.total_commits += 1
+                authors.add(email.lower())
+                if last_commit is None or committed > last_commit:
+                    last_commit = committed
+                if committed >= window_start:
+                    week = int((committed - window_start) // (7 * 86400))
+                    if week < WEEKS:
+                        activity.weekly_commits[week] += 1
+            elif line.strip():
+                insertions = _INSERTIONS.search(line)
+                deletions = _DELETIONS.search(line)
+                activity.additions += int(insertions.group(1)) if insertions else 0
+                activity.deletions += int(deletions.group(1)) if deletions else 0
+        proc.wait()
+        if proc.returncode != 0:
+            errors.seek(0)
+            raise GitError(f"{path}: {errors.read().strip()}")
+
+    activity.contributors = len(authors)
+    if last_commit is not None:
+        activity.last_commit_at = datetime.fromtimestamp(last_commit, tz=timezone.utc)
+    return activity
+
+
+def analyze_local_repos(
+    paths: list[Path], concurrency: int = 8, churn: bool = False
+) -> Iterator[tuple[Path, Union[RepoActivity, GitError]]]:
+    """Analyze many clones in parallel.
+
+    Args:
+        paths: Working copies or bare repositories
+        concurrency: Number of git processes to run at once
+        churn: Also count added and deleted lines
+
+    Yields:
+        Tuples of (path, activity or the error it failed with) in completion order
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(analyze_local_repo, path, churn=churn): path for path in paths
+        }
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except GitError as e:
+                yield futures[future], e
@@ -1,7 +1,7 @@
 """Pydantic models for GitHub API data."""
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -73,11 +73,136 @@ class TopRepo(BaseModel):
 class CacheEntry(BaseModel):
     """Cache entry with timestamp."""
 
-    data: dict
+    data: Union[dict, list]
     cached_at: datetime
-    ttl_seconds: int = 3600  # 1 hour default
+    ttl_seconds: Optional[int] = 3600  # 1 hour default, None = never expires
+    etag: Optional[str] = None
 
     def is_expired(self) -> bool:
         """Check if cache entry is expired."""
+        if self.ttl_seconds is None:
+            return False
         age = (datetime.now() - self.cached_at).total_seconds()
         return age > self.ttl_seconds
+
+
+class RepoChange(BaseModel):
+    """A change detected in a watched repository."""
+
+    repo: str
+    field: str
+    old: Optional[Union[int, str]] = None
+    new: Optional[Union[int, str]] = None
+    detected_at: datetime
+
+
+class SyncResult(BaseModel):
+    """Outcome of an incremental repository sync."""
+
+    owner: str
+    field: str
+    previous_watermark: Optional[datetime] = None
+    watermark: Optional[datetime] = None
+    refreshed: list[str] = Field(default_factory=list)
+    pages: int = 0
+
+
+class WarmManifest(BaseModel):
+    """Repositories and users to prefetch into the cache."""
+
+    repos: list[str] = Field(default_factory=list)
+    users: list[str] = Field(default_factory=list)
+    releases: bool = True
+
+
+class WarmResult(BaseModel):
+    """Outcome of a cache warm-up."""
+
+    fetched: int = 0
+    missing: list[str] = Field(default_factory=list)  # Jobs for resources that do not exist
+    failed: dict[str, str] = Field(default_factory=dict)
+
+
+class StarHistory(BaseModel):
+    """Star timestamps of a repository, oldest first."""
+
+    repo: str
+    starred_at: list[datetime] = Field(default_factory=list)
+    pages: int = 0
+    fetched: int = 0
+    cached: int = 0
+    complete: bool = True
+    truncated: bool = False  # Listing ended at GitHub's pagination limit
+
+
+class StarBucket(BaseModel):
+    """Stars gained in one period of a star-history timeline."""
+
+    period: date
+    stars: int
+    total: int
+
+
+class IssueStats(BaseModel):
+    """Issue and pull request metrics of a repository.
+
+    Duration quantiles are keyed by name (p50, p90, p99).
+    """
+
+    repo: str
+    open_issues: int = 0
+    closed_issues: int = 0
+    open_prs: int = 0
+    merged_prs: int = 0
+    closed_prs: int = 0  # Closed without merging
+    time_to_close_hours: dict[str, float] = Field(default_factory=dict)
+    pr_merge_hours: dict[str, float] = Field(default_factory=dict)
+    open_age_days: dict[str, float] = Field(default_factory=dict)
+    watermark: Optional[datetime] = None
+    updated: int = 0  # Issues processed by this run
+    pages: int = 0
+
+
+class RepoActivity(BaseModel):
+    """Commit activity summary of a repository.
+
+    ``weekly_commits`` covers the last 52 weeks, oldest first. Statistics
+    GitHub had not finished computing are listed in ``pending``.
+    """
+
+    repo: str
+    total_commits: int = 0
+    contributors: int = 0
+    weekly_commits: list[int] = Field(default_factory=list)
+    last_commit_at: Optional[datetime] = None
+    additions: int = 0
+    deletions: int = 0
+    source: str = "api"
+    pending: list[str] = Field(default_factory=list)
+
+
+class PlanStep(BaseModel):
+    """Requests that fetch a group of repositories the same way.
+
+    Routes: ``cache`` (fresh cache entries), ``revalidate`` (conditional
+    requests for expired entries with an ETag), ``rest`` (one request per
+    repo), ``listing`` (the owner's paginated repository listing) and
+    ``graphql`` (batched GraphQL queries).
+    """
+
+    route: str
+    owner: Optional[str] = None
+    repos: list[str] = Field(default_factory=list)
+    requests: int = 0
+
+
+class RequestPlan(BaseModel):
+    """Cheapest way found to fetch a set of repositories."""
+
+    steps: list[PlanStep] = Field(default_factory=list)
+    planning_requests: int = 0  # Owner profiles fetched to size listings
+
+    @property
+    def requests(self) -> int:
+        """Estimated requests to execute the plan."""
+        return sum(step.requests for step in self.steps)
@@ -0,0 +1,134 @@
+"""Row output in rich, plain and TSV formats.
+
+``rich`` renders a measured table once all rows are known. ``plain`` and
+``tsv`` stream each row straight to stdout with no layout work, so large
+outputs are I/O bound:
+
+- ``plain``: tab-separated values, no header, whitespace inside values
+  collapsed to single spaces
+- ``tsv``: header row, then tab-separated values with ``\\t``, ``\\n``,
+  ``\\r`` and ``\\\\`` escaped
+"""
+
+import re
+import sys
+from abc import ABC, abstractmethod
+from typing import Any, Optional, TextIO
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+OUTPUT_FORMATS = ("rich", "plain", "tsv")
+
+_WHITESPACE = re.compile(r"\s+")
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def resolve_format(fmt: Optional[str], stream: Optional[TextIO] = None) -> str:
+    """Pick output format, defaulting to rich on a terminal and plain otherwise.
+
+    Args:
+        fmt: Requested format, or None to detect it
+        stream: Output stream (default: current ``sys.stdout``)
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if fmt is None:
+        return "rich" if (stream or sys.stdout).isatty() else "plain"
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown format '{fmt}'. Use one of: {', '.join(OUTPUT_FORMATS)}")
+    return fmt
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+class RowWriter(ABC):
+    """Write rows of a fixed set of columns."""
+
+    def __init__(self, columns: list[str], stream: Optional[TextIO] = None):
+        self.columns = columns
+        # Resolved per writer so redirected stdout (e.g. in tests) is honored
+        self.stream = stream if stream is not None else sys.stdout
+
+    @abstractmethod
+    def write_row(self, *values: Any) -> None:
+        """Write one row."""
+
+    def flush(self) -> None:
+        """Push buffered rows to the output."""
+        self.stream.flush()
+
+    def close(self) -> None:
+        """Finish output."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class PlainRowWriter(RowWriter):
+    """Header-less tab-separated rows with whitespace collapsed."""
+
+    def write_row(self, *values: Any) -> None:
+        self.stream.write("\t".join(_WHITESPACE.sub(" ", _text(v)) for v in values) + "\n")
+
+
+class TSVRowWriter(RowWriter):
+    """Tab-separated rows with a header and escaped values."""
+
+    def __init__(self, columns: list[str], stream: Optional[TextIO] = None):
+        super().__init__(columns, stream)
+        self.stream.write("\t".join(columns) + "\n")
+
+    def write_row(self, *values: Any) -> None:
+        self.stream.write("\t".join(_text(v).translate(_TSV_ESCAPES) for v in values) + "\n")
+
+
+class RichRowWriter(RowWriter):
+    """Collect rows into a rich table rendered on close."""
+
+    def __init__(
+        self,
+        columns: list[str],
+        console: Console,
+        title: Optional[str] = None,
+        header_style: str = "bold cyan",
+    ):
+        super().__init__(columns)
+        self.console = console
+        self.table = Table(
+            title=title, box=box.ROUNDED, show_header=True, header_style=header_style
+        )
+        for i, column in enumerate(columns):
+            self.table.add_column(column, style="bold" if i == 0 else None)
+
+    def write_row(self, *values: Any) -> None:
+        self.table.add_row(*(_text(v) if v is not None else "-" for v in values))
+
+    def flush(self) -> None:
+        pass  # Tables can only be rendered once complete
+
+    def close(self) -> None:
+        self.console.print(self.table)
+
+
+def open_writer(
+    fmt: str,
+    columns: list[str],
+    console: Console,
+    title: Optional[str] = None,
+    stream: Optional[TextIO] = None,
+) -> RowWriter:
+    """Create row writer for a resolved output format."""
+    if fmt == "tsv":
+        return TSVRowWriter(columns, stream)
+    if fmt == "plain":
+        return PlainRowWriter(columns, stream)
+    return RichRowWriter(columns, console, title=title)
@@ -0,0 +1,292 @@
+"""Cost-based planning of repository fetches.
+
+A set of repositories can be fetched in very different ways:
+
+- ``cache``: fresh cache entries cost nothing
+- ``revalidate``: expired entries with an ETag are revalidated with a
+  conditional ``GET /repos/{repo}``; an unchanged repo answers ``304``,
+  which does not count against the rate limit
+- ``rest``: ``GET /repos/{repo}``, one request per repository
+- ``listing``: ``/users/{owner}/repos`` returns every repository of an
+  owner, 100 per page, with the same fields as ``/repos/{repo}``
+- ``graphql``: one query fetches up to 50 repositories of any owners
+  (needs a token)
+
+The remaining repositories are grouped by owner and each group takes its
+cheapest route. Listings are sized from the owner's ``public_repos``,
+which may cost one profile request per owner while planning. That request
+counts towards the listing, so it is only made if a listing could win.
+"""
+
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Optional
+
+from .cache import listing_entry
+from .github_api import GitHubAPIError, GitHubClient
+from .models import PlanStep, RepoStats, RequestPlan
+
+LISTING_PAGE_SIZE = 100
+GRAPHQL_BATCH_SIZE = 50
+
+_GRAPHQL_FIELDS = """
+    name
+    nameWithOwner
+    description
+    url
+    homepageUrl
+    stargazerCount
+    forkCount
+    diskUsage
+    createdAt
+    updatedAt
+    pushedAt
+    primaryLanguage { name }
+    defaultBranchRef { name }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+"""
+
+
+def _owner(repo: str) -> str:
+    owner, sep, name = repo.partition("/")
+    if not sep or not owner or not name:
+        raise ValueError(f"Invalid repository '{repo}'. Use 'owner/name'")
+    return owner
+
+
+def _listing_pages(client: GitHubClient, owner: str) -> Optional[int]:
+    """Pages in the owner's repository listing, or None if the owner is unknown."""
+    try:
+        public_repos = client.get_user_stats(owner).public_repos
+    except GitHubAPIError:
+        return None
+    return max(1, math.ceil(public_repos / LISTING_PAGE_SIZE))
+
+
+def plan_requests(
+    client: GitHubClient, repos: list[str], graphql: Optional[bool] = None
+) -> RequestPlan:
+    """Plan the cheapest way to fetch repositories.
+
+    Args:
+        client: GitHub API client
+        repos: Repositories in format 'owner/name'
+        graphql: Allow batched GraphQL queries (default: if a token is set)
+
+    Returns:
+        Plan with estimated requests per step
+
+    Raises:
+        ValueError: If a repository name is invalid
+    """
+    repos = list(dict.fromkeys(repos))
+    groups: dict[str, list[str]] = {}
+    for repo in repos:
+        groups.setdefault(_owner(repo), [])
+
+    plan = RequestPlan()
+    if client.offline:
+        plan.steps.append(PlanStep(route="cache", repos=repos))
+        return plan
+
+    entries = client.cache.get_many([f"repo:{r}" for r in repos]) if client.use_cache else {}
+    cached = []
+    revalidate = []
+    for repo in repos:
+        entry = entries.get(f"repo:{repo}")
+        if entry and not entry.is_expired():
+            cached.append(repo)
+        elif entry and entry.etag:
+            revalidate.append(repo)
+        else:
+            groups[_owner(repo)].append(repo)
+    if cached:
+        plan.steps.append(PlanStep(route="cache", repos=cached))
+    if revalidate:
+        plan.steps.append(PlanStep(route="revalidate", repos=revalidate, requests=len(revalidate)))
+
+    use_graphql = bool(client.token) if graphql is None else graphql
+    batched: list[str] = []
+    for owner, group in groups.items():
+        if not group:
+            continue
+        costs = {"rest": float(len(group))}
+        if use_graphql:
+            # Batches are shared between owners, so a repo costs a fraction of a query
+            costs["graphql"] = len(group) / GRAPHQL_BATCH_SIZE
+        # A listing costs at least one page plus the profile request sizing
+        # it, so only size it if that could win
+        profile_cost = 0 if client.cache.get(f"user:{owner}") is not None else 1
+        if min(costs.values()) > 1 + profile_cost:
+            pages = _listing_pages(client, owner)
+            plan.planning_requests += profile_cost
+            if pages is not None:
+                costs["listing"] = pages + profile_cost
+
+        route = min(costs, key=costs.get)
+        if route == "graphql":
+            batched.extend(group)
+        else:
+            requests = pages if route == "listing" else int(costs[route])
+            plan.steps.append(PlanStep(route=route, owner=owner, repos=group, requests=requests))
+
+    if batched:
+        plan.steps.append(
+            PlanStep(
+                route="graphql",
+                repos=batched,
+                requests=math.ceil(len(batched) / GRAPHQL_BATCH_SIZE),
+            )
+        )
+    return plan
+
+
+def _rest_shape(node: dict) -> dict:
+    """Map a GraphQL repository to the fields of ``GET /repos/{repo}``."""
+    return {
+        "name": node["name"],
+        "full_name": node["nameWithOwner"],
+        "description": node["description"],
+        "html_url": node["url"],
+        "homepage": node["homepageUrl"] or None,
+        "stargazers_count": node["stargazerCount"],
+        "watchers_count": node["stargazerCount"],  # REST reports stars as watchers
+        "forks_count": node["forkCount"],
+        "open_issues_count": node["issues"]["totalCount"] + node["pullRequests"]["totalCount"],
+        "size": node["diskUsage"] or 0,
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "pushed_at": node["pushedAt"] or node["createdAt"],
+        "language": (node["primaryLanguage"] or {}).get("name"),
+        "default_branch": (node["defaultBranchRef"] or {}).get("name", ""),
+        "topics": [t["topic"]["name"] for t in node["repositoryTopics"]["nodes"]],
+    }
+
+
+def _store(client: GitHubClient, repo: str, data: dict) -> RepoStats:
+    if client.use_cache:
+        client.cache.set(f"repo:{repo}", data)
+    return RepoStats(**data)
+
+
+def _fetch_listing(
+    client: GitHubClient, owner: str, repos: list[str]
+) -> tuple[dict[str, RepoStats], list[str]]:
+    """Fetch repos from the owner's listing, stopping once all were seen.
+
+    Every listed repository is cached, not just the requested ones. Listings
+    carry no per-repository ETag, so an existing entry keeps its ETag only
+    if the listing shows its data unchanged.
+    """
+    wanted = {repo.lower(): repo for repo in repos}
+    found: dict[str, RepoStats] = {}
+    try:
+        for page in client.iter_user_repo_pages(owner, sort="full_name"):
+            keys = {}
+            for data in page:
+                repo = wanted.get(data["full_name"].lower())
+                if repo is not None:
+                    found[repo] = RepoStats(**data)
+                keys[f"repo:{repo or data['full_name']}"] = data
+            if client.use_cache:
+                existing = client.cache.get_many(keys)
+                client.cache.set_many(
+                    {key: listing_entry(existing.get(key), data) for key, data in keys.items()}
+                )
+            if len(found) == len(repos):
+                break
+    except GitHubAPIError:
+        pass  # Missing repos fall back to per-repo requests
+    return found, [repo for repo in repos if repo not in found]
+
+
+def _fetch_graphql(
+    client: GitHubClient, repos: list[str]
+) -> tuple[dict[str, RepoStats], list[str]]:
+    """Fetch a batch of repos with one GraphQL query."""
+    params = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in range(len(repos)))
+    fields = "\n".join(
+        f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...repo }}" for i in range(len(repos))
+    )
+    query = f"query({params}) {{\n{fields}\n}}\nfragment repo on Repository {{{_GRAPHQL_FIELDS}}}"
+    variables = {}
+    for i, repo in enumerate(repos):
+        variables[f"o{i}"], _, variables[f"n{i}"] = repo.partition("/")
+
+    try:
+        data = client.graphql(query, variables)
+    except GitHubAPIError:
+        return {}, repos
+
+    found = {
+        repo: _store(client, repo, _rest_shape(data[f"r{i}"]))
+        for i, repo in enumerate(repos)
+        if data.get(f"r{i}")
+    }
+    return found, [repo for repo in repos if repo not in found]
+
+
+def _fetch_rest(
+    client: GitHubClient,
+    repo: str,
+    on_error: Optional[Callable[[str, GitHubAPIError], None]],
+) -> tuple[dict[str, RepoStats], list[str]]:
+    try:
+        return {repo: client.get_repo_stats(repo)}, []
+    except GitHubAPIError as e:
+        if on_error:
+            on_error(repo, e)
+        return {}, []
+
+
+def execute_plan(
+    client: GitHubClient,
+    plan: RequestPlan,
+    concurrency: int = 8,
+    on_error: Optional[Callable[[str, GitHubAPIError], None]] = None,
+) -> dict[str, RepoStats]:
+    """Fetch repositories following a plan.
+
+    Repositories a listing or GraphQL query did not return (e.g. private or
+    renamed ones) are fetched one by one, so the errors are reported per repo.
+
+    Args:
+        client: GitHub API client
+        plan: Plan from :func:`plan_requests`
+        concurrency: Parallel requests
+        on_error: Callback for repositories that could not be fetched
+
+    Returns:
+        Statistics by repository, in plan order
+    """
+    results: dict[str, RepoStats] = {}
+    missing: list[str] = []
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = []
+        for step in plan.steps:
+            if step.route == "listing":
+                futures.append(executor.submit(_fetch_listing, client, step.owner, step.repos))
+            elif step.route == "graphql":
+                for start in range(0, len(step.repos), GRAPHQL_BATCH_SIZE):
+                    batch = step.repos[start : start + GRAPHQL_BATCH_SIZE]
+                    futures.append(executor.submit(_fetch_graphql, client, batch))
+            else:
+                futures.extend(
+                    executor.submit(_fetch_rest, client, repo, on_error) for repo in step.repos
+                )
+
+        for future in as_completed(futures):
+            found, not_found = future.result()
+            results.update(found)
+            missing.extend(not_found)
+
+        for future in as_completed(
+            [executor.submit(_fetch_rest, client, repo, on_error) for repo in missing]
+        ):
+            results.update(future.result()[0])
+
+    order = [repo for step in plan.steps for repo in step.repos]
+    return {repo: results[repo] for repo in order if repo in results}
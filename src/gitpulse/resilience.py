@@ -0,0 +1,252 @@
+"""Retry, circuit breaker and hedging policies for GitHub API requests."""
+
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+import httpx
+
+# Methods that are safe to send more than once
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient failures."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504}),
+    ):
+        """Initialize retry policy.
+
+        Args:
+            max_attempts: Total attempts per request, including the first
+            backoff: Base delay in seconds, doubled per attempt
+            max_backoff: Longest delay between attempts in seconds
+            retry_statuses: HTTP statuses worth retrying
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before the next attempt.
+
+        Args:
+            attempt: Number of attempts made so far (1-based)
+            retry_after: Server-requested delay from a Retry-After header
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        ceiling = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        return random.uniform(0, ceiling)
+
+
+class CircuitOpenError(Exception):
+    """Raised when the circuit breaker rejects a request."""
+
+    pass
+
+
+class CircuitBreaker:
+    """Fail fast after repeated failures, probing again after a cooldown.
+
+    The breaker opens after ``failure_threshold`` consecutive failures.
+    Once ``reset_timeout`` has passed a single probe request is let
+    through; its success closes the breaker, its failure reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to stay open before probing
+            clock: Monotonic clock (for tests)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half-open."""
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def before_request(self) -> None:
+        """Check that a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or already probing
+        """
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return
+            if state == "half-open" and not self._probing:
+                self._probing = True
+                return
+        raise CircuitOpenError("GitHub API looks degraded, failing fast")
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """Free the probe slot of an attempt that ended without an outcome.
+
+        Called after every attempt; a no-op once success or failure was
+        recorded. Without it, a probe aborted by an unexpected exception
+        would keep the breaker rejecting requests forever.
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit past the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+            self._probing = False
+
+
+class RequestAttempts:
+    """Attempts of one request under a retry policy and circuit breaker.
+
+    Holds the retry decisions shared by the sync and async clients, which
+    only differ in how they send and sleep::
+
+        attempts = RequestAttempts(method, retry, circuit_breaker)
+        for attempt in attempts:
+            try:
+                with attempts.guard():
+                    response = send()
+                    attempts.record(response)
+            except httpx.RequestError:
+                delay = attempts.backoff(attempt)
+                if delay is None:
+                    raise
+                sleep(delay)
+                continue
+            delay = attempts.retry_delay(attempt, response)
+            if delay is None:
+                return response
+            response.close()
+            sleep(delay)
+    """
+
+    def __init__(self, method: str, retry: RetryPolicy, circuit_breaker: CircuitBreaker):
+        """Initialize attempts.
+
+        Args:
+            method: HTTP method; only idempotent requests are retried
+            retry: Retry policy
+            circuit_breaker: Circuit breaker every attempt goes through
+        """
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.max_attempts = retry.max_attempts if method.upper() in IDEMPOTENT_METHODS else 1
+
+    def __iter__(self) -> Iterator[int]:
+        """Attempt numbers (1-based)."""
+        return iter(range(1, self.max_attempts + 1))
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Let one attempt through the circuit breaker.
+
+        Connection errors and timeouts count as failures. The probe slot is
+        freed however the attempt ends, e.g. when it is cancelled.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or already probing
+        """
+        self.circuit_breaker.before_request()
+        try:
+            yield
+        except httpx.RequestError:
+            self.circuit_breaker.record_failure()
+            raise
+        finally:
+            self.circuit_breaker.release_probe()
+
+    def record(self, response: httpx.Response) -> None:
+        """Record the outcome of a response; server errors count as failures."""
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+
+    def backoff(self, attempt: int) -> Optional[float]:
+        """Delay before retrying a failed attempt, or None if none are left."""
+        if attempt >= self.max_attempts:
+            return None
+        return self.retry.delay(attempt)
+
+    def retry_delay(self, attempt: int, response: httpx.Response) -> Optional[float]:
+        """Delay before retrying a response, or None to return it.
+
+        A ``Retry-After`` header in seconds overrides the backoff.
+        """
+        if response.status_code not in self.retry.retry_statuses or attempt >= self.max_attempts:
+            return None
+        retry_after = response.headers.get("Retry-After")
+        return self.retry.delay(
+            attempt, float(retry_after) if retry_after and retry_after.isdigit() else None
+        )
+
+
+class LatencyTracker:
+    """Sliding window of request latencies for hedging thresholds."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        """Initialize tracker.
+
+        Args:
+            window: Number of recent latencies kept
+            min_samples: Samples needed before percentiles are reported
+        """
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        """Record a request latency."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency percentile, or None until enough samples were seen."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(pct / 100 * len(ordered)))
+        return ordered[index]
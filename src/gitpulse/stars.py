@@ -0,0 +1,206 @@
+"""Star-history timelines from the stargazers listing.
+
+Stargazers are listed oldest first, so every page before the last one is
+immutable and cached forever. A run fetches the first page it does not
+have, reads the ``rel="last"`` page number from its links, and fetches
+the remaining pages concurrently, never more than the rate limit allows.
+Reruns only pay for the newest pages.
+
+GitHub lists at most 400 pages (40,000 stargazers) and answers ``422`` for
+later pages, so the history of bigger repositories is partial.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+import httpx
+
+from .github_api import GitHubAPIError, GitHubClient
+from .models import StarBucket, StarHistory
+
+PER_PAGE = 100
+MAX_PAGES = 400
+INTERVALS = ("day", "week", "month")
+
+
+def _page_key(repo: str, page: int) -> str:
+    return f"stargazers:{repo}:{page}"
+
+
+def _beyond_page_limit(error: GitHubAPIError) -> bool:
+    """Check whether a request failed for being past the pagination limit."""
+    cause = error.__cause__
+    return isinstance(cause, httpx.HTTPStatusError) and cause.response.status_code == 422
+
+
+def fetch_star_history(
+    client: GitHubClient,
+    repo: str,
+    concurrency: int = 8,
+    full: bool = False,
+    max_requests: Optional[int] = None,
+) -> StarHistory:
+    """Collect the time of every star of a repository.
+
+    Complete pages are cached without expiry; the number of contiguous
+    complete pages is stored under ``stargazers:{repo}``. If the repo lost
+    enough stars for the listing to end before the cached pages do, the
+    history is rebuilt from scratch. Offline, only cached pages are used.
+
+    Args:
+        client: GitHub API client
+        repo: Repository in format 'owner/name'
+        concurrency: Parallel page requests
+        full: Ignore cached pages and refetch everything
+        max_requests: Most page requests to make (in addition to the rate limit)
+
+    Returns:
+        Star history; ``complete`` is False if some pages were not fetched,
+        and ``truncated`` is set if the listing hit GitHub's page limit
+
+    Raises:
+        GitHubAPIError: If a request fails or, offline, nothing is cached
+    """
+    meta_key = f"stargazers:{repo}"
+    meta = None if full else client.cache.get(meta_key)
+    known = meta["full_pages"] if meta else 0
+
+    keys = [_page_key(repo, page) for page in range(1, known + 1)]
+    entries = client.cache.get_many(keys)
+    pages = {page: entries[key].data for page, key in enumerate(keys, 1) if key in entries}
+    history = StarHistory(repo=repo, cached=len(pages))
+
+    if client.offline:
+        if not pages:
+            raise GitHubAPIError(f"Offline mode: star history of '{repo}' is not cached")
+        history.pages = known
+        history.complete = False
+        history.starred_at = _collect(pages, known)
+        return history
+
+    probe = known + 1
+    try:
+        first, last, remaining = client.get_stargazers_page(repo, probe, per_page=PER_PAGE)
+    except GitHubAPIError as e:
+        if not _beyond_page_limit(e):
+            raise
+        # Every listable page is cached already
+        history.pages = known
+        history.complete = False
+        history.truncated = True
+        history.starred_at = _collect(pages, known)
+        return history
+    history.fetched = 1
+    if last > MAX_PAGES:
+        last = MAX_PAGES
+        history.truncated = True
+    if not first and known:
+        # Either the listing ends exactly at a page boundary, or stars were
+        # removed and cached pages shifted; in that case start over
+        tail, _, _ = client.get_stargazers_page(repo, known, per_page=PER_PAGE)
+        history.fetched += 1
+        if len(tail) < PER_PAGE:
+            return fetch_star_history(
+                client, repo, concurrency, full=True, max_requests=max_requests
+            )
+        last = probe
+
+    pages[probe] = _starred_at(first)
+    fetched = {probe}
+
+    # Complete pages cached past a page an earlier run failed to fetch
+    later = {_page_key(repo, page): page for page in range(probe + 1, last)}
+    for key, entry in client.cache.get_many(later).items():
+        pages[later[key]] = entry.data
+        history.cached += 1
+
+    missing = [p for p in range(1, last + 1) if p not in pages]
+    budget = len(missing)
+    if remaining is not None:
+        budget = min(budget, remaining)
+    if max_requests is not None:
+        budget = min(budget, max(max_requests - 1, 0))
+
+    def fetch(page: int) -> list[str]:
+        stargazers, _, _ = client.get_stargazers_page(repo, page, per_page=PER_PAGE)
+        return _starred_at(stargazers)
+
+    error: Optional[GitHubAPIError] = None
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {page: executor.submit(fetch, page) for page in missing[:budget]}
+        for page, future in futures.items():
+            try:
+                pages[page] = future.result()
+                fetched.add(page)
+                history.fetched += 1
+            except GitHubAPIError as e:
+                if _beyond_page_limit(e):
+                    last = min(last, page - 1)
+                    history.truncated = True
+                else:
+                    error = error or e
+
+    # Pages before the last are complete and never change; with a truncated
+    # listing, the last one is full as well
+    complete = last if history.truncated else last - 1
+    for page in sorted(fetched):
+        if page <= complete:
+            client.cache.set(_page_key(repo, page), pages[page], ttl_seconds=None)
+    full_pages = 0
+    while full_pages < complete and full_pages + 1 in pages:
+        full_pages += 1
+    client.cache.set(meta_key, {"full_pages": full_pages}, ttl_seconds=None)
+
+    if error is not None:
+        raise error
+
+    history.pages = last
+    history.complete = not history.truncated and len(pages) >= last
+    history.starred_at = _collect(pages, last)
+    return history
+
+
+def _starred_at(stargazers: list[dict]) -> list[str]:
+    """Keep only the star timestamps of a stargazers page."""
+    return [s["starred_at"] for s in stargazers if s.get("starred_at")]
+
+
+def _collect(pages: dict[int, list[str]], last: int) -> list[datetime]:
+    """Flatten pages 1..last into star times, skipping missing pages."""
+    return [datetime.fromisoformat(ts) for page in range(1, last + 1) for ts in pages.get(page, [])]
+
+
+def _period_start(moment: datetime, interval: str) -> date:
+    day = moment.date()
+    if interval == "week":
+        return day - timedelta(days=day.weekday())
+    if interval == "month":
+        return day.replace(day=1)
+    return day
+
+
+def star_timeline(starred_at: list[datetime], interval: str = "week") -> list[StarBucket]:
+    """Bucket star times into a cumulative timeline.
+
+    Args:
+        starred_at: Star times, in any order
+        interval: Bucket size ('day', 'week' or 'month'); weeks start on Monday
+
+    Returns:
+        Buckets with stars gained, oldest first, skipping empty periods
+    """
+    if interval not in INTERVALS:
+        raise ValueError(f"Unknown interval '{interval}'. Use one of: {', '.join(INTERVALS)}")
+
+    counts: dict[date, int] = {}
+    for moment in starred_at:
+        period = _period_start(moment, interval)
+        counts[period] = counts.get(period, 0) + 1
+
+    timeline = []
+    total = 0
+    for period in sorted(counts):
+        total += counts[period]
+        timeline.append(StarBucket(period=period, stars=counts[period], total=total))
+    return timeline
@@ -0,0 +1,170 @@
+"""Repository statistics from GitHub's ``/stats/*`` endpoints.
+
+GitHub computes these statistics in the background and answers ``202
+Accepted`` until they are ready, which can take from seconds to minutes
+per repository. Instead of waiting on each repository in turn, the
+scheduler sends every request up front, so GitHub warms all of them in
+parallel, then re-polls pending ones from a heap ordered by due time
+with exponential backoff.
+"""
+
+import heapq
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Callable, Iterator, Optional
+
+from .github_api import GitHubAPIError, GitHubClient
+from .models import RepoActivity
+
+
+class StatsScheduler:
+    """Fetch statistics of many repositories, polling those still being computed."""
+
+    def __init__(
+        self,
+        client: GitHubClient,
+        repos: list[str],
+        kinds: tuple[str, ...] = GitHubClient.STATS_KINDS,
+        concurrency: int = 8,
+        initial_delay: float = 2.0,
+        max_delay: float = 60.0,
+        backoff: float = 2.0,
+        timeout: float = 300.0,
+        on_error: Optional[Callable[[str, GitHubAPIError], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize scheduler.
+
+        Args:
+            client: GitHub API client
+            repos: Repositories in format 'owner/name'
+            kinds: Statistics to fetch for every repository
+            concurrency: Parallel requests
+            initial_delay: Seconds before polling a pending statistic again
+            max_delay: Longest delay between polls in seconds
+            backoff: Delay multiplier per poll
+            timeout: Seconds after which pending statistics are given up
+            on_error: Callback for failed requests
+            clock: Monotonic clock (for tests)
+            sleep: Sleep function (for tests)
+        """
+        self.client = client
+        self.repos = list(dict.fromkeys(repos))
+        self.kinds = kinds
+        self.concurrency = concurrency
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.timeout = timeout
+        self.on_error = on_error
+        self.clock = clock
+        self.sleep = sleep
+
+    def run(self) -> Iterator[tuple[str, dict[str, Optional[list]]]]:
+        """Fetch all statistics.
+
+        Yields:
+            Tuples of (repo, statistics by kind) as soon as every statistic
+            of the repository is ready. Statistics that failed or were still
+            pending at the timeout are None.
+        """
+        deadline = self.clock() + self.timeout
+        results: dict[str, dict[str, Optional[list]]] = {repo: {} for repo in self.repos}
+        order = itertools.count()
+        # (due time, tie breaker, repo, kind, delay before the next poll)
+        heap = [
+            (0.0, next(order), repo, kind, self.initial_delay)
+            for repo in self.repos
+            for kind in self.kinds
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while heap:
+                wait = heap[0][0] - self.clock()
+                if wait > 0:
+                    self.sleep(wait)
+
+                now = self.clock()
+                futures = {}
+                while heap and heap[0][0] <= now:
+                    _, _, repo, kind, delay = heapq.heappop(heap)
+                    future = executor.submit(self.client.get_repo_statistic, repo, kind)
+                    futures[future] = (repo, kind, delay)
+
+                for future in as_completed(futures):
+                    repo, kind, delay = futures[future]
+                    try:
+                        data = future.result()
+                    except GitHubAPIError as e:
+                        if self.on_error:
+                            self.on_error(repo, e)
+                        data = None
+                    else:
+                        due = self.clock() + delay
+                        if data is None and due < deadline:
+                            next_delay = min(delay * self.backoff, self.max_delay)
+                            heapq.heappush(heap, (due, next(order), repo, kind, next_delay))
+                            continue
+
+                    results[repo][kind] = data
+                    if len(results[repo]) == len(self.kinds):
+                        yield repo, results.pop(repo)
+
+
+def activity_from_stats(repo: str, stats: dict[str, Optional[list]]) -> RepoActivity:
+    """Summarize ``/stats/*`` data of a repository.
+
+    GitHub only reports the top 100 contributors, so ``total_commits`` of
+    larger projects is a lower bound.
+
+    Args:
+        repo: Repository in format 'owner/name'
+        stats: Statistics by kind, None where unavailable
+
+    Returns:
+        Activity summary
+    """
+    activity = RepoActivity(
+        repo=repo, pending=[kind for kind, data in stats.items() if data is None]
+    )
+
+    contributors = stats.get("contributors")
+    if contributors:
+        activity.contributors = len(contributors)
+        activity.total_commits = sum(c.get("total", 0) for c in contributors)
+
+    weeks = stats.get("commit_activity")
+    if weeks:
+        activity.weekly_commits = [week["total"] for week in weeks]
+        for week in reversed(weeks):
+            if week["total"]:
+                day = max(i for i, commits in enumerate(week["days"]) if commits)
+                activity.last_commit_at = datetime.fromtimestamp(
+                    week["week"] + day * 86400, tz=timezone.utc
+                )
+                break
+
+    frequency = stats.get("code_frequency")
+    if frequency:
+        activity.additions = sum(row[1] for row in frequency)
+        activity.deletions = -sum(row[2] for row in frequency)
+
+    return activity
+
+
+def fetch_activity(client: GitHubClient, repos: list[str], **kwargs) -> Iterator[RepoActivity]:
+    """Fetch activity summaries, yielding each repository once it is ready.
+
+    Args:
+        client: GitHub API client
+        repos: Repositories in format 'owner/name'
+        **kwargs: Additional arguments for :class:`StatsScheduler`
+
+    Yields:
+        Activity summaries in completion order
+    """
+    for repo, stats in StatsScheduler(client, repos, **kwargs).run():
+        yield activity_from_stats(repo, stats)
@@ -0,0 +1,117 @@
+"""Incremental repository sync driven by per-owner watermarks."""
+
+from datetime import datetime
+from typing import Optional
+
+from .cache import listing_entry
+from .github_api import GitHubClient
+from .models import CacheEntry, SyncResult
+
+# Watermark field -> sort order for the repos listing
+SYNC_FIELDS = {
+    "updated": "updated_at",
+    "pushed": "pushed_at",
+}
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse GitHub ISO 8601 timestamp."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def sync_owner_repos(
+    client: GitHubClient,
+    owner: str,
+    field: str = "updated",
+    full: bool = False,
+    ttl_seconds: Optional[int] = 86400,
+) -> SyncResult:
+    """Refresh cached repositories of an owner that changed since the last sync.
+
+    Repositories are listed newest first by ``field``. Listing stops at the
+    first repository older than the stored watermark, so a sync after a quiet
+    day costs a single request regardless of how many repos the owner has.
+
+    Repositories the listing did not reach have not changed since the last
+    sync, so their cache entries are kept alive with a fresh timestamp. A
+    listed repository whose cached data is unchanged keeps its ETag.
+
+    Args:
+        client: GitHub API client
+        owner: GitHub user or organization
+        field: Watermark field ('updated' or 'pushed')
+        full: Ignore the stored watermark and refresh everything
+        ttl_seconds: Time-to-live for refreshed repo cache entries
+
+    Returns:
+        Sync result with refreshed repositories and new watermark
+    """
+    if field not in SYNC_FIELDS:
+        raise ValueError(f"Unknown sync field '{field}'. Use one of: {', '.join(SYNC_FIELDS)}")
+
+    api_field = SYNC_FIELDS[field]
+    watermark_key = f"watermark:{owner}:{field}"
+
+    stored = client.cache.get(watermark_key)
+    previous = None if full or not stored else _parse_timestamp(stored["watermark"])
+    known = set(stored.get("repos", [])) if previous is not None else set()
+
+    result = SyncResult(owner=owner, field=field, previous_watermark=previous)
+    newest = previous
+
+    for page in client.iter_user_repo_pages(owner, sort=field):
+        result.pages += 1
+        reached_watermark = False
+
+        changed = []
+        for repo in page:
+            changed_at = _parse_timestamp(repo.get(api_field))
+            # Repos at the watermark are refreshed again in case of same-second updates
+            if changed_at is None or (previous is not None and changed_at < previous):
+                reached_watermark = True
+                break
+
+            changed.append(repo)
+            if newest is None or changed_at > newest:
+                newest = changed_at
+
+        if changed:
+            keys = {f"repo:{repo['full_name']}": repo for repo in changed}
+            existing = client.cache.get_many(keys)
+            client.cache.set_many(
+                {
+                    key: listing_entry(existing.get(key), repo, ttl_seconds=ttl_seconds)
+                    for key, repo in keys.items()
+                }
+            )
+            result.refreshed.extend(repo["full_name"] for repo in changed)
+
+        if reached_watermark:
+            break
+
+    # Repos older than the watermark were not listed, as they have not changed
+    unchanged = client.cache.get_many(
+        [f"repo:{name}" for name in known.difference(result.refreshed)]
+    )
+    if unchanged:
+        client.cache.set_many(
+            {
+                key: CacheEntry(
+                    data=entry.data,
+                    cached_at=datetime.now(),
+                    ttl_seconds=ttl_seconds,
+                    etag=entry.etag,
+                )
+                for key, entry in unchanged.items()
+            }
+        )
+
+    result.watermark = newest
+    if newest is not None:
+        client.cache.set(
+            watermark_key,
+            {"watermark": newest.isoformat(), "repos": sorted(known.union(result.refreshed))},
+            ttl_seconds=None,
+        )
+
+    return result
@@ -0,0 +1,252 @@
+"""Request instrumentation: timings, payload sizes, cache outcomes and quota."""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from pydantic import BaseModel, Field
+
+# httpx trace events that open and close each phase of a request
+_PHASES = {
+    "connect": "connection.connect_tcp",
+    "tls": "connection.start_tls",
+    "send": "send_request_headers",
+    "wait": "receive_response_headers",
+    "transfer": "receive_response_body",
+}
+
+# Endpoint patterns collapsed for grouping, most specific first
+_ENDPOINT_PATTERNS = [
+    (re.compile(r"^/repos/[^/]+/[^/]+"), "/repos/{repo}"),
+    (re.compile(r"^/users/[^/]+"), "/users/{user}"),
+    (re.compile(r"^/orgs/[^/]+"), "/orgs/{org}"),
+]
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """Collapse owner/repo/user path segments so requests group by endpoint."""
+    path = "/" + endpoint.split("?", 1)[0].lstrip("/")
+    for pattern, replacement in _ENDPOINT_PATTERNS:
+        path = pattern.sub(replacement, path, count=1)
+    return path
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class TraceEvent(BaseModel):
+    """A traced HTTP request or cache lookup."""
+
+    kind: str  # "http" or "cache"
+    name: str
+    start: float  # Seconds since tracer start
+    duration: float = 0.0
+    thread_id: int
+    status: Optional[int] = None
+    bytes: int = 0
+    phases: dict[str, float] = Field(default_factory=dict)
+    cache: Optional[str] = None  # hit, shared, miss, revalidate, offline
+    rate_remaining: Optional[int] = None
+    error: Optional[str] = None
+
+
+class _PhaseRecorder:
+    """Collect phase timings from httpx's ``trace`` request extension."""
+
+    def __init__(self):
+        self._started: dict[str, float] = {}
+        self.phases: dict[str, float] = {}
+
+    def __call__(self, event_name: str, info: dict) -> None:
+        name, _, state = event_name.rpartition(".")
+        for phase, prefix in _PHASES.items():
+            if not name.endswith(prefix):
+                continue
+            if state == "started":
+                self._started[phase] = time.perf_counter()
+            elif state == "complete" and phase in self._started:
+                elapsed = time.perf_counter() - self._started.pop(phase)
+                self.phases[phase] = self.phases.get(phase, 0.0) + elapsed
+
+
+class Tracer:
+    """Record structured events for requests made by ``GitHubClient``."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """Initialize tracer.
+
+        Args:
+            clock: High resolution clock in seconds
+        """
+        self.clock = clock
+        self.origin = clock()
+        self.events: list[TraceEvent] = []
+        self._lock = threading.Lock()
+
+    def _add(self, event: TraceEvent) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def phase_recorder(self) -> _PhaseRecorder:
+        """Create recorder to pass as httpx ``trace`` extension."""
+        return _PhaseRecorder()
+
+    def record_request(
+        self,
+        method: str,
+        endpoint: str,
+        started: float,
+        status: Optional[int] = None,
+        size: int = 0,
+        phases: Optional[dict[str, float]] = None,
+        rate_remaining: Optional[int] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a finished HTTP request.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            started: Clock value when the request started
+            status: HTTP status code (None if no response)
+            size: Response body size in bytes
+            phases: Phase timings in seconds
+            rate_remaining: Remaining rate limit reported by GitHub
+            error: Error message for failed requests
+        """
+        self._add(
+            TraceEvent(
+                kind="http",
+                name=f"{method} {normalize_endpoint(endpoint)}",
+                start=started - self.origin,
+                duration=self.clock() - started,
+                thread_id=threading.get_ident(),
+                status=status,
+                bytes=size,
+                phases=phases or {},
+                rate_remaining=rate_remaining,
+                error=error,
+            )
+        )
+
+    def record_cache(self, key: str, outcome: str) -> None:
+        """Record a cache lookup outcome (hit, shared, miss, revalidate, offline)."""
+        self._add(
+            TraceEvent(
+                kind="cache",
+                name=key.split(":", 1)[0],
+                start=self.clock() - self.origin,
+                thread_id=threading.get_ident(),
+                cache=outcome,
+            )
+        )
+
+    def summary(self) -> list[dict]:
+        """Aggregate HTTP requests per endpoint.
+
+        Returns:
+            One row per endpoint with counts, latency and bytes, slowest first
+        """
+        groups: dict[str, list[TraceEvent]] = {}
+        for event in self.events:
+            if event.kind == "http":
+                groups.setdefault(event.name, []).append(event)
+
+        rows = []
+        for name, events in groups.items():
+            durations = [e.duration for e in events]
+            rows.append(
+                {
+                    "endpoint": name,
+                    "requests": len(events),
+                    "errors": sum(1 for e in events if e.error),
+                    "not_modified": sum(1 for e in events if e.status == 304),
+                    "total_ms": sum(durations) * 1000,
+                    "p50_ms": _percentile(durations, 50) * 1000,
+                    "p95_ms": _percentile(durations, 95) * 1000,
+                    "bytes": sum(e.bytes for e in events),
+                }
+            )
+        return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+    def cache_summary(self) -> dict[str, int]:
+        """Count cache lookups by outcome."""
+        counts: dict[str, int] = {}
+        for event in self.events:
+            if event.kind == "cache":
+                counts[event.cache] = counts.get(event.cache, 0) + 1
+        return counts
+
+    def rate_remaining(self) -> Optional[int]:
+        """Lowest remaining rate limit seen."""
+        remaining = [e.rate_remaining for e in self.events if e.rate_remaining is not None]
+        return min(remaining) if remaining else None
+
+    def chrome_trace(self) -> dict:
+        """Build Chrome trace event JSON (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+        trace_events = []
+
+        for event in self.events:
+            ts = event.start * 1_000_000
+            args = event.model_dump(exclude={"kind", "name", "start", "duration", "thread_id"})
+            if event.kind == "cache":
+                trace_events.append(
+                    {
+                        "name": f"cache {event.cache}: {event.name}",
+                        "cat": "cache",
+                        "ph": "i",
+                        "s": "t",
+                        "ts": ts,
+                        "pid": pid,
+                        "tid": event.thread_id,
+                        "args": args,
+                    }
+                )
+                continue
+
+            trace_events.append(
+                {
+                    "name": event.name,
+                    "cat": "http",
+                    "ph": "X",
+                    "ts": ts,
+                    "dur": event.duration * 1_000_000,
+                    "pid": pid,
+                    "tid": event.thread_id,
+                    "args": args,
+                }
+            )
+            # Lay phases out back to back inside the request span
+            offset = ts
+            for phase in _PHASES:
+                if phase in event.phases:
+                    dur = event.phases[phase] * 1_000_000
+                    trace_events.append(
+                        {
+                            "name": phase,
+                            "cat": "http.phase",
+                            "ph": "X",
+                            "ts": offset,
+                            "dur": dur,
+                            "pid": pid,
+                            "tid": event.thread_id,
+                        }
+                    )
+                    offset += dur
+
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write Chrome trace event JSON to a file."""
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
@@ -0,0 +1,89 @@
+"""Concurrent cache warm-up from a manifest."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable
+
+from .github_api import GitHubAPIError, GitHubClient
+from .models import WarmManifest, WarmResult
+
+
+def load_manifest(path: Path) -> WarmManifest:
+    """Load warm-up manifest.
+
+    JSON manifests follow the ``WarmManifest`` model. Any other file is read
+    as plain text with one entry per line: ``owner/name`` for repositories,
+    anything else for users. Blank lines and ``#`` comments are ignored.
+
+    Args:
+        path: Manifest file
+
+    Returns:
+        Parsed manifest
+    """
+    text = path.read_text(encoding="utf-8")
+
+    if path.suffix == ".json":
+        return WarmManifest(**json.loads(text))
+
+    manifest = WarmManifest()
+    for line in text.splitlines():
+        entry = line.split("#", 1)[0].strip()
+        if not entry:
+            continue
+        if "/" in entry:
+            manifest.repos.append(entry)
+        else:
+            manifest.users.append(entry.lstrip("@"))
+    return manifest
+
+
+def _warm_jobs(client: GitHubClient, manifest: WarmManifest) -> dict[str, Callable]:
+    """Build fetch jobs that populate every cache key the CLI commands read."""
+    jobs: dict[str, Callable] = {}
+
+    for repo in manifest.repos:
+        jobs[f"repo:{repo}"] = lambda repo=repo: client.get_repo_stats(repo)
+        if manifest.releases:
+            jobs[f"release:{repo}:latest"] = lambda repo=repo: client.get_latest_release(
+                repo, strict=True
+            )
+            jobs[f"releases:{repo}"] = lambda repo=repo: client.get_repo_releases(repo)
+
+    for user in manifest.users:
+        jobs[f"user:{user}"] = lambda user=user: client.get_user_stats(user)
+        jobs[f"repos:{user}"] = lambda user=user: client.get_top_repos(user)
+
+    return jobs
+
+
+def warm_cache(
+    client: GitHubClient, manifest: WarmManifest, concurrency: int = 8
+) -> WarmResult:
+    """Prefetch manifest entries into the cache concurrently.
+
+    Args:
+        client: GitHub API client
+        manifest: Entries to prefetch
+        concurrency: Number of parallel requests
+
+    Returns:
+        Warm-up result with failures keyed by job. Jobs for resources that
+        don't exist (a repo without releases) are listed as missing.
+    """
+    result = WarmResult()
+    jobs = _warm_jobs(client, manifest)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(job): name for name, job in jobs.items()}
+        for future in as_completed(futures):
+            try:
+                if future.result() is None:
+                    result.missing.append(futures[future])
+                else:
+                    result.fetched += 1
+            except GitHubAPIError as e:
+                result.failed[futures[future]] = str(e)
+
+    return result
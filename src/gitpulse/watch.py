@@ -0,0 +1,200 @@
+"""Adaptive polling of repositories with conditional requests."""
+
+import time
+from datetime import datetime
+from typing import Callable, Iterator, Optional
+
+import httpx
+
+from .github_api import GitHubAPIError, GitHubClient
+from .models import RepoChange
+
+# Repository fields reported by the watcher (snapshot name -> API field)
+WATCHED_FIELDS = {
+    "stars": "stargazers_count",
+    "forks": "forks_count",
+    "open_issues": "open_issues_count",
+}
+
+
+class _WatchedRepo:
+    """Polling state for a single repository."""
+
+    def __init__(self, repo: str, interval: float, next_due: float):
+        self.repo = repo
+        self.interval = interval
+        self.next_due = next_due
+        self.repo_etag: Optional[str] = None
+        self.release_etag: Optional[str] = None
+        self.release_skips = 0  # Polls left before checking releases again
+        self.snapshot: Optional[dict] = None
+
+
+class RepoWatcher:
+    """Poll repositories and report changed fields.
+
+    Every poll uses ETag-based conditional requests, which GitHub does not
+    count against the rate limit when nothing changed. Repositories that
+    change are polled more often; quiet ones back off towards
+    ``max_interval``. Repositories without releases answer ``404``, which
+    can't be made conditional, so their release check only runs every
+    ``release_recheck`` polls.
+    """
+
+    def __init__(
+        self,
+        client: GitHubClient,
+        repos: list[str],
+        min_interval: float = 60.0,
+        max_interval: float = 3600.0,
+        backoff: float = 2.0,
+        release_recheck: int = 10,
+        on_error: Optional[Callable[[str, GitHubAPIError], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize watcher.
+
+        Args:
+            client: GitHub API client
+            repos: Repositories in format 'owner/name'
+            min_interval: Shortest polling interval in seconds
+            max_interval: Longest polling interval in seconds
+            backoff: Interval multiplier for repos without changes
+            release_recheck: Check repos without releases every N polls
+            on_error: Callback for failed polls and release checks
+            clock: Monotonic clock (for tests)
+            sleep: Sleep function (for tests)
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.release_recheck = max(1, release_recheck)
+        self.on_error = on_error
+        self.clock = clock
+        self.sleep = sleep
+
+        # Stagger the first polls so large watch lists don't burst
+        now = clock()
+        step = min_interval / max(len(repos), 1)
+        self.repos = [
+            _WatchedRepo(repo, min_interval, now + i * step) for i, repo in enumerate(repos)
+        ]
+
+    def _fetch_snapshot(self, state: _WatchedRepo) -> dict:
+        """Fetch current snapshot of a repository, reusing unchanged parts."""
+        snapshot = dict(state.snapshot or {})
+
+        data, state.repo_etag = self.client.conditional_get(f"/repos/{state.repo}", state.repo_etag)
+        if data is not None:
+            for name, api_field in WATCHED_FIELDS.items():
+                snapshot[name] = data.get(api_field)
+            if self.client.use_cache:
+                self.client.cache.set(f"repo:{state.repo}", data, etag=state.repo_etag)
+
+        if state.release_skips > 0:
+            state.release_skips -= 1
+            return snapshot
+
+        try:
+            release, state.release_etag = self.client.conditional_get(
+                f"/repos/{state.repo}/releases/latest", state.release_etag
+            )
+            if release is not None:
+                snapshot["release"] = release.get("tag_name")
+        except GitHubAPIError as e:
+            cause = e.__cause__
+            if isinstance(cause, httpx.HTTPStatusError) and cause.response.status_code == 404:
+                # No releases yet; the 404 is not free, so check again later
+                snapshot.setdefault("release", None)
+                state.release_skips = self.release_recheck - 1
+            elif self.on_error:
+                # Keep the repo data of this poll and retry releases next time
+                self.on_error(state.repo, e)
+
+        return snapshot
+
+    def poll(self, state: _WatchedRepo) -> list[RepoChange]:
+        """Poll a single repository and reschedule it.
+
+        Args:
+            state: Repository polling state
+
+        Returns:
+            Changes since the previous poll (empty on the first poll)
+        """
+        try:
+            snapshot = self._fetch_snapshot(state)
+        except GitHubAPIError as e:
+            if self.on_error:
+                self.on_error(state.repo, e)
+            state.interval = min(state.interval * self.backoff, self.max_interval)
+            state.next_due = self.clock() + state.interval
+            return []
+
+        changes = []
+        if state.snapshot is not None:
+            detected_at = datetime.now()
+            for name, value in snapshot.items():
+                if name not in state.snapshot:
+                    continue  # Not known before, e.g. after a failed release check
+                old = state.snapshot[name]
+                if old != value:
+                    changes.append(
+                        RepoChange(
+                            repo=state.repo,
+                            field=name,
+                            old=old,
+                            new=value,
+                            detected_at=detected_at,
+                        )
+                    )
+        state.snapshot = snapshot
+
+        # Speed up for active repos, back off for quiet ones
+        if changes:
+            state.interval = max(state.interval / self.backoff, self.min_interval)
+        else:
+            state.interval = min(state.interval * self.backoff, self.max_interval)
+        state.next_due = self.clock() + state.interval
+
+        return changes
+
+    def poll_due(self) -> list[RepoChange]:
+        """Poll every repository that is due.
+
+        Returns:
+            Changes detected in this round
+        """
+        now = self.clock()
+        changes = []
+        for state in self.repos:
+            if state.next_due <= now:
+                changes.extend(self.poll(state))
+        return changes
+
+    def run(self, rounds: Optional[int] = None) -> Iterator[RepoChange]:
+        """Poll repositories until stopped.
+
+        Args:
+            rounds: Number of polling rounds (None = forever)
+
+        Yields:
+            Detected changes
+        """
+        if not self.repos:
+            return
+
+        completed = 0
+        while rounds is None or completed < rounds:
+            next_due = min(state.next_due for state in self.repos)
+            delay = next_due - self.clock()
+            if delay > 0:
+                self.sleep(delay)
+
+            yield from self.poll_due()
+            completed += 1
@@ -0,0 +1,49 @@
+"""Shared fixtures for the test suite."""
+
+import httpx
+import pytest
+
+from gitpulse.cache import CacheManager
+from gitpulse.github_api import GitHubClient
+from gitpulse.resilience import RetryPolicy
+
+
+class FakeClock:
+    """Manually advanced clock, recording every sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Clock starting at zero that only moves when slept on."""
+    return FakeClock()
+
+
+@pytest.fixture
+def make_client(tmp_path):
+    """Factory for clients answering from a fake API handler.
+
+    Clients share a file cache in ``tmp_path`` (unless ``use_cache=False``),
+    retry without backoff, and only use the given token, whatever
+    GITHUB_TOKEN says.
+    """
+
+    def make(handler, token="t", **kwargs) -> GitHubClient:
+        if kwargs.get("use_cache", True):
+            kwargs.setdefault("cache", CacheManager(tmp_path))
+        kwargs.setdefault("retry", RetryPolicy(max_attempts=3, backoff=0))
+        client = GitHubClient(token=token, transport=httpx.MockTransport(handler), **kwargs)
+        client.token = token  # Ignore GITHUB_TOKEN of the environment
+        return client
+
+    return make
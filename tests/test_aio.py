@@ -0,0 +1,172 @@
+"""Tests for the async GitHub client."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from gitpulse import aio
+from gitpulse.aio import AsyncGitHubClient
+from gitpulse.cache import CacheManager
+from gitpulse.github_api import GitHubAPIError
+from gitpulse.models import CacheEntry
+
+
+def repo_data(full_name: str) -> dict:
+    return {
+        "name": full_name.split("/")[1],
+        "full_name": full_name,
+        "stargazers_count": 7,
+        "forks_count": 1,
+        "watchers_count": 7,
+        "open_issues_count": 0,
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-02T00:00:00Z",
+        "pushed_at": "2024-01-02T00:00:00Z",
+        "size": 100,
+        "default_branch": "main",
+    }
+
+
+def user_data(login: str) -> dict:
+    return {
+        "login": login,
+        "public_repos": 3,
+        "public_gists": 0,
+        "followers": 10,
+        "following": 0,
+        "created_at": "2020-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "avatar_url": "",
+        "html_url": "",
+    }
+
+
+async def test_fetch_repos_is_concurrent_and_bounded(tmp_path):
+    """Repos are fetched in parallel up to the limit, errors don't fail the batch."""
+    in_flight = 0
+    peak = 0
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        requests.append(request.url.path)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={"message": "Not Found"})
+        return httpx.Response(200, json=repo_data(request.url.path.removeprefix("/repos/")))
+
+    repos = [f"owner/repo{i}" for i in range(6)] + ["owner/missing"]
+    async with AsyncGitHubClient(
+        token="t",
+        cache=CacheManager(tmp_path),
+        transport=httpx.MockTransport(handler),
+        concurrency=3,
+    ) as client:
+        results = await client.fetch_repos(repos)
+
+        assert list(results) == repos
+        assert results["owner/repo3"].stars == 7
+        assert isinstance(results["owner/missing"], GitHubAPIError)
+        assert peak == 3
+
+        # Found repos are cached, the missing one is asked for again
+        requests.clear()
+        results = await client.fetch_repos(repos)
+        assert requests == ["/repos/owner/missing"]
+        assert (await client.get_repo("owner/repo0")).full_name == "owner/repo0"
+
+
+async def test_fetch_users_revalidates_expired_entries(tmp_path):
+    """Expired entries with an ETag are revalidated with a conditional request."""
+    cache = CacheManager(tmp_path)
+    cache.set_entry(
+        "user:alice",
+        CacheEntry(
+            data=user_data("alice"),
+            cached_at=datetime.now() - timedelta(hours=2),
+            etag='"v1"',
+        ),
+    )
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        login = request.url.path.rsplit("/", 1)[1]
+        seen[login] = request.headers.get("If-None-Match")
+        if seen[login] == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json=user_data(login), headers={"ETag": '"v2"'})
+
+    async with AsyncGitHubClient(
+        token="t", cache=cache, transport=httpx.MockTransport(handler)
+    ) as client:
+        results = await client.fetch_users(["alice", "bob", "alice"])
+
+    assert list(results) == ["alice", "bob"]
+    assert results["alice"].followers == 10
+    assert seen == {"alice": '"v1"', "bob": None}
+    assert not cache.get_entry("user:alice").is_expired()
+    assert cache.get_entry("user:bob").etag == '"v2"'
+
+
+async def test_iter_org_repos_pages_lazily(tmp_path):
+    """Pages follow the next link, stop when the caller stops, and refresh the cache."""
+    pages = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        pages.append(page)
+        names = [f"org/repo{page}-{i}" for i in range(2)]
+        next_url = f"https://api.github.com/users/org/repos?per_page=2&page={page + 1}"
+        return httpx.Response(
+            200,
+            json=[repo_data(name) for name in names],
+            headers={"Link": f'<{next_url}>; rel="next"'},
+        )
+
+    cache = CacheManager(tmp_path)
+    stale = datetime.now() - timedelta(hours=2)
+    cache.set_entry(
+        "repo:org/repo1-0", CacheEntry(data=repo_data("org/repo1-0"), cached_at=stale, etag='"a"')
+    )
+    changed = {**repo_data("org/repo1-1"), "stargazers_count": 1}
+    cache.set_entry("repo:org/repo1-1", CacheEntry(data=changed, cached_at=stale, etag='"b"'))
+    async with AsyncGitHubClient(
+        token="t", cache=cache, transport=httpx.MockTransport(handler)
+    ) as client:
+        names = []
+        async for repo in client.iter_org_repos("org", per_page=2):
+            names.append(repo.full_name)
+            if len(names) == 3:
+                break
+
+    assert names == ["org/repo1-0", "org/repo1-1", "org/repo2-0"]
+    assert pages == [1, 2]
+    assert cache.get("repo:org/repo2-1")["stargazers_count"] == 7
+    # Unchanged repos keep their ETag, changed ones lose it
+    assert cache.get_entry("repo:org/repo1-0").etag == '"a"'
+    assert not cache.get_entry("repo:org/repo1-0").is_expired()
+    assert cache.get("repo:org/repo1-1")["stargazers_count"] == 7
+    assert cache.get_entry("repo:org/repo1-1").etag is None
+
+
+async def test_invalid_payload_fails_only_its_item(monkeypatch):
+    """An unexpected payload is returned as an error, and no cache is created."""
+    monkeypatch.setattr(aio, "get_cache", lambda: pytest.fail("cache opened"))
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/odd"):
+            return httpx.Response(200, json={"full_name": "owner/odd"})
+        return httpx.Response(200, json=repo_data(request.url.path.removeprefix("/repos/")))
+
+    async with AsyncGitHubClient(
+        token="t", use_cache=False, transport=httpx.MockTransport(handler)
+    ) as client:
+        results = await client.fetch_repos(["owner/odd", "owner/repo"])
+
+    assert isinstance(results["owner/odd"], GitHubAPIError)
+    assert results["owner/repo"].stars == 7
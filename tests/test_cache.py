@@ -0,0 +1,134 @@
+"""Tests for the file-based cache."""
+
+import json
+import socket
+import subprocess
+import sys
+import time
+
+from gitpulse.cache import CacheManager
+
+
+def test_keys_do_not_collide(tmp_path):
+    """Test that keys differing only in separators map to different files."""
+    cache = CacheManager(tmp_path)
+    cache.set("repo:a_b/c", {"n": 1})
+    cache.set("repo:a/b_c", {"n": 2})
+
+    assert cache.get("repo:a_b/c") == {"n": 1}
+    assert cache.get("repo:a/b_c") == {"n": 2}
+
+
+def test_entries_are_sharded_without_temp_leftovers(tmp_path):
+    """Test that entries land in shard directories and temp files are renamed."""
+    cache = CacheManager(tmp_path)
+    cache.set("user:someone", {"login": "someone"})
+
+    [path] = tmp_path.glob("*/*")
+    assert path.parent.name == path.name[:2]
+    assert json.loads(path.read_text())["key"] == "user:someone"
+
+
+def test_expired_entries_are_kept_for_revalidation(tmp_path):
+    """Test that expired entries are hidden from get but still on disk."""
+    cache = CacheManager(tmp_path)
+    cache.set("user:someone", {"login": "someone"}, ttl_seconds=-1, etag='"x"')
+
+    assert cache.get("user:someone") is None
+    assert cache.get_entry("user:someone").etag == '"x"'
+
+
+def test_migrate_legacy_layout(tmp_path):
+    """Test that flat-layout entries move to hashed shards."""
+    legacy = {
+        "repo_owner_my_repo.json": {"full_name": "owner/my_repo"},
+        "releases_owner_my_repo_5.json": [],
+        "watermark_owner_updated.json": {"watermark": "2024-01-01T00:00:00"},
+        "unknown_thing.json": {},
+    }
+    for name, data in legacy.items():
+        entry = {"data": data, "cached_at": "2024-01-01T00:00:00", "ttl_seconds": None}
+        (tmp_path / name).write_text(json.dumps(entry), encoding="utf-8")
+
+    cache = CacheManager(tmp_path)
+
+    assert list(tmp_path.glob("*.json")) == []
+    assert cache.get("repo:owner/my_repo") == {"full_name": "owner/my_repo"}
+    assert cache.get("releases:owner/my_repo:5") == []
+    assert cache.get("watermark:owner:updated") is not None
+
+
+def test_clear(tmp_path):
+    """Test clearing single keys and the whole cache."""
+    cache = CacheManager(tmp_path)
+    cache.set("user:a", {})
+    cache.set("user:b", {})
+
+    cache.clear("user:a")
+    assert cache.get("user:a") is None
+    cache.clear()
+    assert cache.get("user:b") is None
+
+
+def test_lease_is_exclusive(tmp_path):
+    """Test that a held lease blocks other holders until released."""
+    first = CacheManager(tmp_path)
+    second = CacheManager(tmp_path)
+
+    with first.lease("repo:a/b") as held:
+        assert held
+        with second.lease("repo:a/b", wait=0.1) as other:
+            assert not other
+
+    with second.lease("repo:a/b", wait=0) as held:
+        assert held
+
+
+def test_stale_lease_of_dead_process_is_broken(tmp_path):
+    """Test that a lease left by a crashed process is recovered."""
+    dead = subprocess.run(
+        [sys.executable, "-c", "import os; print(os.getpid())"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cache = CacheManager(tmp_path)
+    lock_path = cache._get_cache_path("repo:a/b").with_suffix(".lock")
+    lock_path.parent.mkdir(parents=True)
+    lease = {
+        "token": "x",
+        "pid": int(dead.stdout),
+        "host": socket.gethostname(),
+        "expires": time.time() + 3600,
+    }
+    lock_path.write_text(json.dumps(lease))
+
+    with cache.lease("repo:a/b", wait=0) as held:
+        assert held
+    assert not lock_path.exists()
+
+
+def test_racing_stale_lease_breakers(tmp_path, monkeypatch):
+    """Test that two waiters breaking the same stale lease don't both acquire it."""
+    first = CacheManager(tmp_path)
+    second = CacheManager(tmp_path)
+    lock_path = first._get_cache_path("repo:a/b").with_suffix(".lock")
+    lock_path.parent.mkdir(parents=True)
+    lock_path.write_text(json.dumps({"token": "x", "expires": 0}))
+
+    first_token = []
+    is_stale = CacheManager._lease_is_stale
+
+    def racing_is_stale(path):
+        if not first_token:
+            # The first waiter breaks the lease while the second judges it stale
+            first_token.append(first._acquire_lease("repo:a/b", 60))
+            return True
+        return is_stale(second, path)
+
+    monkeypatch.setattr(second, "_lease_is_stale", racing_is_stale)
+
+    assert second._acquire_lease("repo:a/b", 60) is None
+    assert first_token[0] is not None
+    assert json.loads(lock_path.read_text())["token"] == first_token[0]
+    assert list(lock_path.parent.iterdir()) == [lock_path]
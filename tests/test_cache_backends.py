@@ -0,0 +1,135 @@
+"""Tests for SQLite, remote and tiered cache backends."""
+
+from datetime import datetime
+
+import pytest
+from typer.testing import CliRunner
+
+from gitpulse.cache import CacheManager, open_cache
+from gitpulse.cache_remote import RemoteCacheBackend, TieredCache
+from gitpulse.cache_server import CacheServer
+from gitpulse.cache_sqlite import SQLiteCacheBackend
+from gitpulse.cli import app
+from gitpulse.models import CacheEntry
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Cache server backed by SQLite on a free local port."""
+    server = CacheServer(SQLiteCacheBackend(tmp_path / "server.sqlite3"), token="secret")
+    server.start()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture(params=["file", "sqlite", "remote"])
+def backend(request, tmp_path, server):
+    """Each backend implementation."""
+    if request.param == "file":
+        return CacheManager(tmp_path / "files")
+    if request.param == "sqlite":
+        return SQLiteCacheBackend(tmp_path / "cache.sqlite3")
+    return RemoteCacheBackend(server.url, token="secret")
+
+
+def test_backend_roundtrip(backend):
+    """Test the backend interface on every implementation."""
+    backend.set("repo:a/b", {"stars": 1}, etag='"e"')
+    backend.set("user:a", {"login": "a"}, ttl_seconds=None)
+
+    assert backend.get("repo:a/b") == {"stars": 1}
+    assert backend.get_entry("repo:a/b").etag == '"e"'
+    assert backend.get_entry("user:a").ttl_seconds is None
+    assert sorted(backend.scan("repo:")) == ["repo:a/b"]
+
+    entry = CacheEntry(data=[1, 2], cached_at=datetime.now())
+    backend.set_many({"releases:a/b:5": entry, "releases:a/c:5": entry})
+    many = backend.get_many(["releases:a/b:5", "releases:a/c:5", "missing"])
+    assert set(many) == {"releases:a/b:5", "releases:a/c:5"}
+
+    backend.delete("repo:a/b")
+    assert backend.get("repo:a/b") is None
+    backend.clear()
+    assert list(backend.scan()) == []
+
+
+def test_sqlite_lease_is_exclusive(tmp_path):
+    """Test that SQLite leases coordinate holders."""
+    first = SQLiteCacheBackend(tmp_path / "cache.sqlite3")
+    second = SQLiteCacheBackend(tmp_path / "cache.sqlite3")
+
+    with first.lease("repo:a/b") as held:
+        assert held
+        with second.lease("repo:a/b", wait=0) as other:
+            assert not other
+
+
+def test_tiered_cache_reads_through(tmp_path, server):
+    """Test that a machine reuses entries written by another machine."""
+    machine_a = TieredCache(CacheManager(tmp_path / "a"), RemoteCacheBackend(server.url, "secret"))
+    machine_b = TieredCache(CacheManager(tmp_path / "b"), RemoteCacheBackend(server.url, "secret"))
+
+    machine_a.set("repo:a/b", {"stars": 7})
+
+    assert machine_b.get("repo:a/b") == {"stars": 7}
+    assert machine_b.local.get("repo:a/b") == {"stars": 7}
+
+
+def test_tiered_clear_keeps_shared_tier(tmp_path, server):
+    """Test that clearing one machine's cache leaves the shared tier intact."""
+    machine = TieredCache(CacheManager(tmp_path / "a"), RemoteCacheBackend(server.url, "secret"))
+    machine.set("repo:a/b", {"stars": 7})
+
+    machine.clear()
+    assert machine.local.get("repo:a/b") is None
+    assert machine.shared.get("repo:a/b") == {"stars": 7}
+
+    machine.clear_shared()
+    assert machine.shared.get("repo:a/b") is None
+
+
+def test_remote_errors_are_misses(tmp_path, server):
+    """Test that an unreachable or unauthorized server behaves like a miss."""
+    unauthorized = RemoteCacheBackend(server.url, token="wrong")
+    unauthorized.set("repo:a/b", {"stars": 1})
+    assert unauthorized.get("repo:a/b") is None
+
+    unreachable = RemoteCacheBackend("http://127.0.0.1:9", timeout=0.5)
+    assert unreachable.get("repo:a/b") is None
+
+
+def test_open_cache_urls(tmp_path):
+    """Test backend selection from URLs."""
+    assert isinstance(open_cache(str(tmp_path / "files")), CacheManager)
+    assert isinstance(open_cache(f"sqlite://{tmp_path}/c.sqlite3"), SQLiteCacheBackend)
+    with pytest.raises(ValueError):
+        open_cache("redis://localhost")
+
+
+def test_open_cache_expands_home(tmp_path, monkeypatch):
+    """Test that ~ in a URL path refers to the home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    assert open_cache("sqlite:///~/c.sqlite3").path == tmp_path / "c.sqlite3"
+    assert open_cache("file://~/files").cache_dir == tmp_path / "files"
+
+
+def test_server_requires_token_off_loopback(tmp_path):
+    """Test that only loopback addresses may be served without a token."""
+    backend = SQLiteCacheBackend(tmp_path / "server.sqlite3")
+    with pytest.raises(ValueError, match="--token"):
+        CacheServer(backend, host="0.0.0.0")
+
+    for server in (
+        CacheServer(backend, host="0.0.0.0", token="secret"),
+        CacheServer(backend, host="0.0.0.0", insecure=True),
+        CacheServer(backend, host="localhost"),
+    ):
+        server.httpd.server_close()
+
+    result = CliRunner().invoke(
+        app,
+        ["cache", "serve", "--host", "0.0.0.0", "--store", f"sqlite://{tmp_path}/cli.sqlite3"],
+        env={"GITPULSE_CACHE_TOKEN": None},
+    )
+    assert result.exit_code == 1
+    assert "without a token" in result.output
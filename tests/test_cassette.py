@@ -0,0 +1,138 @@
+"""Tests for HTTP record/replay cassettes."""
+
+import httpx
+import pytest
+
+from gitpulse.cache import CacheManager
+from gitpulse.cassette import CassetteError, CassetteReader, CassetteWriter, ReplayTransport
+from gitpulse.github_api import GitHubAPIError, GitHubClient
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Echo the requested path and page back."""
+    page = request.url.params.get("page", "1")
+    return httpx.Response(
+        200, json={"path": request.url.path, "page": page}, headers={"ETag": f'"{page}"'}
+    )
+
+
+def test_record_then_replay(tmp_path):
+    """Test that recorded responses replay without the network."""
+    cassette = tmp_path / "run.cassette"
+    with GitHubClient(
+        token="secret",
+        use_cache=False,
+        transport=httpx.MockTransport(handler),
+        record=cassette,
+    ) as client:
+        client._request("GET", "/users/a", params={"page": 2, "per_page": 10})
+        client._request("GET", "/users/b")
+
+    assert b"secret" not in cassette.read_bytes()
+
+    with GitHubClient(token="t", use_cache=False, replay=cassette) as client:
+        # Query parameter order doesn't matter
+        data = client._request("GET", "/users/a", params={"per_page": 10, "page": 2})
+        assert data == {"path": "/users/a", "page": "2"}
+        assert client.conditional_get("/users/b")[1] == '"1"'
+
+        with pytest.raises(GitHubAPIError, match="Not in cassette"):
+            client._request("GET", "/users/c")
+
+
+def test_repeated_requests_replay_in_order(tmp_path):
+    """Test that repeated requests replay recordings in sequence."""
+    path = tmp_path / "seq.cassette"
+    writer = CassetteWriter(path)
+    request = httpx.Request("GET", "https://api.github.com/repos/a/b")
+    for stars in (1, 2):
+        writer.add(request, httpx.Response(200, json={"stars": stars}), 0.01)
+    writer.close()
+
+    transport = ReplayTransport(path)
+    with httpx.Client(transport=transport) as client:
+        bodies = [client.get("https://api.github.com/repos/a/b").json() for _ in range(3)]
+    assert bodies == [{"stars": 1}, {"stars": 2}, {"stars": 2}]
+
+
+def test_unfinished_cassette_is_scanned(tmp_path):
+    """Test that a cassette without index (interrupted recording) still loads."""
+    path = tmp_path / "partial.cassette"
+    writer = CassetteWriter(path)
+    for i in range(3):
+        request = httpx.Request("GET", f"https://api.github.com/users/u{i}")
+        writer.add(request, httpx.Response(200, json={"i": i}), 0.0)
+    writer._file.close()  # Simulate crash before the index is written
+
+    reader = CassetteReader(path)
+    assert len(reader) == 3
+    reader.close()
+
+
+def test_unknown_cassette_version_is_rejected(tmp_path):
+    """Test that cassettes of another format version fail clearly."""
+    path = tmp_path / "old.cassette"
+    writer = CassetteWriter(path)
+    writer.add(httpx.Request("GET", "https://api.github.com/users/u"), httpx.Response(200), 0.0)
+    writer.close()
+    path.write_bytes(b"GPCASS01" + path.read_bytes()[8:])
+
+    with pytest.raises(CassetteError, match="version 01"):
+        CassetteReader(path)
+
+    path.write_bytes(b"not a cassette")
+    with pytest.raises(CassetteError, match="Not a cassette"):
+        CassetteReader(path)
+
+
+def test_replay_serves_cached_client(tmp_path):
+    """Test that replay composes with the cache like a live transport."""
+    cassette = tmp_path / "run.cassette"
+    with GitHubClient(
+        token="t",
+        cache=CacheManager(tmp_path / "live"),
+        transport=httpx.MockTransport(handler),
+        record=cassette,
+    ) as client:
+        client.get_user_repos("a")
+
+    cache = CacheManager(tmp_path / "replay")
+    with GitHubClient(token="t", cache=cache, replay=cassette) as client:
+        assert client.get_user_repos("a")["path"] == "/users/a/repos"
+
+
+def test_replay_keys_on_accept_and_conditional(tmp_path):
+    """Test that media type and If-None-Match select different recordings."""
+    path = tmp_path / "keys.cassette"
+    url = "https://api.github.com/repos/a/b/stargazers"
+    writer = CassetteWriter(path)
+    writer.add(httpx.Request("GET", url), httpx.Response(200, json=["plain"]), 0.0)
+    writer.add(
+        httpx.Request("GET", url, headers={"Accept": GitHubClient.STAR_MEDIA_TYPE}),
+        httpx.Response(200, json=["starred"]),
+        0.0,
+    )
+    writer.add(
+        httpx.Request("GET", url, headers={"If-None-Match": '"1"'}), httpx.Response(304), 0.0
+    )
+    writer.close()
+
+    with httpx.Client(transport=ReplayTransport(path)) as client:
+        assert client.get(url).json() == ["plain"]
+        assert client.get(url, headers={"Accept": GitHubClient.STAR_MEDIA_TYPE}).json() == [
+            "starred"
+        ]
+        assert client.get(url, headers={"If-None-Match": '"2"'}).status_code == 304
+
+
+def test_not_modified_without_cached_entry_refetches(tmp_path):
+    """Test that a 304 with no entry to reuse falls back to a plain GET."""
+    responses = [httpx.Response(304), httpx.Response(200, json=[[0, 1, 2]])]
+
+    with GitHubClient(
+        token="t",
+        cache=CacheManager(tmp_path),
+        transport=httpx.MockTransport(lambda request: responses.pop(0)),
+    ) as client:
+        assert client.get_repo_statistic("a/b", "code_frequency") == [[0, 1, 2]]
+        assert not responses
@@ -1,6 +1,11 @@
 """Tests for GitHub API client."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 import pytest
+from gitpulse.cache import CacheManager
 from gitpulse.github_api import GitHubClient, GitHubAPIError
 
 
@@ -27,3 +32,26 @@ def test_load_token_from_env(monkeypatch):
 
 
 # Note: Add more comprehensive tests with mocked API responses in production
+
+
+def test_concurrent_misses_fetch_once(tmp_path):
+    """Test that clients sharing a cache directory fetch an expired key once."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        time.sleep(0.2)
+        return httpx.Response(200, json={"login": "someone"})
+
+    def fetch():
+        # Separate cache managers stand in for separate processes
+        with GitHubClient(
+            token="t", cache=CacheManager(tmp_path), transport=httpx.MockTransport(handler)
+        ) as client:
+            return client._cached_get("user:someone", "/users/someone")
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(lambda _: fetch(), range(5)))
+
+    assert len(calls) == 1
+    assert all(r == {"login": "someone"} for r in results)
@@ -0,0 +1,134 @@
+"""Tests for issue metrics and the quantile sketch."""
+
+import random
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from gitpulse.github_api import GitHubAPIError
+from gitpulse.issues import NumberBitmap, collect_issue_metrics
+from gitpulse.sketch import QuantileSketch
+
+NOW = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+
+def issue(number, state, created, updated, closed=None, merged=None, pull=False):
+    data = {
+        "number": number,
+        "state": state,
+        "created_at": created,
+        "updated_at": updated,
+        "closed_at": closed,
+    }
+    if pull:
+        data["pull_request"] = {"merged_at": merged}
+    return data
+
+
+class Issues:
+    """Fake issues listing filtered by ``since`` with two issues per page."""
+
+    def __init__(self, issues: list[dict]):
+        self.issues = issues
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        params = request.url.params
+        assert params["state"] == "all"
+        since = params.get("since", "")
+        matching = sorted(
+            (i for i in self.issues if i["updated_at"] >= since), key=lambda i: i["updated_at"]
+        )
+        page = int(params.get("page", "1"))
+        headers = {}
+        if page * 2 < len(matching):
+            headers["Link"] = f'<{request.url.copy_set_param("page", page + 1)}>; rel="next"'
+        return httpx.Response(200, json=matching[(page - 1) * 2 : page * 2], headers=headers)
+
+
+def test_quantile_sketch_relative_error():
+    """Quantiles stay within the relative accuracy and survive serialization."""
+    rng = random.Random(1)
+    values = [rng.expovariate(0.1) for _ in range(5000)]
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    restored = QuantileSketch.from_dict(sketch.to_dict())
+    ordered = sorted(values)
+    for q in (0.5, 0.9, 0.99):
+        exact = ordered[int(q * (len(ordered) - 1))]
+        assert restored.quantile(q) == pytest.approx(exact, rel=0.011)
+    assert len(sketch.bins) < 1000
+
+
+def test_number_bitmap_is_compact():
+    """Closed numbers are kept as a compressed bitmap and old list states still load."""
+    bitmap = NumberBitmap()
+    for number in range(1, 50001, 2):
+        bitmap.add(number)
+    bitmap.add(1)
+    bitmap.discard(3)
+
+    restored = NumberBitmap.from_state(bitmap.to_str())
+    assert restored.count == bitmap.count == 24999
+    assert 5 in restored and 3 not in restored and 4 not in restored
+    assert len(bitmap.to_str()) < 200
+    assert NumberBitmap.from_state([1, 7, 7]).count == 2
+
+
+def test_metrics_and_incremental_fetch(make_client):
+    """Second run fetches only updated issues and counts each close once."""
+    listing = Issues(
+        [
+            issue(
+                1, "closed", "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z",
+                closed="2024-01-01T10:00:00Z",
+            ),
+            issue(2, "open", "2024-02-01T00:00:00Z", "2024-02-01T00:00:00Z"),
+            issue(
+                3, "closed", "2024-01-05T00:00:00Z", "2024-01-06T00:00:00Z",
+                closed="2024-01-06T00:00:00Z", merged="2024-01-05T12:00:00Z", pull=True,
+            ),
+            issue(
+                4, "closed", "2024-01-07T00:00:00Z", "2024-01-08T00:00:00Z",
+                closed="2024-01-08T00:00:00Z", pull=True,
+            ),
+        ]
+    )
+    with make_client(listing) as client:
+        stats = collect_issue_metrics(client, "owner/repo", now=NOW)
+
+    assert (stats.open_issues, stats.closed_issues) == (1, 1)
+    assert (stats.merged_prs, stats.closed_prs, stats.open_prs) == (1, 1, 0)
+    assert stats.time_to_close_hours["p50"] == pytest.approx(10, rel=0.02)
+    assert stats.pr_merge_hours["p50"] == pytest.approx(12, rel=0.02)
+    assert stats.open_age_days["p50"] == pytest.approx(29, rel=0.02)
+    assert stats.pages == 2
+
+    # Issue 2 was closed since the first run
+    listing.issues[1] = issue(
+        2, "closed", "2024-02-01T00:00:00Z", "2024-02-03T00:00:00Z",
+        closed="2024-02-02T00:00:00Z",
+    )
+    listing.requests.clear()
+    with make_client(listing) as client:
+        stats = collect_issue_metrics(client, "owner/repo", now=NOW)
+
+    assert listing.requests[0].url.params["since"] == "2024-02-01T00:00:00Z"
+    assert stats.updated == 1
+    assert (stats.open_issues, stats.closed_issues) == (0, 2)
+    assert stats.merged_prs == 1
+
+    with make_client(listing, offline=True) as client:
+        offline = collect_issue_metrics(client, "owner/repo", now=NOW)
+    assert offline.closed_issues == 2
+
+
+def test_offline_without_saved_metrics(make_client):
+    """Offline mode fails fast when no metrics were saved."""
+    with make_client(Issues([]), offline=True) as client:
+        with pytest.raises(GitHubAPIError, match="not cached"):
+            collect_issue_metrics(client, "owner/repo")
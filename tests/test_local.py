@@ -0,0 +1,81 @@
+"""Tests for the local git-history analyzer."""
+
+import os
+import shutil
+import subprocess
+from datetime import datetime, timezone
+
+import pytest
+
+from gitpulse.badges import BadgeGenerator
+from gitpulse.local import GitError, analyze_local_repo, analyze_local_repos
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+NOW = datetime(2024, 3, 1, tzinfo=timezone.utc)
+
+
+def make_repo(path, commits: list[tuple[str, str]]):
+    """Create a repo with one commit per (ISO date, author email)."""
+    path.mkdir()
+    subprocess.run(["git", "init", "-q", str(path)], check=True)
+    subprocess.run(
+        ["git", "-C", str(path), "remote", "add", "origin", "git@github.com:owner/repo.git"],
+        check=True,
+    )
+    for i, (date, email) in enumerate(commits):
+        (path / "file.txt").write_text("line\n" * (i + 1))
+        env = {
+            **os.environ,
+            "GIT_AUTHOR_NAME": "dev",
+            "GIT_AUTHOR_EMAIL": email,
+            "GIT_COMMITTER_NAME": "dev",
+            "GIT_COMMITTER_EMAIL": email,
+            "GIT_AUTHOR_DATE": date,
+            "GIT_COMMITTER_DATE": date,
+        }
+        subprocess.run(["git", "-C", str(path), "add", "."], check=True, env=env)
+        subprocess.run(
+            ["git", "-C", str(path), "commit", "-q", "-m", f"commit {i}"], check=True, env=env
+        )
+    return path
+
+
+def test_analyze_local_repo(tmp_path):
+    """Commits, authors, weekly cadence and last commit come from git log."""
+    path = make_repo(
+        tmp_path / "repo",
+        [
+            ("2022-05-01T12:00:00+00:00", "a@example.com"),
+            ("2024-02-20T12:00:00+00:00", "b@example.com"),
+            ("2024-02-27T12:00:00+00:00", "A@example.com"),
+        ],
+    )
+
+    activity = analyze_local_repo(path, churn=True, now=NOW)
+
+    assert activity.repo == "owner/repo"
+    assert activity.source == "local"
+    assert activity.total_commits == 3
+    assert activity.contributors == 2
+    assert len(activity.weekly_commits) == 52
+    assert activity.weekly_commits[-2:] == [1, 1]
+    assert sum(activity.weekly_commits) == 2
+    assert activity.last_commit_at == datetime(2024, 2, 27, 12, tzinfo=timezone.utc)
+    assert activity.additions == 3
+
+    badges = BadgeGenerator.generate_full_set("owner/repo", activity=activity)
+    assert "commit_activity-2%2Fmonth" in badges
+    assert "last_commit-2024--02--27" in badges
+
+
+def test_analyze_many_repos_reports_errors(tmp_path):
+    """Clones are analyzed in parallel and failures don't stop the others."""
+    good = make_repo(tmp_path / "good", [("2024-02-20T12:00:00+00:00", "a@example.com")])
+    bad = tmp_path / "not-a-repo"
+    bad.mkdir()
+
+    results = dict(analyze_local_repos([good, bad], concurrency=2))
+
+    assert results[good].total_commits == 1
+    assert isinstance(results[bad], GitError)
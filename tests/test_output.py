@@ -0,0 +1,58 @@
+"""Tests for plain and TSV output."""
+
+import io
+from contextlib import redirect_stdout
+
+import pytest
+from rich.console import Console
+
+from gitpulse.output import RichRowWriter, open_writer, resolve_format
+
+
+def test_plain_collapses_whitespace():
+    """Plain rows have no header and keep one row per line."""
+    out = io.StringIO()
+    with open_writer("plain", ["repo", "description"], Console(), stream=out) as writer:
+        writer.write_row("owner/repo", "multi\nline\tdescription")
+        writer.write_row("owner/other", None)
+
+    assert out.getvalue() == "owner/repo\tmulti line description\nowner/other\t\n"
+
+
+def test_tsv_header_and_escaping():
+    """TSV output starts with a header and escapes separators."""
+    out = io.StringIO()
+    with open_writer("tsv", ["repo", "description"], Console(), stream=out) as writer:
+        writer.write_row("owner/repo", "a\tb\nc\\d")
+
+    assert out.getvalue() == "repo\tdescription\nowner/repo\ta\\tb\\nc\\\\d\n"
+
+
+def test_default_stream_follows_redirected_stdout():
+    """Writers use the stdout current at creation, not the one at import."""
+    out = io.StringIO()
+    with redirect_stdout(out):
+        with open_writer("plain", ["repo"], Console()) as writer:
+            writer.write_row("owner/repo")
+
+    assert out.getvalue() == "owner/repo\n"
+
+
+def test_rich_renders_on_close():
+    """Rich output is rendered as one table after the last row."""
+    console = Console(file=io.StringIO(), width=80)
+    writer = open_writer("rich", ["repo", "stars"], console, title="Repos")
+    assert isinstance(writer, RichRowWriter)
+
+    writer.write_row("owner/repo", 10)
+    assert console.file.getvalue() == ""
+    writer.close()
+    assert "owner/repo" in console.file.getvalue()
+
+
+def test_resolve_format():
+    """Default format depends on whether output is a terminal."""
+    assert resolve_format(None, io.StringIO()) == "plain"
+    assert resolve_format("tsv") == "tsv"
+    with pytest.raises(ValueError, match="Unknown format"):
+        resolve_format("csv")
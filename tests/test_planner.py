@@ -0,0 +1,213 @@
+"""Tests for the request planner."""
+
+import json
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+from gitpulse.models import CacheEntry
+from gitpulse.planner import execute_plan, plan_requests
+
+
+def repo_data(full_name: str) -> dict:
+    owner, name = full_name.split("/")
+    return {
+        "name": name,
+        "full_name": full_name,
+        "stargazers_count": len(name),
+        "forks_count": 1,
+        "watchers_count": len(name),
+        "open_issues_count": 0,
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-02T00:00:00Z",
+        "pushed_at": "2024-01-02T00:00:00Z",
+        "size": 100,
+        "default_branch": "main",
+    }
+
+
+def graphql_node(full_name: str) -> dict:
+    owner, name = full_name.split("/")
+    return {
+        "name": name,
+        "nameWithOwner": full_name,
+        "description": None,
+        "url": f"https://github.com/{full_name}",
+        "homepageUrl": "",
+        "stargazerCount": len(name),
+        "forkCount": 1,
+        "diskUsage": 100,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "pushedAt": "2024-01-02T00:00:00Z",
+        "primaryLanguage": {"name": "Python"},
+        "defaultBranchRef": {"name": "main"},
+        "repositoryTopics": {"nodes": [{"topic": {"name": "cli"}}]},
+        "issues": {"totalCount": 2},
+        "pullRequests": {"totalCount": 1},
+    }
+
+
+class FakeAPI:
+    """Owners with ``repo0..repoN`` repositories, listing 100 per page."""
+
+    def __init__(self, owners: dict[str, int]):
+        self.owners = owners
+        self.requests: list[str] = []
+
+    def exists(self, full_name: str) -> bool:
+        owner, name = full_name.split("/")
+        return owner in self.owners and name in {f"repo{i}" for i in range(self.owners[owner])}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.requests.append(f"{request.method} {path}")
+        parts = path.strip("/").split("/")
+
+        if path == "/graphql":
+            variables = json.loads(request.content)["variables"]
+            data = {}
+            for key in variables:
+                if key.startswith("o"):
+                    full_name = f"{variables[key]}/{variables['n' + key[1:]]}"
+                    data["r" + key[1:]] = (
+                        graphql_node(full_name) if self.exists(full_name) else None
+                    )
+            return httpx.Response(200, json={"data": data})
+
+        if parts[0] == "users" and len(parts) == 2:
+            return httpx.Response(
+                200,
+                json={
+                    "login": parts[1],
+                    "public_repos": self.owners[parts[1]],
+                    "public_gists": 0,
+                    "followers": 0,
+                    "following": 0,
+                    "created_at": "2020-01-01T00:00:00Z",
+                    "updated_at": "2024-01-01T00:00:00Z",
+                    "avatar_url": "",
+                    "html_url": "",
+                },
+            )
+
+        if parts[0] == "users":
+            owner = parts[1]
+            page = int(parse_qs(urlparse(str(request.url)).query).get("page", ["1"])[0])
+            names = sorted(f"{owner}/repo{i}" for i in range(self.owners[owner]))
+            headers = {}
+            if page * 100 < len(names):
+                next_url = f"https://api.github.com/users/{owner}/repos?page={page + 1}"
+                headers["Link"] = f'<{next_url}>; rel="next"'
+            body = [repo_data(n) for n in names[(page - 1) * 100 : page * 100]]
+            return httpx.Response(200, json=body, headers=headers)
+
+        full_name = f"{parts[1]}/{parts[2]}"
+        if not self.exists(full_name):
+            return httpx.Response(404, json={"message": "Not Found"})
+        return httpx.Response(200, json=repo_data(full_name))
+
+
+def test_plan_picks_cheapest_route_per_owner(make_client):
+    """Many repos of one owner use the listing, a lone repo a single request."""
+    api = FakeAPI({"big": 150, "solo": 3})
+    repos = [f"big/repo{i}" for i in range(0, 50, 10)] + ["solo/repo1", "solo/repo2"]
+
+    with make_client(api, token=None) as client:
+        client.cache.set("repo:solo/repo2", repo_data("solo/repo2"))
+        plan = plan_requests(client, repos)
+
+        routes = {step.route: step for step in plan.steps}
+        assert routes["cache"].repos == ["solo/repo2"]
+        assert routes["listing"].owner == "big"
+        assert routes["listing"].requests == 2
+        assert routes["rest"].repos == ["solo/repo1"]
+        assert plan.requests == 3
+        assert plan.planning_requests == 1
+
+        api.requests.clear()
+        results = execute_plan(client, plan)
+
+    assert list(results) == ["solo/repo2", *repos[:5], "solo/repo1"]
+    assert results["big/repo40"].stars == 6
+    # All wanted repos are on the first listing page, so the second is skipped
+    assert len(api.requests) == 2
+
+
+def test_profile_is_only_fetched_if_listing_can_win(make_client):
+    """Sizing a listing costs a profile request, which counts against the listing."""
+    api = FakeAPI({"big": 150})
+
+    with make_client(api, token=None) as client:
+        plan = plan_requests(client, ["big/repo1", "big/repo2"])
+
+        assert [(s.route, s.requests) for s in plan.steps] == [("rest", 2)]
+        assert plan.planning_requests == 0
+        assert api.requests == []
+
+        # Two pages plus the profile don't beat three requests
+        plan = plan_requests(client, ["big/repo1", "big/repo2", "big/repo3"])
+        assert [(s.route, s.requests) for s in plan.steps] == [("rest", 3)]
+        assert plan.planning_requests == 1
+
+        # Once the profile is cached, two pages do
+        plan = plan_requests(client, ["big/repo1", "big/repo2", "big/repo3"])
+        assert [(s.route, s.requests) for s in plan.steps] == [("listing", 2)]
+        assert plan.planning_requests == 0
+
+
+def test_graphql_batches_across_owners(make_client):
+    """With a token, repos of all owners share one GraphQL query."""
+    api = FakeAPI({"a": 5, "b": 5})
+    repos = ["a/repo1", "a/repo2", "b/repo3", "b/missing"]
+    errors = {}
+
+    with make_client(api) as client:
+        plan = plan_requests(client, repos)
+        assert [(s.route, s.requests) for s in plan.steps] == [("graphql", 1)]
+
+        results = execute_plan(client, plan, on_error=lambda repo, e: errors.update({repo: e}))
+
+        assert api.requests == ["POST /graphql", "GET /repos/b/missing"]
+        assert set(results) == {"a/repo1", "a/repo2", "b/repo3"}
+        assert results["b/repo3"].open_issues == 3
+        assert results["b/repo3"].topics == ["cli"]
+        assert "b/missing" in errors
+
+        # GraphQL results are cached in REST shape
+        assert client.get_repo_stats("a/repo1").stars == 5
+        assert len(api.requests) == 2
+
+
+def test_expired_entries_with_etag_are_revalidated(make_client):
+    """Expired entries with an ETag get conditional requests, and listings keep valid ETags."""
+    api = FakeAPI({"big": 150})
+    repos = [f"big/repo{i}" for i in range(5)]
+    stale = datetime.now() - timedelta(hours=2)
+
+    with make_client(api, token=None) as client:
+        for repo in ("big/repo0", "big/repo10"):
+            client.cache.set_entry(
+                f"repo:{repo}", CacheEntry(data=repo_data(repo), cached_at=stale, etag='"e"')
+            )
+        changed = {**repo_data("big/repo11"), "stargazers_count": 1}
+        client.cache.set_entry(
+            "repo:big/repo11", CacheEntry(data=changed, cached_at=stale, etag='"e"')
+        )
+        plan = plan_requests(client, repos)
+
+        assert [(s.route, s.repos) for s in plan.steps] == [
+            ("revalidate", ["big/repo0"]),
+            ("listing", repos[1:]),
+        ]
+
+        execute_plan(client, plan)
+        # Listed but not requested and unchanged: refreshed, and still revalidatable
+        entry = client.cache.get_entry("repo:big/repo10")
+        assert entry.etag == '"e"'
+        assert not entry.is_expired()
+        # Changed since cached: the old ETag does not describe the listed data
+        entry = client.cache.get_entry("repo:big/repo11")
+        assert entry.data == repo_data("big/repo11")
+        assert entry.etag is None
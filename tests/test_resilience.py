@@ -0,0 +1,143 @@
+"""Tests for retries, circuit breaking and hedged requests."""
+
+import threading
+
+import httpx
+import pytest
+
+from gitpulse.cassette import CassetteMissError
+from gitpulse.github_api import GitHubAPIError
+from gitpulse.resilience import CircuitBreaker, LatencyTracker, RequestAttempts, RetryPolicy
+
+
+def test_retry_policy_delay_is_bounded():
+    """Test that jittered delays stay within the exponential ceiling."""
+    policy = RetryPolicy(backoff=1.0, max_backoff=5.0)
+    assert 0 <= policy.delay(2) <= 2.0
+    assert policy.delay(10) <= 5.0
+    assert policy.delay(1, retry_after=3) == 3
+
+
+def test_transient_errors_are_retried(make_client):
+    """Test that 5xx responses and connection errors are retried."""
+    outcomes = [httpx.ConnectError("reset"), 503, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json={"ok": outcome == 200})
+
+    with make_client(handler) as client:
+        assert client._request("GET", "/rate_limit") == {"ok": True}
+    assert outcomes == []
+
+
+def test_non_idempotent_requests_are_not_retried(make_client):
+    """Test that POST requests get a single attempt."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(502)
+
+    with make_client(handler) as client:
+        with pytest.raises(GitHubAPIError, match="502"):
+            client._request("POST", "/graphql")
+    assert len(calls) == 1
+
+
+def test_circuit_breaker_fails_fast(make_client):
+    """Test that an open circuit rejects requests without sending them."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(500)
+
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    with make_client(handler, circuit_breaker=breaker) as client:
+        with pytest.raises(GitHubAPIError, match="degraded"):
+            client._request("GET", "/repos/a/b")
+        assert len(calls) == 2
+        assert breaker.state == "open"
+
+
+def test_circuit_breaker_half_open_probe():
+    """Test that one probe is allowed after the cooldown."""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    breaker.record_failure()
+    now[0] = 11
+
+    breaker.before_request()
+    assert breaker.state == "half-open"
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_aborted_probe_does_not_wedge_breaker(make_client):
+    """Test that a probe ending in an unexpected error frees the probe slot."""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    breaker.record_failure()
+    now[0] = 11
+    outcomes = [CassetteMissError("Not in cassette"), 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json={})
+
+    with make_client(handler, circuit_breaker=breaker) as client:
+        with pytest.raises(GitHubAPIError, match="Not in cassette"):
+            client._request("GET", "/rate_limit")
+        assert client._request("GET", "/rate_limit") == {}
+    assert breaker.state == "closed"
+
+
+def test_request_attempts_decisions():
+    """Test the retry decisions shared by the sync and async clients."""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    attempts = RequestAttempts("GET", RetryPolicy(max_attempts=2, backoff=0), breaker)
+    assert list(attempts) == [1, 2]
+    assert list(RequestAttempts("POST", RetryPolicy(), breaker)) == [1]
+
+    throttled = httpx.Response(429, headers={"Retry-After": "7"})
+    assert attempts.retry_delay(1, throttled) == 7
+    assert attempts.retry_delay(2, throttled) is None
+    assert attempts.retry_delay(1, httpx.Response(404)) is None
+    assert attempts.backoff(1) == 0
+    assert attempts.backoff(2) is None
+
+    # A probe failing with a connection error reopens the circuit
+    breaker.record_failure()
+    now[0] = 11
+    with pytest.raises(httpx.ConnectError):
+        with attempts.guard():
+            raise httpx.ConnectError("reset")
+    assert breaker.state == "open"
+
+
+def test_slow_request_is_hedged(make_client):
+    """Test that a duplicate request wins when the first one stalls."""
+    release = threading.Event()
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            release.wait(5)
+            return httpx.Response(200, json={"from": "primary"})
+        return httpx.Response(200, json={"from": "backup"})
+
+    client = make_client(handler, hedge_percentile=95)
+    client.latency = LatencyTracker(min_samples=1)
+    client.latency.record(0.01)
+
+    assert client._request("GET", "/repos/a/b") == {"from": "backup"}
+    assert client.hedged_requests == 1
+    release.set()
+    client.close()
@@ -0,0 +1,170 @@
+"""Tests for star-history timelines."""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+import httpx
+import pytest
+
+from gitpulse.github_api import GitHubAPIError, GitHubClient
+from gitpulse.resilience import RetryPolicy
+from gitpulse.stars import PER_PAGE, fetch_star_history, star_timeline
+
+START = datetime(2024, 1, 1)
+
+
+class Stargazers:
+    """Fake stargazers listing with one star per hour."""
+
+    def __init__(self, stars: int, remaining: int = 5000, max_page: Optional[int] = None):
+        self.stars = stars
+        self.remaining = remaining
+        self.max_page = max_page  # Pagination limit, answered with 422 beyond
+        self.failing: set[int] = set()  # Pages answered with 500
+        self.requested: list[int] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.headers["Accept"] == GitHubClient.STAR_MEDIA_TYPE
+        page = int(request.url.params["page"])
+        self.requested.append(page)
+        if self.max_page is not None and page > self.max_page:
+            return httpx.Response(422, json={"message": "pagination is limited"})
+        if page in self.failing:
+            return httpx.Response(500, json={"message": "Server Error"})
+        last = max(1, -(-self.stars // PER_PAGE))
+        first = (page - 1) * PER_PAGE
+        body = [
+            {"starred_at": (START + timedelta(hours=i)).isoformat(), "user": {"login": "u"}}
+            for i in range(first, min(first + PER_PAGE, self.stars))
+        ]
+        url = "https://api.github.com/repos/owner/repo/stargazers"
+        headers = {"X-RateLimit-Remaining": str(self.remaining)}
+        if page < last:
+            headers["Link"] = (
+                f'<{url}?page={page + 1}>; rel="next", <{url}?page={last}>; rel="last"'
+            )
+        return httpx.Response(200, json=body, headers=headers)
+
+
+def test_fetches_all_pages_and_reuses_them(make_client):
+    """Complete pages are cached, so a rerun only fetches the newest page onward."""
+    listing = Stargazers(stars=450)
+    with make_client(listing) as client:
+        history = fetch_star_history(client, "owner/repo", concurrency=4)
+
+    assert history.complete
+    assert history.pages == 5
+    assert len(history.starred_at) == 450
+    assert history.starred_at == sorted(history.starred_at)
+    assert sorted(listing.requested) == [1, 2, 3, 4, 5]
+
+    listing.stars = 620
+    listing.requested.clear()
+    with make_client(listing) as client:
+        history = fetch_star_history(client, "owner/repo")
+
+    assert listing.requested == [5, 6, 7]
+    assert history.cached == 4
+    assert len(history.starred_at) == 620
+
+
+def test_refetched_pages_are_cached_again(make_client):
+    """Complete pages fetched again, e.g. after eviction, go back into the cache."""
+    listing = Stargazers(stars=450)
+    with make_client(listing) as client:
+        fetch_star_history(client, "owner/repo")
+        client.cache.delete("stargazers:owner/repo:2")
+
+        listing.requested.clear()
+        fetch_star_history(client, "owner/repo")
+        assert listing.requested == [5, 2]
+
+        listing.requested.clear()
+        history = fetch_star_history(client, "owner/repo")
+
+    assert listing.requested == [5]
+    assert history.cached == 4
+
+
+def test_pages_after_a_failed_page_are_kept(make_client):
+    """Pages fetched past a failed one are cached and reused by the next run."""
+    listing = Stargazers(stars=450)
+    listing.failing = {2}
+    with make_client(listing, retry=RetryPolicy(max_attempts=1)) as client:
+        with pytest.raises(GitHubAPIError):
+            fetch_star_history(client, "owner/repo")
+
+        listing.failing.clear()
+        listing.requested.clear()
+        history = fetch_star_history(client, "owner/repo")
+
+    assert sorted(listing.requested) == [2, 5]
+    assert history.cached == 3
+    assert len(history.starred_at) == 450
+
+
+def test_stops_at_rate_limit(make_client):
+    """Pages beyond the remaining rate limit are left for the next run."""
+    listing = Stargazers(stars=1000, remaining=3)
+    with make_client(listing) as client:
+        history = fetch_star_history(client, "owner/repo")
+
+    assert not history.complete
+    assert len(listing.requested) == 4
+    assert len(history.starred_at) == 400
+
+    with make_client(listing, offline=True) as client:
+        offline = fetch_star_history(client, "owner/repo")
+    assert len(offline.starred_at) == 400
+
+
+def test_rebuilds_when_stars_removed(make_client):
+    """Cached pages beyond the end of a shrunken listing are dropped."""
+    listing = Stargazers(stars=350)
+    with make_client(listing) as client:
+        fetch_star_history(client, "owner/repo")
+
+        listing.stars = 150
+        history = fetch_star_history(client, "owner/repo")
+
+    assert history.pages == 2
+    assert len(history.starred_at) == 150
+
+
+def test_stops_at_pagination_limit(make_client):
+    """Pages past GitHub's limit end the history cleanly as truncated."""
+    listing = Stargazers(stars=1000, max_page=3)
+    with make_client(listing) as client:
+        history = fetch_star_history(client, "owner/repo")
+
+    assert history.truncated and not history.complete
+    assert history.pages == 3
+    assert len(history.starred_at) == 300
+
+    listing.requested.clear()
+    with make_client(listing) as client:
+        history = fetch_star_history(client, "owner/repo")
+
+    assert listing.requested == [4]
+    assert history.truncated
+    assert history.cached == 3
+    assert len(history.starred_at) == 300
+
+
+def test_star_timeline_buckets():
+    """Timeline counts stars per period with a running total."""
+    times = [
+        datetime(2024, 1, 1, 9),
+        datetime(2024, 1, 3),
+        datetime(2024, 1, 9),
+        datetime(2024, 2, 1),
+    ]
+
+    weekly = star_timeline(times, "week")
+    assert [(b.period.isoformat(), b.stars, b.total) for b in weekly] == [
+        ("2024-01-01", 2, 2),
+        ("2024-01-08", 1, 3),
+        ("2024-01-29", 1, 4),
+    ]
+    monthly = star_timeline(times, "month")
+    assert [(b.stars, b.total) for b in monthly] == [(3, 3), (1, 4)]
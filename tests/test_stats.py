@@ -0,0 +1,80 @@
+"""Tests for /stats/* polling."""
+
+import threading
+
+import httpx
+
+from gitpulse.stats import StatsScheduler, activity_from_stats
+
+WEEK = 1704585600  # 2024-01-07, a Sunday
+
+STATS = {
+    "contributors": [{"total": 30, "author": {"login": "a"}}, {"total": 12, "author": None}],
+    "commit_activity": [
+        {"week": WEEK, "total": 5, "days": [1, 0, 4, 0, 0, 0, 0]},
+        {"week": WEEK + 7 * 86400, "total": 2, "days": [0, 0, 0, 2, 0, 0, 0]},
+        {"week": WEEK + 14 * 86400, "total": 0, "days": [0] * 7},
+    ],
+    "code_frequency": [[WEEK, 100, -40], [WEEK + 7 * 86400, 20, -5]],
+}
+
+
+def stats_handler(warmup: dict[str, int]):
+    """Answer 202 for the first ``warmup[repo]`` requests of each statistic."""
+    calls: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        _, _, owner, name, _, kind = request.url.path.split("/")
+        with lock:
+            calls[request.url.path] = calls.get(request.url.path, 0) + 1
+            count = calls[request.url.path]
+        if count <= warmup.get(f"{owner}/{name}", 0):
+            return httpx.Response(202, json={})
+        return httpx.Response(200, json=STATS[kind])
+
+    return handler
+
+
+def test_ready_repos_do_not_wait_for_pending_ones(make_client, clock):
+    """Repos with ready statistics are yielded before slow ones finish warming up."""
+    handler = stats_handler({"owner/slow": 3})
+    with make_client(handler) as client:
+        scheduler = StatsScheduler(
+            client, ["owner/slow", "owner/fast"], clock=clock, sleep=clock.sleep
+        )
+        results = list(scheduler.run())
+
+    assert [repo for repo, _ in results] == ["owner/fast", "owner/slow"]
+    assert all(data is not None for _, stats in results for data in stats.values())
+    # Polls backed off: 2s, 4s, 8s
+    assert clock.sleeps == [2.0, 4.0, 8.0]
+
+    # Statistics are cached once ready
+    with make_client(stats_handler({"owner/slow": 99})) as client:
+        assert client.get_repo_statistic("owner/slow", "contributors") == STATS["contributors"]
+
+
+def test_gives_up_after_timeout(make_client, clock):
+    """Statistics still pending at the timeout are reported as unavailable."""
+    with make_client(stats_handler({"owner/slow": 99})) as client:
+        scheduler = StatsScheduler(
+            client, ["owner/slow"], timeout=10, clock=clock, sleep=clock.sleep
+        )
+        [(repo, stats)] = list(scheduler.run())
+
+    assert stats == {"contributors": None, "commit_activity": None, "code_frequency": None}
+    assert clock.now < 10
+    assert activity_from_stats(repo, stats).pending == list(stats)
+
+
+def test_activity_from_stats():
+    """Statistics are summarized into commit activity."""
+    activity = activity_from_stats("owner/repo", STATS)
+
+    assert activity.total_commits == 42
+    assert activity.contributors == 2
+    assert activity.weekly_commits == [5, 2, 0]
+    assert activity.last_commit_at.isoformat() == "2024-01-17T00:00:00+00:00"
+    assert (activity.additions, activity.deletions) == (120, 45)
+    assert activity.pending == []
@@ -0,0 +1,95 @@
+"""Tests for incremental repository sync."""
+
+from datetime import datetime, timedelta
+
+import httpx
+
+from gitpulse.models import CacheEntry
+from gitpulse.sync import sync_owner_repos
+
+
+def make_repo(name: str, updated_at: str) -> dict:
+    """Build minimal repository listing item."""
+    return {"full_name": f"owner/{name}", "updated_at": updated_at, "pushed_at": updated_at}
+
+
+def listing_api(repos, per_page=2):
+    """Create fake API handler listing repos newest first, and the requests it saw."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        page = int(request.url.params.get("page", 1))
+        items = repos[(page - 1) * per_page : page * per_page]
+        headers = {}
+        if page * per_page < len(repos):
+            headers["Link"] = (
+                f"<https://api.github.com/users/owner/repos?sort=updated&page={page + 1}>; "
+                'rel="next"'
+            )
+        return httpx.Response(200, json=items, headers=headers)
+
+    return handler, requests
+
+
+def test_first_sync_refreshes_all_pages(make_client):
+    """Test that a sync without watermark walks every page."""
+    repos = [make_repo(f"r{i}", f"2024-01-0{9 - i}T00:00:00Z") for i in range(5)]
+    handler, requests = listing_api(repos)
+    client = make_client(handler)
+
+    result = sync_owner_repos(client, "owner")
+
+    assert result.pages == 3
+    assert len(result.refreshed) == 5
+    assert client.cache.get("repo:owner/r0") == repos[0]
+    client.close()
+
+
+def test_incremental_sync_stops_at_watermark(make_client):
+    """Test that a second sync only fetches repos newer than the watermark."""
+    repos = [make_repo(f"r{i}", f"2024-01-0{9 - i}T00:00:00Z") for i in range(5)]
+    handler, requests = listing_api(repos, per_page=3)
+    client = make_client(handler)
+    sync_owner_repos(client, "owner")
+    requests.clear()
+
+    repos.insert(0, make_repo("new", "2024-02-01T00:00:00Z"))
+    result = sync_owner_repos(client, "owner")
+
+    assert len(requests) == 1
+    assert result.refreshed == ["owner/new", "owner/r0"]
+    assert result.watermark.isoformat() == "2024-02-01T00:00:00+00:00"
+    client.close()
+
+
+def test_sync_keeps_unchanged_entries_alive(make_client):
+    """Test that unchanged repos keep their ETag and stay fresh across syncs."""
+    repos = [make_repo(f"r{i}", f"2024-01-0{9 - i}T00:00:00Z") for i in range(5)]
+    handler, _ = listing_api(repos, per_page=3)
+    client = make_client(handler)
+    sync_owner_repos(client, "owner", ttl_seconds=60)
+
+    # Detailed fetches of r0 and r4, both cached with an ETag long ago
+    for name in ["r0", "r4"]:
+        repo = {**repos[int(name[1])], "subscribers_count": 3}
+        client.cache.set_entry(
+            f"repo:owner/{name}",
+            CacheEntry(data=repo, cached_at=datetime.now() - timedelta(hours=2), etag=f'"{name}"'),
+        )
+    repos.insert(0, make_repo("new", "2024-02-01T00:00:00Z"))
+    sync_owner_repos(client, "owner", ttl_seconds=60)
+
+    assert client.cache.get("repo:owner/r4")["subscribers_count"] == 3
+    assert client.cache.get_entry("repo:owner/r4").etag == '"r4"'
+    assert client.cache.get("repo:owner/r0")["subscribers_count"] == 3
+    assert client.cache.get_entry("repo:owner/r0").etag == '"r0"'
+
+    # A changed repo replaces the entry, without the stale ETag
+    repos[1] = make_repo("r0", "2024-02-02T00:00:00Z")
+    repos.insert(0, repos.pop(1))
+    sync_owner_repos(client, "owner", ttl_seconds=60)
+
+    assert client.cache.get("repo:owner/r0") == repos[0]
+    assert client.cache.get_entry("repo:owner/r0").etag is None
+    client.close()
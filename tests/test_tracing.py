@@ -0,0 +1,86 @@
+"""Tests for request tracing."""
+
+import json
+
+import httpx
+from typer.testing import CliRunner
+
+from gitpulse.cache import CacheManager
+from gitpulse.cli import app
+from gitpulse.github_api import GitHubClient
+from gitpulse.tracing import Tracer, normalize_endpoint
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Serve a user with rate limit headers."""
+    return httpx.Response(
+        200,
+        json={"login": "someone"},
+        headers={"ETag": '"abc"', "X-RateLimit-Remaining": "4999"},
+    )
+
+
+def test_normalize_endpoint():
+    """Test that endpoint paths group by shape."""
+    assert normalize_endpoint("/repos/a/b/releases/latest") == "/repos/{repo}/releases/latest"
+    assert normalize_endpoint("users/someone/repos?page=2") == "/users/{user}/repos"
+
+
+def test_tracer_records_requests_and_cache(tmp_path):
+    """Test that requests and cache outcomes are traced."""
+    tracer = Tracer()
+    with GitHubClient(
+        token="t",
+        cache=CacheManager(tmp_path),
+        transport=httpx.MockTransport(handler),
+        tracer=tracer,
+    ) as client:
+        client._cached_get("user:someone", "/users/someone")
+        client._cached_get("user:someone", "/users/someone")
+
+    [row] = tracer.summary()
+    assert row["endpoint"] == "GET /users/{user}"
+    assert row["requests"] == 1
+    assert row["bytes"] > 0
+    assert tracer.cache_summary() == {"hit": 1, "miss": 1}
+    assert tracer.rate_remaining() == 4999
+
+    path = tmp_path / "trace.json"
+    tracer.write_chrome_trace(path)
+    events = json.loads(path.read_text())["traceEvents"]
+    assert {e["cat"] for e in events} == {"http", "cache"}
+
+
+def test_profile_keeps_tsv_stdout_clean(tmp_path):
+    """Test that the profile goes to stderr when stdout carries rows."""
+    cassette = tmp_path / "c.cass"
+
+    def listing(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[{"full_name": "owner/a", "stargazers_count": 3}])
+
+    with GitHubClient(
+        token="t", use_cache=False, transport=httpx.MockTransport(listing), record=cassette
+    ) as client:
+        list(client.iter_user_repo_pages("owner", sort="updated"))
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "--replay",
+            str(cassette),
+            "--profile",
+            "--trace",
+            str(tmp_path / "trace.json"),
+            "--cache",
+            str(tmp_path / "cache"),
+            "repos",
+            "owner",
+            "--format",
+            "tsv",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.splitlines()[1:] == ["owner/a\t3\t\t\t\t\t"]
+    assert "Request Profile" in result.stderr
+    assert "Trace written" in result.stderr
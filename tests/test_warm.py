@@ -0,0 +1,99 @@
+"""Tests for cache warm-up and offline mode."""
+
+import httpx
+import pytest
+
+from gitpulse.cache import CacheManager
+from gitpulse.github_api import GitHubAPIError, GitHubClient
+from gitpulse.models import WarmManifest
+from gitpulse.warm import load_manifest, warm_cache
+
+REPO = {
+    "name": "repo",
+    "full_name": "owner/repo",
+    "stargazers_count": 10,
+    "forks_count": 1,
+    "watchers_count": 2,
+    "open_issues_count": 0,
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-02T00:00:00Z",
+    "pushed_at": "2024-01-02T00:00:00Z",
+    "size": 100,
+    "default_branch": "main",
+}
+RELEASE = {
+    "tag_name": "v1.0.0",
+    "published_at": "2024-01-02T00:00:00Z",
+    "html_url": "https://github.com/owner/repo/releases/v1.0.0",
+}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Serve a single repository with one release."""
+    path = request.url.path
+    if path == "/repos/owner/repo":
+        return httpx.Response(200, json=REPO)
+    if path == "/repos/owner/repo/releases/latest":
+        return httpx.Response(200, json=RELEASE)
+    if path == "/repos/owner/repo/releases":
+        return httpx.Response(200, json=[RELEASE])
+    return httpx.Response(404, json={"message": "Not Found"})
+
+
+def test_load_text_manifest(tmp_path):
+    """Test plain text manifest parsing."""
+    path = tmp_path / "manifest.txt"
+    path.write_text("# repos\nowner/repo\n@someone\n\nother  # comment\n", encoding="utf-8")
+
+    manifest = load_manifest(path)
+
+    assert manifest.repos == ["owner/repo"]
+    assert manifest.users == ["someone", "other"]
+
+
+def test_warm_then_offline(tmp_path):
+    """Test that warmed entries are served offline, even when expired."""
+    cache = CacheManager(tmp_path)
+    with GitHubClient(token="t", cache=cache, transport=httpx.MockTransport(handler)) as client:
+        result = warm_cache(client, WarmManifest(repos=["owner/repo"]), concurrency=4)
+    assert result.fetched == 3
+    assert result.failed == {}
+    assert result.missing == []
+
+    entry = cache.get_entry("repo:owner/repo")
+    cache.set("repo:owner/repo", entry.data, ttl_seconds=-1)
+
+    def no_network(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("offline client touched the network")
+
+    transport = httpx.MockTransport(no_network)
+    with GitHubClient(token="t", cache=cache, transport=transport, offline=True) as client:
+        assert client.get_repo_stats("owner/repo").stars == 10
+        assert client.get_latest_release("owner/repo").tag_name == "v1.0.0"
+        assert len(client.get_repo_releases("owner/repo")) == 1
+
+        with pytest.raises(GitHubAPIError, match="Offline mode"):
+            client.get_user_stats("nobody")
+
+
+def test_warm_reports_missing_and_failed_releases(tmp_path):
+    """Test that release errors are not counted as fetched entries."""
+
+    def releases_handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/releases/latest"):
+            status = 404 if "/bare/" in path else 403
+            return httpx.Response(status, json={"message": "No"})
+        if path.endswith("/releases"):
+            return httpx.Response(200, json=[])
+        return httpx.Response(200, json=REPO)
+
+    manifest = WarmManifest(repos=["owner/bare", "owner/broken"])
+    with GitHubClient(
+        token="t", cache=CacheManager(tmp_path), transport=httpx.MockTransport(releases_handler)
+    ) as client:
+        result = warm_cache(client, manifest, concurrency=2)
+
+    assert result.fetched == 4
+    assert result.missing == ["release:owner/bare:latest"]
+    assert list(result.failed) == ["release:owner/broken:latest"]
@@ -0,0 +1,117 @@
+"""Tests for repository watching."""
+
+import httpx
+
+from gitpulse.watch import RepoWatcher
+
+
+def repo_api(repo_state, release_statuses=None):
+    """Create fake API handler serving repo_state, and the requests it saw.
+
+    Release checks answer with release_statuses in turn, then 404.
+    """
+    calls = []
+    release_statuses = list(release_statuses or [])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.url.path.endswith("/releases/latest"):
+            status = release_statuses.pop(0) if release_statuses else 404
+            if status == 200:
+                return httpx.Response(200, json={"tag_name": "v1"})
+            return httpx.Response(status, json={"message": "Error"})
+        etag = f'"{repo_state["stargazers_count"]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json=repo_state, headers={"ETag": etag})
+
+    return handler, calls
+
+
+def test_watch_reports_only_changed_fields(make_client, clock):
+    """Test that only changed fields are reported."""
+    state = {"stargazers_count": 1, "forks_count": 0, "open_issues_count": 2}
+    handler, _ = repo_api(state)
+    client = make_client(handler)
+    watcher = RepoWatcher(client, ["owner/repo"], min_interval=10, clock=clock, sleep=clock.sleep)
+
+    assert list(watcher.run(rounds=1)) == []
+
+    state["stargazers_count"] = 5
+    changes = list(watcher.run(rounds=1))
+    assert [(c.field, c.old, c.new) for c in changes] == [("stars", 1, 5)]
+    client.close()
+
+
+def test_watch_backs_off_quiet_repos(make_client, clock):
+    """Test that unchanged repos are polled less often and use 304s."""
+    state = {"stargazers_count": 1, "forks_count": 0, "open_issues_count": 0}
+    handler, calls = repo_api(state)
+    client = make_client(handler)
+    watcher = RepoWatcher(
+        client, ["owner/repo"], min_interval=10, max_interval=40, clock=clock, sleep=clock.sleep
+    )
+
+    list(watcher.run(rounds=4))
+    assert watcher.repos[0].interval == 40
+    assert calls[-2].headers["If-None-Match"] == '"1"'
+    client.close()
+
+
+def test_watch_rechecks_missing_releases_rarely(make_client, clock):
+    """Test that repos without releases don't request them on every poll."""
+    state = {"stargazers_count": 1, "forks_count": 0, "open_issues_count": 0}
+    handler, calls = repo_api(state)
+    client = make_client(handler)
+    watcher = RepoWatcher(
+        client, ["owner/repo"], min_interval=10, release_recheck=3, clock=clock, sleep=clock.sleep
+    )
+
+    list(watcher.run(rounds=7))
+    release_calls = [c for c in calls if c.url.path.endswith("/releases/latest")]
+    assert len(release_calls) == 3  # Polls 1, 4 and 7
+    assert watcher.repos[0].snapshot["release"] is None
+    client.close()
+
+
+def test_watch_retries_failed_release_checks(make_client, clock):
+    """Test that only a 404 delays the release check, other errors are reported."""
+    state = {"stargazers_count": 1, "forks_count": 0, "open_issues_count": 0}
+    handler, calls = repo_api(state, release_statuses=[403, 200])
+    client = make_client(handler)
+    errors = []
+    watcher = RepoWatcher(
+        client,
+        ["owner/repo"],
+        min_interval=10,
+        release_recheck=3,
+        on_error=lambda repo, e: errors.append(repo),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+    list(watcher.run(rounds=1))
+    assert errors == ["owner/repo"]
+    assert watcher.repos[0].snapshot["stars"] == 1
+
+    # Checked again on the next poll; the first release is not a change
+    assert list(watcher.run(rounds=1)) == []
+    assert watcher.repos[0].snapshot["release"] == "v1"
+    release_calls = [c for c in calls if c.url.path.endswith("/releases/latest")]
+    assert len(release_calls) == 2
+    client.close()
+
+
+def test_cached_get_revalidates_expired_entry(make_client):
+    """Test that expired cache entries are revalidated with their ETag."""
+    state = {"stargazers_count": 3}
+    handler, calls = repo_api(state)
+    client = make_client(handler)
+    client.cache.set("repo:owner/repo", state, ttl_seconds=-1, etag='"3"')
+
+    data = client._cached_get("repo:owner/repo", "/repos/owner/repo")
+
+    assert data == state
+    assert calls[0].headers["If-None-Match"] == '"3"'
+    assert not client.cache.get_entry("repo:owner/repo").is_expired()
+    client.close()